@@ -7,20 +7,43 @@
 import concurrent.futures
 import logging
 from pathlib import Path
-from typing import List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, List, Optional, Tuple, Union
 
 from spotdl._version import __version__
 from spotdl.console import console_entry_point
-from spotdl.download.downloader import Downloader
 from spotdl.types.options import DownloaderOptionalOptions, DownloaderOptions
 from spotdl.types.song import Song
-from spotdl.utils.search import parse_query
+from spotdl.utils.lazy import import_object
 from spotdl.utils.spotify import SpotifyClient
 
+if TYPE_CHECKING:
+    from spotdl.download.downloader import Downloader
+    from spotdl.utils.search import parse_query
+
 __all__ = ["Spotdl", "console_entry_point", "__version__"]
 
 logger = logging.getLogger(__name__)
 
+# Kept importable from the package, but only imported on first access
+_LAZY_ATTRIBUTES = {
+    "Downloader": "spotdl.download.downloader:Downloader",
+    "parse_query": "spotdl.utils.search:parse_query",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import the downloader and the search helpers on first access.
+    """
+
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = import_object(_LAZY_ATTRIBUTES[name])
+    globals()[name] = value
+
+    return value
+
 
 class Spotdl:
     """
@@ -79,7 +102,11 @@ def __init__(
             headless=headless,
         )
 
-        # Initialize downloader
+        # Initialize downloader, it's imported here
+        # so importing spotdl doesn't import all of its dependencies
+        # pylint: disable=import-outside-toplevel
+        from spotdl.download.downloader import Downloader
+
         self.downloader = Downloader(
             settings=downloader_settings,
             loop=loop,
@@ -99,6 +126,9 @@ def search(self, query: List[str]) -> List[Song]:
         - query can be a list of song titles, urls, uris
         """
 
+        # pylint: disable=import-outside-toplevel
+        from spotdl.utils.search import parse_query
+
         return parse_query(
             query=query,
             threads=self.downloader.settings["threads"],
@@ -166,3 +196,11 @@ def download_songs(self, songs: List[Song]) -> List[Tuple[Song, Optional[Path]]]
         """
 
         return self.downloader.download_multiple_songs(songs)
+
+    def close(self) -> None:
+        """
+        Close the downloader, releasing its files, databases and workers.
+        The Spotdl object can't be used to download songs after it's closed.
+        """
+
+        self.downloader.close()
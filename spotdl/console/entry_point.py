@@ -8,31 +8,30 @@
 import signal
 import sys
 import time
+from typing import Callable
 
-from spotdl.console.download import download
-from spotdl.console.meta import meta
-from spotdl.console.save import save
-from spotdl.console.sync import sync
-from spotdl.console.url import url
-from spotdl.console.web import web
-from spotdl.download.downloader import Downloader, DownloaderError
 from spotdl.utils.arguments import parse_arguments
 from spotdl.utils.config import create_settings
 from spotdl.utils.console import ACTIONS, generate_initial_config, is_executable
 from spotdl.utils.downloader import check_ytmusic_connection
 from spotdl.utils.ffmpeg import FFmpegError, download_ffmpeg, is_ffmpeg_installed
+from spotdl.utils.lazy import LazyRegistry
 from spotdl.utils.logging import init_logging
-from spotdl.utils.spotify import SpotifyClient, SpotifyError, save_spotify_cache
+from spotdl.utils.spotify import SpotifyClient, SpotifyError
 
 __all__ = ["console_entry_point", "OPERATIONS"]
 
-OPERATIONS = {
-    "download": download,
-    "sync": sync,
-    "save": save,
-    "meta": meta,
-    "url": url,
-}
+# Operations (and the downloader) are imported after the arguments are parsed,
+# so `--help`, `--version` and the actions don't have to import them
+OPERATIONS: LazyRegistry[Callable[..., None]] = LazyRegistry(
+    {
+        "download": "spotdl.console.download:download",
+        "sync": "spotdl.console.sync:sync",
+        "save": "spotdl.console.save:save",
+        "meta": "spotdl.console.meta:meta",
+        "url": "spotdl.console.url:url",
+    }
+)
 
 logger = logging.getLogger(__name__)
 
@@ -82,6 +81,9 @@ def entry_point():
 
     init_logging(downloader_settings["log_level"], downloader_settings["log_format"])
 
+    # pylint: disable=import-outside-toplevel
+    from spotdl.download.downloader import Downloader, DownloaderError
+
     # If the application is frozen, we check for ffmpeg
     # if it's not present download it create config file
     if is_executable():
@@ -105,7 +107,6 @@ def entry_point():
 
     # Initialize spotify client
     SpotifyClient.init(**spotify_settings)
-    spotify_client = SpotifyClient()
 
     # If the application is frozen start web ui
     # or if the operation is `web`
@@ -115,7 +116,9 @@ def entry_point():
         if is_executable():
             web_settings["web_use_output_dir"] = True
 
-        # Start web ui
+        # Start web ui, fastapi and uvicorn are only imported for it
+        from spotdl.console.web import web  # pylint: disable=import-outside-toplevel
+
         web(web_settings, downloader_settings)
 
         return None
@@ -143,10 +146,8 @@ def entry_point():
     downloader = Downloader(downloader_settings)
 
     def graceful_exit(_signal, _frame):
-        if spotify_settings["use_cache_file"]:
-            save_spotify_cache(spotify_client.cache)
-
         downloader.progress_handler.close()
+        downloader.close()
         sys.exit(0)
 
     signal.signal(signal.SIGINT, graceful_exit)
@@ -174,6 +175,7 @@ def graceful_exit(_signal, _frame):
         logger.debug("Took %d seconds", end_time - start_time)
 
         downloader.progress_handler.close()
+        downloader.close()
         logger.exception("An error occurred")
 
         sys.exit(1)
@@ -181,9 +183,7 @@ def graceful_exit(_signal, _frame):
     end_time = time.perf_counter()
     logger.debug("Took %d seconds", end_time - start_time)
 
-    if spotify_settings["use_cache_file"]:
-        save_spotify_cache(spotify_client.cache)
-
     downloader.progress_handler.close()
+    downloader.close()
 
     return None
@@ -79,7 +79,7 @@ def process_file(file: Path):
                         artist=song_meta["artist"],
                     )
 
-                    generate_lrc(song, file)
+                    generate_lrc(song, file, downloader.lyrics_cache)
                     if lrc_file.exists():
                         logger.info("Saved lrc file for %s", song.display_name)
                     else:
@@ -140,7 +140,7 @@ def process_file(file: Path):
                 logger.info("Lrc file already exists for %s", file.name)
                 return None
 
-            generate_lrc(song, file)
+            generate_lrc(song, file, downloader.lyrics_cache)
             if lrc_file.exists():
                 logger.info("Saved lrc file for %s", song.display_name)
             else:
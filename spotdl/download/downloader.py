@@ -6,44 +6,72 @@
 import datetime
 import json
 import logging
+import os
 import re
 import shutil
 import sys
-import traceback
 from argparse import Namespace
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Type, Union
-
-from yt_dlp.postprocessor.modify_chapters import ModifyChaptersPP
-from yt_dlp.postprocessor.sponsorblock import SponsorBlockPP
-
+from typing import Dict, List, Optional, Tuple, Union
+
+from spotdl.download.job import ASYNC_STAGES, PIPELINE_STAGES
+from spotdl.download.pipeline import (
+    DownloadPipeline,
+    find_lyrics,
+    get_album_match,
+    get_finished_songs,
+    match_albums,
+    merge_results,
+    race_providers,
+)
 from spotdl.download.progress_handler import ProgressHandler
-from spotdl.providers.audio import (
-    AudioProvider,
-    BandCamp,
-    Piped,
-    SoundCloud,
-    YouTube,
-    YouTubeMusic,
+from spotdl.download.stages import (  # pylint: disable=unused-import
+    SPONSOR_BLOCK_CATEGORIES,
+    DownloaderError,
+    create_job,
+    is_missing_metadata,
+    run_stage,
+    run_stage_async,
 )
-from spotdl.providers.lyrics import AzLyrics, Genius, LyricsProvider, MusixMatch, Synced
+from spotdl.providers import AUDIO_PROVIDERS, LYRICS_PROVIDERS
+from spotdl.providers.audio.base import AudioProvider
+from spotdl.providers.lyrics.base import LyricsProvider
 from spotdl.types.options import DownloaderOptionalOptions, DownloaderOptions
+from spotdl.types.result import Result
 from spotdl.types.song import Song
-from spotdl.utils.archive import Archive
+from spotdl.utils.archive import ArchiveFile
 from spotdl.utils.config import (
     DOWNLOADER_OPTIONS,
     GlobalConfig,
     create_settings_type,
-    get_errors_path,
-    get_temp_path,
+    get_library_index_path,
     modernize_settings,
 )
-from spotdl.utils.ffmpeg import FFmpegError, convert, get_ffmpeg_path
-from spotdl.utils.formatter import create_file_name
-from spotdl.utils.lrc import generate_lrc
+from spotdl.utils.cover_cache import reset_cover_cache
+from spotdl.utils.ffmpeg import get_ffmpeg_path
+from spotdl.utils.formatter import (
+    clear_new_slugs,
+    configure_caches,
+    get_new_slugs,
+    log_cache_stats,
+    warm_slug_cache,
+)
+from spotdl.utils.http import reset_session, run_sync
+from spotdl.utils.info_cache import get_info_cache
+from spotdl.utils.journal import JobJournal
+from spotdl.utils.library import LibraryIndex
+from spotdl.utils.lyrics_cache import LyricsCache
 from spotdl.utils.m3u import gen_m3u_files
-from spotdl.utils.metadata import MetadataError, embed_metadata
-from spotdl.utils.search import gather_known_songs, reinit_song, songs_from_albums
+from spotdl.utils.match_cache import CachedMatch, MatchCache
+from spotdl.utils.provider_pool import ProviderPool
+from spotdl.utils.search import (
+    gather_known_songs,
+    reinit_songs_by_index,
+    songs_from_albums,
+)
+from spotdl.utils.slug_cache import SlugCache
+from spotdl.utils.transcode import TranscodeService
 
 __all__ = [
     "AUDIO_PROVIDERS",
@@ -53,42 +81,9 @@
     "SPONSOR_BLOCK_CATEGORIES",
 ]
 
-AUDIO_PROVIDERS: Dict[str, Type[AudioProvider]] = {
-    "youtube": YouTube,
-    "youtube-music": YouTubeMusic,
-    "soundcloud": SoundCloud,
-    "bandcamp": BandCamp,
-    "piped": Piped,
-}
-
-LYRICS_PROVIDERS: Dict[str, Type[LyricsProvider]] = {
-    "genius": Genius,
-    "musixmatch": MusixMatch,
-    "azlyrics": AzLyrics,
-    "synced": Synced,
-}
-
-SPONSOR_BLOCK_CATEGORIES = {
-    "sponsor": "Sponsor",
-    "intro": "Intermission/Intro Animation",
-    "outro": "Endcards/Credits",
-    "selfpromo": "Unpaid/Self Promotion",
-    "preview": "Preview/Recap",
-    "filler": "Filler Tangent",
-    "interaction": "Interaction Reminder",
-    "music_offtopic": "Non-Music Section",
-}
-
-
 logger = logging.getLogger(__name__)
 
 
-class DownloaderError(Exception):
-    """
-    Base class for all exceptions related to downloaders.
-    """
-
-
 class Downloader:
     """
     Downloader class, this is where all the downloading pre/post processing happens etc.
@@ -146,6 +141,59 @@ def __init__(
 
         logger.debug("FFmpeg path: %s", self.ffmpeg)
 
+        # All conversions share one pool of ffmpeg workers, without the pipeline
+        # it's sized like the download threads, so at most one ffmpeg process
+        # runs per download thread as before
+        transcode_threads = self.settings["transcode_threads"]
+        if not transcode_threads:
+            transcode_threads = (
+                os.cpu_count() or 1
+                if self.settings["pipeline"]
+                else self.settings["threads"]
+            )
+
+        self.transcode_service = TranscodeService(
+            self.ffmpeg, workers=transcode_threads
+        )
+
+        # Download-side audio providers are reused between songs
+        self.provider_pool = ProviderPool(
+            self.create_audio_downloader, max_size=self.settings["threads"]
+        )
+
+        # Initialize proxy server
+        proxy = self.settings["proxy"]
+        proxies = None
+        if proxy:
+            if not re.match(
+                pattern=r"^(http|https):\/\/(?:(\w+)(?::(\w+))?@)?((?:\d{1,3})(?:\.\d{1,3}){3})(?::(\d{1,5}))?$",  # pylint: disable=C0301
+                string=proxy,
+            ):
+                raise DownloaderError(f"Invalid proxy server: {proxy}")
+            proxies = {"http": proxy, "https": proxy}
+            logger.info("Setting proxy server: %s", proxy)
+
+        GlobalConfig.set_parameter("proxies", proxies)
+
+        # Keep enough connections open for every worker thread,
+        # the shared session is recreated with the new settings on first use
+        GlobalConfig.set_parameter(
+            "http_pool_size",
+            max(self.settings["threads"], self.settings["search_threads"] or 0),
+        )
+        GlobalConfig.set_parameter("http_retries", self.settings["http_retries"])
+        reset_session()
+
+        # Covers are resized with the same ffmpeg that is used for conversion
+        GlobalConfig.set_parameter("ffmpeg", self.ffmpeg)
+        GlobalConfig.set_parameter("cover_size", self.settings["cover_size"])
+        cover_cache_size = self.settings["cover_cache_size"]
+        GlobalConfig.set_parameter(
+            "cover_cache_size",
+            cover_cache_size * 1024 * 1024 if cover_cache_size else None,
+        )
+        reset_cover_cache()
+
         self.loop = loop or (
             asyncio.new_event_loop()
             if sys.platform != "win32"
@@ -163,12 +211,18 @@ def __init__(
         # Gather already present songs
         self.scan_formats = self.settings["detect_formats"] or [self.settings["format"]]
         self.known_songs: Dict[str, List[Path]] = {}
+        self.library_index: Optional[LibraryIndex] = None
         if self.settings["scan_for_songs"]:
             logger.info("Scanning for known songs, this might take a while...")
+
+            # Only files that changed since the last scan have to be read
+            self.library_index = LibraryIndex(get_library_index_path())
             for scan_format in self.scan_formats:
                 logger.debug("Scanning for %s files", scan_format)
 
-                found_files = gather_known_songs(self.settings["output"], scan_format)
+                found_files = gather_known_songs(
+                    self.settings["output"], scan_format, self.library_index
+                )
 
                 logger.debug("Found %s %s files", len(found_files), scan_format)
 
@@ -191,10 +245,16 @@ def __init__(
                 access_token = self.settings.get("genius_token")
                 if not access_token:
                     raise DownloaderError("Genius token not found in settings")
-                self.lyrics_providers.append(Genius(access_token))
+                self.lyrics_providers.append(lyrics_class(access_token))  # type: ignore
             else:
                 self.lyrics_providers.append(lyrics_class())
 
+        # Lyrics are searched for in the background while the songs are downloaded
+        self.lyrics_executor = ThreadPoolExecutor(
+            max_workers=self.settings["search_threads"] or self.settings["threads"],
+            thread_name_prefix="spotdl-lyrics",
+        )
+
         # Initialize audio providers
         self.audio_providers: List[AudioProvider] = []
         for audio_provider in self.settings["audio_providers"]:
@@ -209,32 +269,65 @@ def __init__(
                     search_query=self.settings["search_query"],
                     filter_results=self.settings["filter_results"],
                     yt_dlp_args=self.settings["yt_dlp_args"],
+                    adaptive_search=self.settings["adaptive_search"],
                 )
             )
 
         # Initialize list of errors
         self.errors: List[str] = []
 
-        # Initialize proxy server
-        proxy = self.settings["proxy"]
-        proxies = None
-        if proxy:
-            if not re.match(
-                pattern=r"^(http|https):\/\/(?:(\w+)(?::(\w+))?@)?((?:\d{1,3})(?:\.\d{1,3}){3})(?::(\d{1,5}))?$",  # pylint: disable=C0301
-                string=proxy,
-            ):
-                raise DownloaderError(f"Invalid proxy server: {proxy}")
-            proxies = {"http": proxy, "https": proxy}
-            logger.info("Setting proxy server: %s", proxy)
+        # Albums are matched in the background, the searches wait for
+        # the album of their song, the futures are keyed by the song url
+        self.album_matches: Dict[str, Future] = {}
+        self.album_executor = ThreadPoolExecutor(
+            max_workers=self.settings["search_threads"] or self.settings["threads"],
+            thread_name_prefix="spotdl-albums",
+        )
 
-        GlobalConfig.set_parameter("proxies", proxies)
+        # Initialize archive, finished songs are added to it right away
+        self.url_archive = ArchiveFile(self.settings["archive"])
+        logger.debug("Archive: %d urls", len(self.url_archive))
 
-        # Initialize archive
-        self.url_archive = Archive()
-        if self.settings["archive"]:
-            self.url_archive.load(self.settings["archive"])
+        # Initialize job journal, resuming the journal of an interrupted run
+        self.journal: Optional[JobJournal] = None
+        journal_path = self.settings["resume"] or self.settings["journal"]
+        if journal_path:
+            self.journal = JobJournal(
+                journal_path, resume=bool(self.settings["resume"])
+            )
 
-        logger.debug("Archive: %d urls", len(self.url_archive))
+            logger.debug("Journal: %d songs", len(self.journal))
+
+        # Initialize match cache, matches found with a custom
+        # search query are not reusable so the cache is not used then
+        self.match_cache: Optional[MatchCache] = None
+        if self.settings["match_cache"] and not self.settings["search_query"]:
+            self.match_cache = MatchCache(
+                self.settings["match_cache"], self.settings["match_cache_ttl"]
+            )
+
+            logger.debug("Match cache: %d matches", len(self.match_cache))
+
+        # Matching caches are sized before any song is matched
+        configure_caches(
+            self.settings["slugify_cache_size"], self.settings["ratio_cache_size"]
+        )
+
+        self.slug_cache: Optional[SlugCache] = None
+        if self.settings["slug_cache"]:
+            self.slug_cache = SlugCache(self.settings["slug_cache"])
+            warm_slug_cache(self.slug_cache.load())
+
+            logger.debug("Slug cache: %d slugs", len(self.slug_cache))
+
+        # Initialize lyrics cache
+        self.lyrics_cache: Optional[LyricsCache] = None
+        if self.settings["lyrics_cache"]:
+            self.lyrics_cache = LyricsCache(self.settings["lyrics_cache"])
+
+            logger.debug("Lyrics cache: %d entries", len(self.lyrics_cache))
+
+        self.closed = False
 
         logger.debug("Downloader initialized")
 
@@ -283,19 +376,60 @@ def download_multiple_songs(
 
             songs = list(return_obj.values())
 
+        # Reinitialize all of the songs that are missing metadata at once,
+        # so spotify metadata can be requested in batches
+        incomplete_songs = [
+            index for index, song in enumerate(songs) if is_missing_metadata(song)
+        ]
+        if incomplete_songs:
+            logger.debug("Fetching metadata for %d songs", len(incomplete_songs))
+            new_songs = reinit_songs_by_index(
+                [songs[index] for index in incomplete_songs], self.settings["threads"]
+            )
+
+            # Songs are matched by position, name-only songs have no url yet
+            updated_songs = {
+                incomplete_songs[position]: song for position, song in new_songs.items()
+            }
+            songs = [updated_songs.get(index, song) for index, song in enumerate(songs)]
+
         logger.debug("Downloading %d songs", len(songs))
 
         if self.settings["archive"]:
+            # Pick up the songs downloaded by other processes in the meantime
+            self.url_archive.refresh()
             songs = [song for song in songs if song.url not in self.url_archive]
             logger.debug("Filtered %d songs with archive", len(songs))
 
-        self.progress_handler.set_song_count(len(songs))
+        # Songs that were finished in the interrupted run are not downloaded again
+        journal_results = get_finished_songs(self, songs)
+        pending_songs = [
+            song for song in songs if JobJournal.get_key(song) not in journal_results
+        ]
+
+        if self.settings["album_matching"]:
+            match_albums(self, pending_songs)
+
+        self.progress_handler.set_song_count(len(pending_songs))
+
+        if self.settings["pipeline"]:
+            # Run every download stage on its own worker pool
+            results = self.loop.run_until_complete(
+                DownloadPipeline(self).run(pending_songs)
+            )
+        else:
+            # Create tasks list
+            tasks = [self.pool_download(song) for song in pending_songs]
+
+            # Call all task asynchronously, and wait until all are finished
+            results = list(self.loop.run_until_complete(asyncio.gather(*tasks)))
 
-        # Create tasks list
-        tasks = [self.pool_download(song) for song in songs]
+        # Songs that failed before they were searched leave their album match behind
+        self.album_matches.clear()
 
-        # Call all task asynchronously, and wait until all are finished
-        results = list(self.loop.run_until_complete(asyncio.gather(*tasks)))
+        # Put the finished songs back in their place, so the archive
+        # and the m3u files contain every song of the journal
+        results = merge_results(songs, results, journal_results)
 
         # Print errors
         if self.settings["print_errors"]:
@@ -315,19 +449,27 @@ def download_multiple_songs(
 
             logger.info("Saved errors to %s", self.settings["save_errors"])
 
-        # Save archive
+        # Save archive, the downloaded songs were already added to it,
+        # this adds the songs that were finished in a resumed run
         if self.settings["archive"]:
-            for result in results:
-                if result[1] or self.settings["add_unavailable"]:
-                    self.url_archive.add(result[0].url)
+            self.url_archive.add_many(
+                [
+                    song.url
+                    for song, path in results
+                    if song.url and (path or self.settings["add_unavailable"])
+                ]
+            )
 
-            self.url_archive.save(self.settings["archive"])
+            self.url_archive.flush()
             logger.info(
                 "Saved archive with %d urls to %s",
                 len(self.url_archive),
                 self.settings["archive"],
             )
 
+        if self.journal is not None:
+            self.journal.flush()
+
         # Create m3u playlist
         if self.settings["m3u"]:
             song_list = [
@@ -346,6 +488,22 @@ def download_multiple_songs(
                 self.settings["detect_formats"],
             )
 
+        log_cache_stats()
+        logger.debug("Transcode stats: %s", self.transcode_service.get_stats())
+        logger.debug("Audio provider pool stats: %s", self.provider_pool.get_stats())
+        logger.debug("Info cache stats: %s", get_info_cache().get_stats())
+        for audio_provider in self.audio_providers:
+            if audio_provider.search_depths:
+                logger.debug(
+                    "Search depths of %s: %s",
+                    audio_provider.name,
+                    dict(sorted(audio_provider.search_depths.items())),
+                )
+        if self.slug_cache is not None:
+            new_slugs = get_new_slugs()
+            self.slug_cache.save(new_slugs)
+            clear_new_slugs(new_slugs)
+
         # Save results to a file
         if self.settings["save_file"]:
             with open(self.settings["save_file"], "w", encoding="utf-8") as save_file:
@@ -366,13 +524,25 @@ async def pool_download(self, song: Song) -> Tuple[Song, Optional[Path]]:
         - tuple with the song and the path to the downloaded file if successful.
 
         ### Notes
-        - This method calls `self.search_and_download` in a new thread.
+        - The search stage runs on the event loop, the other stages
+        are run one after another in the default executor.
         """
 
         # tasks that cannot acquire semaphore will wait here until it's free
         # only certain amount of tasks can acquire the semaphore at the same time
         async with self.semaphore:
-            return await self.loop.run_in_executor(None, self.search_and_download, song)
+            job = create_job(self, song)
+            for stage in PIPELINE_STAGES:
+                if stage in ASYNC_STAGES:
+                    # No thread and event loop are created for the search
+                    await run_stage_async(self, job, stage)
+                else:
+                    await self.loop.run_in_executor(None, run_stage, self, job, stage)
+
+                if job.finished:
+                    break
+
+            return job.result
 
     def search(self, song: Song) -> str:
         """
@@ -385,479 +555,202 @@ def search(self, song: Song) -> str:
         - tuple with download url and audio provider if successful.
         """
 
-        for audio_provider in self.audio_providers:
-            url = audio_provider.search(song, self.settings["only_verified_results"])
-            if url:
-                return url
-
-            logger.debug("%s failed to find %s", audio_provider.name, song.display_name)
-
-        raise LookupError(f"No results found for song: {song.display_name}")
+        return run_sync(self.search_async(song))
 
-    def search_lyrics(self, song: Song) -> Optional[str]:
+    async def search_async(self, song: Song) -> str:
         """
-        Search for lyrics using all available providers.
+        Search for a song using all available providers, asynchronously.
 
         ### Arguments
         - song: The song to search for.
 
         ### Returns
-        - lyrics if successful else None.
+        - The download url if successful.
         """
 
-        for lyrics_provider in self.lyrics_providers:
-            lyrics = lyrics_provider.get_lyrics(song.name, song.artists)
-            if lyrics:
-                logger.debug(
-                    "Found lyrics for %s on %s", song.display_name, lyrics_provider.name
-                )
-
-                return lyrics
-
+        only_verified = self.settings["only_verified_results"]
+        cached_match = self.get_cached_match(song)
+        if cached_match is not None:
             logger.debug(
-                "%s failed to find lyrics for %s",
-                lyrics_provider.name,
+                "Found cached match for %s: %s (%s)",
                 song.display_name,
+                cached_match.url,
+                cached_match.provider,
             )
 
-        return None
-
-    def search_and_download(  # pylint: disable=R0911
-        self, song: Song
-    ) -> Tuple[Song, Optional[Path]]:
-        """
-        Search for the song and download it.
-
-        ### Arguments
-        - song: The song to download.
+            return cached_match.url
 
-        ### Returns
-        - tuple with the song and the path to the downloaded file if successful.
-
-        ### Notes
-        - This function is synchronous.
-        """
-
-        # Check if song has name/artist and url/song_id
-        if not (song.name and (song.artists or song.artist)) and not (
-            song.url or song.song_id
-        ):
-            logger.error("Song is missing required fields: %s", song.display_name)
-            self.errors.append(f"Song is missing required fields: {song.display_name}")
-            return song, None
-
-        # Reinitialize the song object if it's missing metadata
-        # Or if we are fetching albums
-        if (
-            (song.name is None and song.url)
-            or self.settings["fetch_albums"]
-            or any(
-                x is None
-                for x in [
-                    song.genres,
-                    song.disc_count,
-                    song.tracks_count,
-                    song.track_number,
-                    song.album_id,
-                    song.album_artist,
-                ]
+        album_match = await get_album_match(self, song)
+        if album_match is not None:
+            logger.debug(
+                "Found album match for %s: %s", song.display_name, album_match[0].url
             )
-        ):
-            song = reinit_song(song)
-
-        # Create the output file path
-        output_file = create_file_name(
-            song=song,
-            template=self.settings["output"],
-            file_extension=self.settings["format"],
-            restrict=self.settings["restrict"],
-            file_name_length=self.settings["max_filename_length"],
-        )
-
-        if song.explicit is True and self.settings["skip_explicit"] is True:
-            logger.info("Skipping explicit song: %s", song.display_name)
-            return song, None
-
-        # Initialize the progress tracker
-        display_progress_tracker = self.progress_handler.get_new_tracker(song)
-
-        try:
-            # Create the temp folder path
-            temp_folder = get_temp_path()
-
-            # Check if there is an already existing song file, with the same spotify URL in its
-            # metadata, but saved under a different name. If so, save its path.
-            dup_song_paths: List[Path] = self.known_songs.get(song.url, [])
-
-            # Remove files from the list that have the same path as the output file
-            dup_song_paths = [
-                dup_song_path
-                for dup_song_path in dup_song_paths
-                if (dup_song_path.absolute() != output_file.absolute())
-                and dup_song_path.exists()
-            ]
-
-            # Checking if file already exists in all subfolders of output directory
-            file_exists = output_file.exists() or dup_song_paths
-            if not self.settings["scan_for_songs"]:
-                for file_extension in self.scan_formats:
-                    ext_path = output_file.with_suffix(f".{file_extension}")
-                    if ext_path.exists():
-                        dup_song_paths.append(ext_path)
-
-            if dup_song_paths:
-                logger.debug(
-                    "Found duplicate songs for %s at %s",
-                    song.display_name,
-                    ", ".join(
-                        [f"'{str(dup_song_path)}'" for dup_song_path in dup_song_paths]
-                    ),
-                )
 
-            # If the file already exists and we don't want to overwrite it,
-            # we can skip the download
-            if (  # pylint: disable=R1705
-                Path(str(output_file.absolute()) + ".skip").exists()
-                and self.settings["respect_skip_file"]
-            ):
-                logger.info(
-                    "Skipping %s (skip file found) %s",
-                    song.display_name,
-                    "",
+            match: Optional[Tuple[Result, float, AudioProvider]] = album_match
+        elif self.settings["race_providers"] and len(self.audio_providers) > 1:
+            match = await race_providers(self, song, only_verified)
+        else:
+            match = None
+            for audio_provider in self.audio_providers:
+                provider_match = await audio_provider.find_match_async(
+                    song, only_verified
                 )
+                if provider_match:
+                    match = (*provider_match, audio_provider)
+                    break
 
-                return song, output_file if output_file.exists() else None
-
-            elif file_exists and self.settings["overwrite"] == "skip":
-                logger.info(
-                    "Skipping %s (file already exists) %s",
-                    song.display_name,
-                    "(duplicate)" if dup_song_paths else "",
+                logger.debug(
+                    "%s failed to find %s", audio_provider.name, song.display_name
                 )
 
-                display_progress_tracker.notify_download_skip()
-                return song, output_file
+        if match is None:
+            raise LookupError(f"No results found for song: {song.display_name}")
 
-            # Don't skip if the file exists and overwrite is set to force
-            if file_exists and self.settings["overwrite"] == "force":
-                logger.info(
-                    "Overwriting %s %s",
-                    song.display_name,
-                    " (duplicate)" if dup_song_paths else "",
-                )
+        result, score, audio_provider = match
+        if self.match_cache is not None:
+            self.match_cache.set(
+                song, result.url, score, audio_provider.name, result.verified
+            )
 
-                # If the duplicate song path is not None, we can delete the old file
-                for dup_song_path in dup_song_paths:
-                    try:
-                        logger.info("Removing duplicate file: %s", dup_song_path)
-
-                        dup_song_path.unlink()
-                    except (PermissionError, OSError, Exception) as exc:
-                        logger.debug(
-                            "Could not remove duplicate file: %s, error: %s",
-                            dup_song_path,
-                            exc,
-                        )
-
-            # Find song lyrics and add them to the song object
-            try:
-                lyrics = self.search_lyrics(song)
-                if lyrics is None:
-                    logger.debug(
-                        "No lyrics found for %s, lyrics providers: %s",
-                        song.display_name,
-                        ", ".join(
-                            [lprovider.name for lprovider in self.lyrics_providers]
-                        ),
-                    )
-                else:
-                    song.lyrics = lyrics
-            except Exception as exc:
-                logger.debug("Could not search for lyrics: %s", exc)
-
-            # If the file already exists and we want to overwrite the metadata,
-            # we can skip the download
-            if file_exists and self.settings["overwrite"] == "metadata":
-                most_recent_duplicate: Optional[Path] = None
-                if dup_song_paths:
-                    # Get the most recent duplicate song path and remove the rest
-                    most_recent_duplicate = max(
-                        dup_song_paths,
-                        key=lambda dup_song_path: dup_song_path.stat().st_mtime
-                        and dup_song_path.suffix == output_file.suffix,
-                    )
+        return result.url
 
-                    # Remove the rest of the duplicate song paths
-                    for old_song_path in dup_song_paths:
-                        if most_recent_duplicate == old_song_path:
-                            continue
-
-                        try:
-                            logger.info("Removing duplicate file: %s", old_song_path)
-                            old_song_path.unlink()
-                        except (PermissionError, OSError) as exc:
-                            logger.debug(
-                                "Could not remove duplicate file: %s, error: %s",
-                                old_song_path,
-                                exc,
-                            )
-
-                    # Move the old file to the new location
-                    if (
-                        most_recent_duplicate
-                        and most_recent_duplicate.suffix == output_file.suffix
-                    ):
-                        most_recent_duplicate.replace(
-                            output_file.with_suffix(f".{self.settings['format']}")
-                        )
-
-                if (
-                    most_recent_duplicate
-                    and most_recent_duplicate.suffix != output_file.suffix
-                ):
-                    logger.info(
-                        "Could not move duplicate file: %s, different file extension",
-                        most_recent_duplicate,
-                    )
+    def get_cached_match(self, song: Song) -> Optional[CachedMatch]:
+        """
+        Get the match of the song from the match cache.
 
-                    display_progress_tracker.notify_complete()
+        ### Arguments
+        - song: The song to get the match for.
 
-                    return song, None
+        ### Returns
+        - The cached match or None if the match cache is disabled or has no match.
+        """
 
-                # Update the metadata
-                embed_metadata(
-                    output_file=output_file,
-                    song=song,
-                    skip_album_art=self.settings["skip_album_art"],
-                )
+        if self.match_cache is None:
+            return None
 
-                logger.info(
-                    f"Updated metadata for {song.display_name}"
-                    f", moved to new location: {output_file}"
-                    if most_recent_duplicate
-                    else ""
-                )
+        return self.match_cache.get(
+            song,
+            [audio_provider.name for audio_provider in self.audio_providers],
+            self.settings["only_verified_results"],
+        )
 
-                display_progress_tracker.notify_complete()
+    def search_lyrics(self, song: Song) -> Optional[str]:
+        """
+        Search for lyrics using all available providers.
 
-                return song, output_file
+        ### Arguments
+        - song: The song to search for.
 
-            # Create the output directory if it doesn't exist
-            output_file.parent.mkdir(parents=True, exist_ok=True)
-            if song.download_url is None:
-                download_url = self.search(song)
-            else:
-                download_url = song.download_url
+        ### Returns
+        - lyrics if successful else None.
+        """
 
-            # Initialize audio downloader
-            audio_downloader: Union[AudioProvider, Piped]
-            if self.settings["audio_providers"][0] == "piped":
-                audio_downloader = Piped(
-                    output_format=self.settings["format"],
-                    cookie_file=self.settings["cookie_file"],
-                    search_query=self.settings["search_query"],
-                    filter_results=self.settings["filter_results"],
-                    yt_dlp_args=self.settings["yt_dlp_args"],
-                )
-            else:
-                audio_downloader = AudioProvider(
-                    output_format=self.settings["format"],
-                    cookie_file=self.settings["cookie_file"],
-                    search_query=self.settings["search_query"],
-                    filter_results=self.settings["filter_results"],
-                    yt_dlp_args=self.settings["yt_dlp_args"],
-                )
+        return run_sync(self.search_lyrics_async(song))
 
-            logger.debug("Downloading %s using %s", song.display_name, download_url)
+    async def search_lyrics_async(self, song: Song) -> Optional[str]:
+        """
+        Search for lyrics using all available providers, asynchronously.
 
-            # Add progress hook to the audio provider
-            audio_downloader.audio_handler.add_progress_hook(
-                display_progress_tracker.yt_dlp_progress_hook
-            )
+        ### Arguments
+        - song: The song to search for.
 
-            download_info = audio_downloader.get_download_metadata(
-                download_url, download=True
-            )
+        ### Returns
+        - lyrics if successful else None.
 
-            temp_file = Path(
-                temp_folder / f"{download_info['id']}.{download_info['ext']}"
-            )
+        ### Notes
+        - The lyrics cache is checked first if it's enabled.
+        - Songs are only cached as having no lyrics if every provider answered.
+        """
 
-            if download_info is None:
+        provider_names = [lprovider.name for lprovider in self.lyrics_providers]
+        if self.lyrics_cache is not None:
+            cached_lyrics = self.lyrics_cache.get(song, provider_names)
+            if cached_lyrics is not None:
                 logger.debug(
-                    "No download info found for %s, url: %s",
+                    "Found cached lyrics for %s (%s)",
                     song.display_name,
-                    download_url,
-                )
-
-                raise DownloaderError(
-                    f"yt-dlp failed to get metadata for: {song.name} - {song.artist}"
-                )
-
-            display_progress_tracker.notify_download_complete()
-
-            # Copy the downloaded file to the output file
-            # if the temp file and output file have the same extension
-            # and the bitrate is set to auto or disable
-            # Don't copy if the audio provider is piped
-            # unless the bitrate is set to disable
-            if (
-                self.settings["bitrate"] in ["auto", "disable", None]
-                and temp_file.suffix == output_file.suffix
-            ) and not (
-                self.settings["audio_providers"][0] == "piped"
-                and self.settings["bitrate"] != "disable"
-            ):
-                shutil.move(str(temp_file), output_file)
-                success = True
-                result = None
-            else:
-                if self.settings["bitrate"] in ["auto", None]:
-                    # Use the bitrate from the download info if it exists
-                    # otherwise use `copy`
-                    bitrate = (
-                        f"{int(download_info['abr'])}k"
-                        if download_info.get("abr")
-                        else "128k"
-                    )
-                elif self.settings["bitrate"] == "disable":
-                    bitrate = None
-                else:
-                    bitrate = str(self.settings["bitrate"])
-
-                # Convert the downloaded file to the output format
-                success, result = convert(
-                    input_file=temp_file,
-                    output_file=output_file,
-                    ffmpeg=self.ffmpeg,
-                    output_format=self.settings["format"],
-                    bitrate=bitrate,
-                    ffmpeg_args=self.settings["ffmpeg_args"],
-                    progress_handler=display_progress_tracker.ffmpeg_progress_hook,
-                )
-
-                if self.settings["create_skip_file"]:
-                    with open(
-                        str(output_file) + ".skip", mode="w", encoding="utf-8"
-                    ) as _:
-                        pass
-
-            # Remove the temp file
-            if temp_file.exists():
-                try:
-                    temp_file.unlink()
-                except (PermissionError, OSError) as exc:
-                    logger.debug(
-                        "Could not remove temp file: %s, error: %s", temp_file, exc
-                    )
-
-                    raise DownloaderError(
-                        f"Could not remove temp file: {temp_file}, possible duplicate song"
-                    ) from exc
-
-            if not success and result:
-                # If the conversion failed and there is an error message
-                # create a file with the error message
-                # and save it in the errors directory
-                # raise an exception with file path
-                file_name = (
-                    get_errors_path()
-                    / f"ffmpeg_error_{datetime.datetime.now().strftime('%Y-%m-%d-%H-%M-%S')}.txt"
+                    cached_lyrics.provider,
                 )
 
-                error_message = ""
-                for key, value in result.items():
-                    error_message += f"### {key}:\n{str(value).strip()}\n\n"
+                return cached_lyrics.lyrics
 
-                with open(file_name, "w", encoding="utf-8") as error_path:
-                    error_path.write(error_message)
+        lyrics, provider = await find_lyrics(self, song)
+        if self.lyrics_cache is not None and provider:
+            self.lyrics_cache.set(song, lyrics, provider)
 
-                # Remove the file that failed to convert
-                if output_file.exists():
-                    output_file.unlink()
-
-                raise FFmpegError(
-                    f"Failed to convert {song.display_name}, "
-                    f"you can find error here: {str(file_name.absolute())}"
-                )
+        return lyrics
 
-            download_info["filepath"] = str(output_file)
+    def search_and_download(self, song: Song) -> Tuple[Song, Optional[Path]]:
+        """
+        Search for the song and download it.
 
-            # Set the song's download url
-            if song.download_url is None:
-                song.download_url = download_url
+        ### Arguments
+        - song: The song to download.
 
-            display_progress_tracker.notify_conversion_complete()
+        ### Returns
+        - tuple with the song and the path to the downloaded file if successful.
 
-            # SponsorBlock post processor
-            if self.settings["sponsor_block"]:
-                # Initialize the sponsorblock post processor
-                post_processor = SponsorBlockPP(
-                    audio_downloader.audio_handler, SPONSOR_BLOCK_CATEGORIES
-                )
+        ### Notes
+        - This function is synchronous.
+        - It runs all of the pipeline stages one after another.
+        """
 
-                # Run the post processor to get the sponsor segments
-                _, download_info = post_processor.run(download_info)
-                chapters = download_info["sponsorblock_chapters"]
+        job = create_job(self, song)
+        for stage in PIPELINE_STAGES:
+            run_stage(self, job, stage)
+            if job.finished:
+                break
 
-                # If there are sponsor segments, remove them
-                if len(chapters) > 0:
-                    logger.info(
-                        "Removing %s sponsor segments for %s",
-                        len(chapters),
-                        song.display_name,
-                    )
+        return job.result
 
-                    # Initialize the modify chapters post processor
-                    modify_chapters = ModifyChaptersPP(
-                        downloader=audio_downloader.audio_handler,
-                        remove_sponsor_segments=SPONSOR_BLOCK_CATEGORIES,
-                    )
+    def create_audio_downloader(self) -> AudioProvider:
+        """
+        Create the audio provider that is used to download the songs.
 
-                    # Run the post processor to remove the sponsor segments
-                    # this returns a list of files to delete
-                    files_to_delete, download_info = modify_chapters.run(download_info)
+        ### Returns
+        - A new audio provider configured with the downloader settings.
+        """
 
-                    # Delete the files that were created by the post processor
-                    for file_to_delete in files_to_delete:
-                        Path(file_to_delete).unlink()
+        audio_class = AudioProvider
+        if self.settings["audio_providers"][0] == "piped":
+            audio_class = AUDIO_PROVIDERS["piped"]
 
-            try:
-                embed_metadata(
-                    output_file,
-                    song,
-                    id3_separator=self.settings["id3_separator"],
-                    skip_album_art=self.settings["skip_album_art"],
-                )
-            except Exception as exception:
-                raise MetadataError(
-                    "Failed to embed metadata to the song"
-                ) from exception
+        return audio_class(
+            output_format=self.settings["format"],
+            cookie_file=self.settings["cookie_file"],
+            search_query=self.settings["search_query"],
+            filter_results=self.settings["filter_results"],
+            yt_dlp_args=self.settings["yt_dlp_args"],
+        )
 
-            if self.settings["generate_lrc"]:
-                generate_lrc(song, output_file)
+    def close(self) -> None:
+        """
+        Sync and close the files, databases and workers used by the downloader.
+        The downloader can't be used after it's closed, closing it again does nothing.
+        """
 
-            display_progress_tracker.notify_complete()
+        if self.closed:
+            return
 
-            # Add the song to the known songs
-            self.known_songs.get(song.url, []).append(output_file)
+        self.closed = True
 
-            logger.info('Downloaded "%s": %s', song.display_name, song.download_url)
+        # Running conversions and searches are finished first,
+        # queued searches are dropped
+        self.transcode_service.shutdown()
+        self.lyrics_executor.shutdown(wait=True, cancel_futures=True)
+        self.album_executor.shutdown(wait=True, cancel_futures=True)
 
-            return song, output_file
-        except (Exception, UnicodeEncodeError) as exception:
-            if isinstance(exception, UnicodeEncodeError):
-                exception_cause = exception
-                exception = DownloaderError(
-                    "You may need to add PYTHONIOENCODING=utf-8 to your environment"
-                )
+        self.url_archive.close()
+        if self.journal is not None:
+            self.journal.close()
 
-                exception.__cause__ = exception_cause
+        for store in [
+            self.match_cache,
+            self.slug_cache,
+            self.lyrics_cache,
+            self.library_index,
+        ]:
+            if store is not None:
+                store.close()
 
-            display_progress_tracker.notify_error(
-                traceback.format_exc(), exception, True
-            )
-            self.errors.append(
-                f"{song.url} - {exception.__class__.__name__}: {exception}"
-            )
-            return song, None
+        logger.debug("Downloader closed")
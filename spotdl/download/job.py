@@ -0,0 +1,85 @@
+"""
+Job module, holds the state of a single song while it moves through the download stages.
+"""
+
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from spotdl.types.song import Song
+
+if TYPE_CHECKING:
+    from spotdl.download.progress_handler import SongTracker
+
+__all__ = ["PIPELINE_STAGES", "ASYNC_STAGES", "DownloadJob"]
+
+# Order in which every song goes through the download process
+PIPELINE_STAGES = ["resolve", "search", "fetch", "transcode", "tag", "finalize"]
+
+# Stages that run as coroutines on the event loop instead of a worker pool
+ASYNC_STAGES = ["search"]
+
+
+@dataclass
+class DownloadJob:
+    """
+    Holds the state of a single song while it moves through the download stages.
+    """
+
+    song: Song
+    index: int = 0
+
+    # Last stage completed in an interrupted run, see `JobJournal`
+    resume_stage: Optional[str] = None
+
+    # Set by the resolve stage
+    output_file: Optional[Path] = None
+    tracker: Optional["SongTracker"] = None
+    file_exists: bool = False
+    dup_song_paths: List[Path] = field(default_factory=list)
+
+    # Set by the search stage
+    metadata_only: bool = False
+    download_url: Optional[str] = None
+    lyrics_future: Optional["Future[Optional[str]]"] = None
+
+    # Set by the fetch stage
+    download_info: Optional[Dict[str, Any]] = None
+    temp_file: Optional[Path] = None
+    stream_url: Optional[str] = None
+
+    # Set by the transcode stage, one of "move", "copy" or "transcode"
+    transcode_mode: Optional[str] = None
+
+    # Final state of the job
+    stage: Optional[str] = None
+    finished: bool = False
+    path: Optional[Path] = None
+    error: Optional[str] = None
+
+    def finish(self, path: Optional[Path] = None) -> None:
+        """
+        Mark the job as finished, remaining stages will be skipped.
+
+        ### Arguments
+        - path: The path to the downloaded file if successful.
+        """
+
+        self.finished = True
+        self.path = path
+
+        # Lyrics that haven't been searched for yet are not needed anymore
+        if self.lyrics_future is not None:
+            self.lyrics_future.cancel()
+
+    @property
+    def result(self) -> Tuple[Song, Optional[Path]]:
+        """
+        Get the result of the job.
+
+        ### Returns
+        - tuple with the song and the path to the downloaded file if successful.
+        """
+
+        return self.song, self.path
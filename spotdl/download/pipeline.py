@@ -0,0 +1,475 @@
+"""
+Pipeline module, splits the download process into separate stages
+that run on their own worker pools and are connected by bounded queues.
+It also holds the glue shared by the pipeline and the sequential downloads:
+resuming from the journal, album matching and racing the providers.
+
+```python
+downloader = Downloader({"pipeline": True, "search_threads": 32})
+results = downloader.download_multiple_songs(songs)
+```
+"""
+
+import asyncio
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from spotdl.download.job import ASYNC_STAGES, PIPELINE_STAGES, DownloadJob
+from spotdl.download.stages import create_job, run_stage, run_stage_async
+from spotdl.providers.audio.base import VERIFIED_MIN_SCORE, AudioProvider
+from spotdl.types.result import Result
+from spotdl.types.song import Song
+from spotdl.utils.journal import JobJournal
+
+if TYPE_CHECKING:
+    from spotdl.download.downloader import Downloader
+
+__all__ = [
+    "PIPELINE_STAGES",
+    "ASYNC_STAGES",
+    "DownloadJob",
+    "DownloadPipeline",
+    "get_finished_songs",
+    "merge_results",
+    "match_albums",
+    "get_album_match",
+    "race_providers",
+    "find_lyrics",
+]
+
+logger = logging.getLogger(__name__)
+
+
+class DownloadPipeline:
+    """
+    Runs the download stages concurrently, each stage has its own worker pool,
+    so cpu bound ffmpeg work doesn't compete with network bound searches and fetches.
+    """
+
+    def __init__(self, downloader: "Downloader"):
+        """
+        Initialize the pipeline.
+
+        ### Arguments
+        - downloader: The downloader that implements the stages.
+        """
+
+        self.downloader = downloader
+
+        settings = downloader.settings
+        threads = settings["threads"]
+        search_threads = settings["search_threads"] or threads
+        transcode_threads = settings["transcode_threads"] or os.cpu_count() or 1
+
+        self.workers: Dict[str, int] = {
+            "resolve": search_threads,
+            "search": search_threads,
+            "fetch": threads,
+            "transcode": transcode_threads,
+            "tag": threads,
+            "finalize": 1,
+        }
+
+        logger.debug("Pipeline workers: %s", self.workers)
+
+    async def run(self, songs: List[Song]) -> List[Tuple[Song, Optional[Path]]]:
+        """
+        Run all songs through the pipeline.
+
+        ### Arguments
+        - songs: The songs to download.
+
+        ### Returns
+        - list of tuples with the song and the path to the downloaded file if successful.
+        """
+
+        loop = asyncio.get_running_loop()
+        jobs = [
+            create_job(self.downloader, song, index) for index, song in enumerate(songs)
+        ]
+
+        # Queue in front of each stage, bounded so that fast stages
+        # can't run too far ahead of the slow ones
+        queues: Dict[str, asyncio.Queue] = {
+            stage: asyncio.Queue(maxsize=self.workers[stage] * 2)
+            for stage in PIPELINE_STAGES
+        }
+
+        executors = {
+            stage: ThreadPoolExecutor(
+                max_workers=self.workers[stage], thread_name_prefix=f"spotdl-{stage}"
+            )
+            for stage in PIPELINE_STAGES
+            if stage not in ASYNC_STAGES
+        }
+
+        async def worker(stage_index: int):
+            stage = PIPELINE_STAGES[stage_index]
+            queue = queues[stage]
+            while True:
+                job: Optional[DownloadJob] = await queue.get()
+                if job is None:
+                    queue.task_done()
+                    break
+
+                if stage in ASYNC_STAGES:
+                    # Searches mostly wait on the network, so they share the loop
+                    # and only the blocking http calls go to the http executor
+                    await run_stage_async(self.downloader, job, stage)
+                else:
+                    await loop.run_in_executor(
+                        executors[stage], run_stage, self.downloader, job, stage
+                    )
+
+                if not job.finished and stage_index + 1 < len(PIPELINE_STAGES):
+                    await queues[PIPELINE_STAGES[stage_index + 1]].put(job)
+
+                queue.task_done()
+
+        stage_workers = {
+            stage: [
+                asyncio.ensure_future(worker(stage_index))
+                for _ in range(self.workers[stage])
+            ]
+            for stage_index, stage in enumerate(PIPELINE_STAGES)
+        }
+
+        try:
+            for job in jobs:
+                await queues[PIPELINE_STAGES[0]].put(job)
+
+            # Shut down the stages one by one, a stage can only be closed
+            # once all of the stages before it have finished
+            for stage in PIPELINE_STAGES:
+                await queues[stage].join()
+                for _ in stage_workers[stage]:
+                    await queues[stage].put(None)
+
+                await asyncio.gather(*stage_workers[stage])
+        finally:
+            for executor in executors.values():
+                executor.shutdown(wait=False)
+
+        return [job.result for job in jobs]
+
+
+def get_finished_songs(
+    downloader: "Downloader", songs: List[Song]
+) -> Dict[str, Tuple[Song, Optional[Path]]]:
+    """
+    Get the songs that were finished by the interrupted run, from the journal.
+
+    ### Arguments
+    - downloader: The downloader that downloads the songs.
+    - songs: The songs to download.
+
+    ### Returns
+    - Dictionary of journal keys and the results of the finished songs,
+    empty if the downloader doesn't resume.
+    """
+
+    finished: Dict[str, Tuple[Song, Optional[Path]]] = {}
+    if downloader.journal is None or not downloader.settings["resume"]:
+        return finished
+
+    for song in songs:
+        entry = downloader.journal.get(song)
+        if entry is not None and entry.done:
+            finished[entry.key] = (song, entry.output_path)
+
+    logger.info("Resuming, %d songs already finished", len(finished))
+
+    return finished
+
+
+def merge_results(
+    songs: List[Song],
+    results: List[Tuple[Song, Optional[Path]]],
+    finished: Dict[str, Tuple[Song, Optional[Path]]],
+) -> List[Tuple[Song, Optional[Path]]]:
+    """
+    Put the results of the finished songs back in their place.
+
+    ### Arguments
+    - songs: All of the songs, in order.
+    - results: The results of the songs that were downloaded, in order.
+    - finished: The results of the finished songs, see `get_finished_songs`.
+
+    ### Returns
+    - list with the result of every song.
+    """
+
+    if not finished:
+        return results
+
+    downloaded = iter(results)
+
+    return [
+        finished.get(JobJournal.get_key(song)) or next(downloaded) for song in songs
+    ]
+
+
+def match_albums(downloader: "Downloader", songs: List[Song]) -> None:
+    """
+    Start matching the songs of every album against a single YouTube Music album,
+    the songs that are matched don't have to be searched one by one.
+
+    ### Arguments
+    - downloader: The downloader that downloads the songs.
+    - songs: The songs to match.
+
+    ### Notes
+    - Only albums with more than one song are matched.
+    - The YouTube Music provider has to be the first audio provider,
+    album matches would skip the providers before it.
+    - Songs that are in the match cache are skipped.
+    - The albums are matched in the background, `get_album_match`
+    waits for the album of the song.
+    """
+
+    audio_provider = (
+        downloader.audio_providers[0] if downloader.audio_providers else None
+    )
+    if audio_provider is None or not hasattr(audio_provider, "match_album"):
+        logger.debug(
+            "Album matching requires youtube-music to be the first audio provider"
+        )
+        return None
+
+    albums: Dict[str, List[Song]] = {}
+    for song in songs:
+        if (
+            song.album_id
+            and song.url
+            and song.download_url is None
+            and downloader.get_cached_match(song) is None
+        ):
+            albums.setdefault(song.album_id, []).append(song)
+
+    album_songs = [album for album in albums.values() if len(album) > 1]
+    if not album_songs:
+        return None
+
+    logger.debug("Matching %d albums", len(album_songs))
+
+    for album in album_songs:
+        future = downloader.album_executor.submit(
+            audio_provider.match_album, album  # type: ignore
+        )
+
+        for song in album:
+            downloader.album_matches[song.url] = future
+
+    return None
+
+
+async def get_album_match(
+    downloader: "Downloader", song: Song
+) -> Optional[Tuple[Result, float, AudioProvider]]:
+    """
+    Wait for the album of the song to be matched, see `match_albums`.
+
+    ### Arguments
+    - downloader: The downloader with the providers.
+    - song: The song to get the match for.
+
+    ### Returns
+    - tuple with the match, its score and the provider that found it,
+    or None if the song wasn't matched with its album.
+    """
+
+    future = downloader.album_matches.pop(song.url, None) if song.url else None
+    if future is None:
+        return None
+
+    try:
+        matches = await asyncio.wrap_future(future)
+    except Exception as exc:
+        logger.debug("Could not match album of %s: %s", song.display_name, exc)
+        return None
+
+    if song.url not in matches:
+        return None
+
+    result, score = matches[song.url]
+
+    return result, score, downloader.audio_providers[0]
+
+
+async def race_providers(
+    downloader: "Downloader", song: Song, only_verified: bool = False
+) -> Optional[Tuple[Result, float, AudioProvider]]:
+    """
+    Search for a song using all available providers at the same time.
+
+    ### Arguments
+    - downloader: The downloader with the providers.
+    - song: The song to search for.
+    - only_verified: Whether to only return verified results.
+
+    ### Returns
+    - tuple with the best match, its score and the provider that found it,
+    or None if no provider found the song.
+
+    ### Notes
+    - The first verified match with a score of at least `VERIFIED_MIN_SCORE`
+    wins and the remaining searches are cancelled.
+    - Otherwise the match with the highest score is returned,
+    ties are broken by the order of the audio providers.
+    """
+
+    tasks = {
+        asyncio.ensure_future(
+            audio_provider.find_match_async(song, only_verified)
+        ): index
+        for index, audio_provider in enumerate(downloader.audio_providers)
+    }
+
+    matches: Dict[int, Tuple[Result, float]] = {}
+    errors: List[BaseException] = []
+    pending = set(tasks)
+    try:
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+
+            for task in done:
+                audio_provider = downloader.audio_providers[tasks[task]]
+                exception = task.exception()
+                if exception is not None:
+                    logger.debug(
+                        "%s failed to search for %s: %s",
+                        audio_provider.name,
+                        song.display_name,
+                        exception,
+                    )
+                    errors.append(exception)
+                elif task.result() is None:
+                    logger.debug(
+                        "%s failed to find %s",
+                        audio_provider.name,
+                        song.display_name,
+                    )
+                else:
+                    matches[tasks[task]] = task.result()
+
+            verified = [
+                index
+                for index, (result, score) in matches.items()
+                if result.verified and score >= VERIFIED_MIN_SCORE
+            ]
+
+            if verified:
+                index = min(verified)
+                logger.debug(
+                    "%s won the search race for %s",
+                    downloader.audio_providers[index].name,
+                    song.display_name,
+                )
+
+                return (*matches[index], downloader.audio_providers[index])
+    finally:
+        # Providers that are still searching are not needed anymore
+        for task in pending:
+            task.cancel()
+
+    if not matches:
+        # Keep the behaviour of the sequential search if every provider failed
+        if errors:
+            raise errors[0]
+
+        return None
+
+    index = max(matches, key=lambda index: (matches[index][1], -index))
+
+    return (*matches[index], downloader.audio_providers[index])
+
+
+async def find_lyrics(
+    downloader: "Downloader", song: Song
+) -> Tuple[Optional[str], str]:
+    """
+    Search for lyrics using all available providers at the same time.
+
+    ### Arguments
+    - downloader: The downloader with the providers.
+    - song: The song to search for.
+
+    ### Returns
+    - tuple with the lyrics and the name of the provider that found them.
+    If no provider has lyrics for the song the lyrics are None and the names
+    of all providers are returned, comma separated. If a provider failed
+    or timed out the name is an empty string, as the song might have lyrics.
+
+    ### Notes
+    - The lyrics of the first provider in the list that found them are returned,
+    even if a lower priority provider answered first.
+    - Each provider is limited to its own `TIMEOUT`.
+    - Providers that are still searching when the lyrics are found are cancelled,
+    blocking requests they already started finish in the background.
+    """
+
+    tasks = [
+        asyncio.ensure_future(
+            asyncio.wait_for(
+                lyrics_provider.get_lyrics_async(song.name, song.artists),
+                lyrics_provider.TIMEOUT,
+            )
+        )
+        for lyrics_provider in downloader.lyrics_providers
+    ]
+
+    answered = []
+    failed = False
+    try:
+        # Wait for the providers in order, providers that already
+        # finished in the meantime are checked without waiting
+        for lyrics_provider, task in zip(downloader.lyrics_providers, tasks):
+            try:
+                lyrics = await task
+            except asyncio.TimeoutError:
+                logger.debug(
+                    "%s timed out searching for lyrics for %s",
+                    lyrics_provider.name,
+                    song.display_name,
+                )
+                failed = True
+                continue
+            except Exception as exc:
+                logger.debug(
+                    "%s failed to search for lyrics for %s: %s",
+                    lyrics_provider.name,
+                    song.display_name,
+                    exc,
+                )
+                failed = True
+                continue
+
+            if lyrics:
+                logger.debug(
+                    "Found lyrics for %s on %s",
+                    song.display_name,
+                    lyrics_provider.name,
+                )
+
+                return lyrics, lyrics_provider.name
+
+            answered.append(lyrics_provider.name)
+            logger.debug(
+                "%s failed to find lyrics for %s",
+                lyrics_provider.name,
+                song.display_name,
+            )
+    finally:
+        # Lower priority providers are not needed anymore
+        for task in tasks:
+            task.cancel()
+
+    if failed:
+        return None, ""
+
+    return None, ",".join(answered)
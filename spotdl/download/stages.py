@@ -0,0 +1,1017 @@
+"""
+Stages module, holds the download job and the stages every song goes through.
+The stages are plain functions of the downloader and the job, they are run one after
+another by `Downloader.search_and_download` or concurrently by `DownloadPipeline`.
+
+```python
+job = create_job(downloader, song)
+for stage in PIPELINE_STAGES:
+    run_stage(downloader, job, stage)
+    if job.finished:
+        break
+```
+"""
+
+# pylint: disable=too-many-lines
+
+import datetime
+import logging
+import shutil
+import traceback
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from spotdl.download.job import DownloadJob
+from spotdl.providers.audio.base import AudioProvider
+from spotdl.types.song import Song
+from spotdl.utils.config import get_errors_path, get_temp_path
+from spotdl.utils.ffmpeg import FFmpegError, get_transcode_mode
+from spotdl.utils.formatter import create_file_name
+from spotdl.utils.http import run_sync
+from spotdl.utils.info_cache import get_info_cache
+from spotdl.utils.lrc import generate_lrc
+from spotdl.utils.metadata import MetadataError, embed_metadata
+from spotdl.utils.search import reinit_song
+
+if TYPE_CHECKING:
+    from spotdl.download.downloader import Downloader
+
+__all__ = [
+    "STAGE_FUNCTIONS",
+    "ASYNC_STAGE_FUNCTIONS",
+    "SPONSOR_BLOCK_CATEGORIES",
+    "DownloaderError",
+    "create_job",
+    "record_job",
+    "run_stage",
+    "run_stage_async",
+    "handle_stage_error",
+    "is_missing_metadata",
+    "resolve_song",
+    "search_song",
+    "search_song_async",
+    "fetch_song",
+    "download_audio",
+    "can_stream",
+    "choose_transcode_mode",
+    "transcode_song",
+    "tag_song",
+    "remove_sponsor_segments",
+    "wait_for_lyrics",
+    "update_song_metadata",
+    "finalize_song",
+]
+
+logger = logging.getLogger(__name__)
+
+SPONSOR_BLOCK_CATEGORIES = {
+    "sponsor": "Sponsor",
+    "intro": "Intermission/Intro Animation",
+    "outro": "Endcards/Credits",
+    "selfpromo": "Unpaid/Self Promotion",
+    "preview": "Preview/Recap",
+    "filler": "Filler Tangent",
+    "interaction": "Interaction Reminder",
+    "music_offtopic": "Non-Music Section",
+}
+
+
+class DownloaderError(Exception):
+    """
+    Base class for all exceptions related to downloaders.
+    """
+
+
+def create_job(downloader: "Downloader", song: Song, index: int = 0) -> DownloadJob:
+    """
+    Create the download job for the song.
+
+    ### Arguments
+    - downloader: The downloader that runs the job.
+    - song: The song to download.
+    - index: The index of the song in the list of songs.
+
+    ### Returns
+    - The job, with the state of the interrupted run if the journal is resumed.
+    """
+
+    job = DownloadJob(song=song, index=index)
+    if downloader.journal is None or not downloader.settings["resume"]:
+        return job
+
+    entry = downloader.journal.get(song)
+    if entry is not None and not entry.done:
+        # The search doesn't have to be repeated if the url was found
+        job.resume_stage = entry.stage
+        job.download_url = entry.download_url
+        job.metadata_only = entry.metadata_only
+
+    return job
+
+
+def record_job(downloader: "Downloader", job: DownloadJob) -> None:
+    """
+    Write the state of the job to the journal,
+    and add finished songs to the archive.
+
+    ### Arguments
+    - downloader: The downloader that runs the job.
+    - job: The job to record.
+    """
+
+    if (
+        downloader.settings["archive"]
+        and job.finished
+        and job.song.url
+        and (job.path or downloader.settings["add_unavailable"])
+    ):
+        downloader.url_archive.add(job.song.url)
+
+    if downloader.journal is None:
+        return None
+
+    downloader.journal.record(
+        job.song,
+        job.stage,
+        finished=job.finished,
+        download_url=job.download_url,
+        path=job.path,
+        error=job.error,
+        transcode_mode=job.transcode_mode,
+        metadata_only=job.metadata_only,
+    )
+
+    return None
+
+
+def run_stage(downloader: "Downloader", job: DownloadJob, stage: str) -> None:
+    """
+    Run a single download stage for the job.
+
+    ### Arguments
+    - downloader: The downloader that runs the job.
+    - job: The job to run the stage for.
+    - stage: The name of the stage, one of `PIPELINE_STAGES`.
+
+    ### Notes
+    - Exceptions are never raised, instead the job is marked as failed.
+    """
+
+    try:
+        STAGE_FUNCTIONS[stage](downloader, job)
+        job.stage = stage
+    except (Exception, UnicodeEncodeError) as exception:
+        handle_stage_error(downloader, job, exception)
+
+    record_job(downloader, job)
+
+
+async def run_stage_async(
+    downloader: "Downloader", job: DownloadJob, stage: str
+) -> None:
+    """
+    Run a single download stage for the job on the event loop.
+
+    ### Arguments
+    - downloader: The downloader that runs the job.
+    - job: The job to run the stage for.
+    - stage: The name of the stage, one of `PIPELINE_STAGES`.
+
+    ### Notes
+    - Only stages in `ASYNC_STAGES` can be run this way.
+    - Exceptions are never raised, instead the job is marked as failed.
+    """
+
+    try:
+        await ASYNC_STAGE_FUNCTIONS[stage](downloader, job)
+        job.stage = stage
+    except (Exception, UnicodeEncodeError) as exception:
+        handle_stage_error(downloader, job, exception)
+
+    record_job(downloader, job)
+
+
+def handle_stage_error(
+    downloader: "Downloader", job: DownloadJob, exception: Exception
+) -> None:
+    """
+    Report the exception raised by a download stage and mark the job as failed.
+
+    ### Arguments
+    - downloader: The downloader that runs the job.
+    - job: The job that failed.
+    - exception: The exception raised by the stage.
+    """
+
+    if isinstance(exception, UnicodeEncodeError):
+        exception_cause = exception
+        exception = DownloaderError(
+            "You may need to add PYTHONIOENCODING=utf-8 to your environment"
+        )
+
+        exception.__cause__ = exception_cause
+
+    if job.tracker is not None:
+        job.tracker.notify_error(traceback.format_exc(), exception, True)
+    else:
+        logger.error("Failed to process %s: %s", job.song.display_name, exception)
+
+    job.error = f"{exception.__class__.__name__}: {exception}"
+    downloader.errors.append(f"{job.song.url} - {job.error}")
+
+    job.finish(None)
+
+
+def is_missing_metadata(song: Song) -> bool:
+    """
+    Check if the song has to be reinitialized before it can be downloaded.
+
+    ### Arguments
+    - song: The song to check.
+
+    ### Returns
+    - True if the song is missing metadata.
+    """
+
+    return bool(song.name is None and song.url) or any(
+        x is None
+        for x in [
+            song.genres,
+            song.disc_count,
+            song.tracks_count,
+            song.track_number,
+            song.album_id,
+            song.album_artist,
+        ]
+    )
+
+
+def resolve_song(downloader: "Downloader", job: DownloadJob) -> None:
+    """
+    Fill in the song metadata and check if the song has to be downloaded.
+
+    ### Arguments
+    - downloader: The downloader that runs the job.
+    - job: The job to resolve.
+    """
+
+    song = job.song
+
+    # Check if song has name/artist and url/song_id
+    if not (song.name and (song.artists or song.artist)) and not (
+        song.url or song.song_id
+    ):
+        logger.error("Song is missing required fields: %s", song.display_name)
+        downloader.errors.append(
+            f"Song is missing required fields: {song.display_name}"
+        )
+        job.finish(None)
+        return None
+
+    # Reinitialize the song object if it's still missing metadata
+    if is_missing_metadata(song):
+        song = job.song = reinit_song(song)
+
+    # Create the output file path
+    output_file = job.output_file = create_file_name(
+        song=song,
+        template=downloader.settings["output"],
+        file_extension=downloader.settings["format"],
+        restrict=downloader.settings["restrict"],
+        file_name_length=downloader.settings["max_filename_length"],
+    )
+
+    if song.explicit is True and downloader.settings["skip_explicit"] is True:
+        logger.info("Skipping explicit song: %s", song.display_name)
+        job.finish(None)
+        return None
+
+    # Initialize the progress tracker
+    job.tracker = downloader.progress_handler.get_new_tracker(song)
+
+    # The file was converted in the interrupted run,
+    # only the metadata has to be embedded
+    if job.resume_stage in ["transcode", "tag"] and output_file.exists():
+        logger.debug("Resuming %s at the tag stage", song.display_name)
+        job.file_exists = True
+        job.metadata_only = True
+        return None
+
+    # The conversion was interrupted, the output file is incomplete
+    # and must not be skipped as an already downloaded song
+    if job.resume_stage == "fetch" and not job.metadata_only and output_file.exists():
+        logger.debug("Removing partial output file %s", output_file)
+        output_file.unlink()
+
+    # Check if there is an already existing song file, with the same spotify URL in its
+    # metadata, but saved under a different name. If so, save its path.
+    dup_song_paths: List[Path] = downloader.known_songs.get(song.url, [])
+
+    # Remove files from the list that have the same path as the output file
+    dup_song_paths = [
+        dup_song_path
+        for dup_song_path in dup_song_paths
+        if (dup_song_path.absolute() != output_file.absolute())
+        and dup_song_path.exists()
+    ]
+
+    # Checking if file already exists in all subfolders of output directory
+    file_exists = output_file.exists() or bool(dup_song_paths)
+    if not downloader.settings["scan_for_songs"]:
+        for file_extension in downloader.scan_formats:
+            ext_path = output_file.with_suffix(f".{file_extension}")
+            if ext_path.exists():
+                dup_song_paths.append(ext_path)
+
+    job.file_exists = file_exists
+    job.dup_song_paths = dup_song_paths
+
+    if dup_song_paths:
+        logger.debug(
+            "Found duplicate songs for %s at %s",
+            song.display_name,
+            ", ".join([f"'{str(dup_song_path)}'" for dup_song_path in dup_song_paths]),
+        )
+
+    # If the file already exists and we don't want to overwrite it,
+    # we can skip the download
+    if (  # pylint: disable=R1705
+        Path(str(output_file.absolute()) + ".skip").exists()
+        and downloader.settings["respect_skip_file"]
+    ):
+        logger.info(
+            "Skipping %s (skip file found) %s",
+            song.display_name,
+            "",
+        )
+
+        job.finish(output_file if output_file.exists() else None)
+        return None
+
+    elif file_exists and downloader.settings["overwrite"] == "skip":
+        logger.info(
+            "Skipping %s (file already exists) %s",
+            song.display_name,
+            "(duplicate)" if dup_song_paths else "",
+        )
+
+        job.tracker.notify_download_skip()
+        job.finish(output_file)
+        return None
+
+    # Don't skip if the file exists and overwrite is set to force
+    if file_exists and downloader.settings["overwrite"] == "force":
+        logger.info(
+            "Overwriting %s %s",
+            song.display_name,
+            " (duplicate)" if dup_song_paths else "",
+        )
+
+        # If the duplicate song path is not None, we can delete the old file
+        for dup_song_path in dup_song_paths:
+            try:
+                logger.info("Removing duplicate file: %s", dup_song_path)
+
+                dup_song_path.unlink()
+            except (PermissionError, OSError, Exception) as exc:
+                logger.debug(
+                    "Could not remove duplicate file: %s, error: %s",
+                    dup_song_path,
+                    exc,
+                )
+
+    return None
+
+
+def search_song(downloader: "Downloader", job: DownloadJob) -> None:
+    """
+    Find the lyrics and the download url for the song.
+
+    ### Arguments
+    - downloader: The downloader that runs the job.
+    - job: The job to search for.
+
+    ### Notes
+    - Only used by the synchronous `Downloader.search_and_download`,
+    the search runs on a new event loop on the calling thread.
+    """
+
+    run_sync(search_song_async(downloader, job))
+
+
+async def search_song_async(downloader: "Downloader", job: DownloadJob) -> None:
+    """
+    Find the lyrics and the download url for the song, asynchronously.
+
+    ### Arguments
+    - downloader: The downloader that runs the job.
+    - job: The job to search for.
+    """
+
+    song = job.song
+
+    # Find song lyrics in the background, they are added to the song
+    # object by the tag stage
+    if downloader.lyrics_providers:
+        job.lyrics_future = downloader.lyrics_executor.submit(
+            downloader.search_lyrics, song
+        )
+
+    # If the file already exists and we want to overwrite the metadata,
+    # we can skip the download
+    if job.metadata_only or (
+        job.file_exists and downloader.settings["overwrite"] == "metadata"
+    ):
+        job.metadata_only = True
+        return None
+
+    # Create the output directory if it doesn't exist
+    job.output_file.parent.mkdir(parents=True, exist_ok=True)  # type: ignore
+    if job.download_url is not None:
+        # Found in the interrupted run
+        logger.debug("Resuming %s at the fetch stage", song.display_name)
+    elif song.download_url is None:
+        job.download_url = await downloader.search_async(song)
+    else:
+        job.download_url = song.download_url
+
+    return None
+
+
+def fetch_song(downloader: "Downloader", job: DownloadJob) -> None:
+    """
+    Download the audio stream of the song to the temp folder.
+
+    ### Arguments
+    - downloader: The downloader that runs the job.
+    - job: The job to fetch the audio for.
+    """
+
+    if job.metadata_only:
+        return None
+
+    # The progress hook is only attached for the duration of the lease
+    with downloader.provider_pool.lease(
+        job.tracker.yt_dlp_progress_hook  # type: ignore
+    ) as audio_downloader:
+        download_audio(downloader, job, audio_downloader)
+
+    return None
+
+
+def download_audio(
+    downloader: "Downloader", job: DownloadJob, audio_downloader: AudioProvider
+) -> None:
+    """
+    Download the audio stream with a leased audio provider.
+
+    ### Arguments
+    - downloader: The downloader that runs the job.
+    - job: The job to fetch the audio for.
+    - audio_downloader: The audio provider to download with.
+    """
+
+    song = job.song
+
+    logger.debug("Downloading %s using %s", song.display_name, job.download_url)
+
+    # In stream mode only the media url is resolved here,
+    # the transcode stage reads the audio straight from it
+    download_info = audio_downloader.get_download_metadata(
+        job.download_url, download=not downloader.settings["stream"]  # type: ignore
+    )
+
+    if download_info is not None and downloader.settings["stream"]:
+        if can_stream(downloader, download_info):
+            logger.debug("Streaming %s into ffmpeg", song.display_name)
+
+            job.download_info = download_info
+            job.stream_url = download_info["url"]
+            job.tracker.notify_download_complete()  # type: ignore
+
+            return None
+
+        # Formats that can't be piped into ffmpeg are downloaded as usual
+        download_info = audio_downloader.audio_handler.process_ie_result(
+            download_info, download=True
+        )
+
+    if download_info is None:
+        logger.debug(
+            "No download info found for %s, url: %s",
+            song.display_name,
+            job.download_url,
+        )
+
+        raise DownloaderError(
+            f"yt-dlp failed to get metadata for: {song.name} - {song.artist}"
+        )
+
+    job.download_info = download_info
+    job.temp_file = Path(
+        get_temp_path() / f"{download_info['id']}.{download_info['ext']}"
+    )
+
+    job.tracker.notify_download_complete()  # type: ignore
+
+    return None
+
+
+def can_stream(downloader: "Downloader", download_info: Dict) -> bool:
+    """
+    Check if the audio can be streamed into ffmpeg instead of being downloaded.
+
+    ### Arguments
+    - downloader: The downloader that runs the job.
+    - download_info: The yt-dlp info dict of the selected format.
+
+    ### Returns
+    - True if the audio has to be converted and is available over plain http.
+
+    ### Notes
+    - Streams that would only be moved to the output file are downloaded,
+    there's no conversion to overlap with the download.
+    - Fragmented (dash, hls) and merged formats are downloaded by yt-dlp.
+    """
+
+    if (
+        not download_info.get("url")
+        or download_info.get("protocol") not in ["http", "https"]
+        or download_info.get("requested_formats")
+    ):
+        return False
+
+    # Cookies can't be passed to ffmpeg reliably
+    if downloader.settings["cookie_file"]:
+        return False
+
+    return choose_transcode_mode(downloader, download_info) != "move"
+
+
+def choose_transcode_mode(downloader: "Downloader", download_info: Dict) -> str:
+    """
+    Decide how the downloaded audio has to be converted to the output format.
+
+    ### Arguments
+    - downloader: The downloader that runs the job.
+    - download_info: The yt-dlp info dict of the selected format.
+
+    ### Returns
+    - "move" if the file can be moved to the output file,
+    "copy" if only the container has to change
+    and "transcode" if the audio has to be re-encoded.
+
+    ### Notes
+    - The codec reported by yt-dlp is used, so the file doesn't have to be probed.
+    """
+
+    # Piped streams are always converted
+    # unless the bitrate is set to disable
+    if (
+        downloader.settings["audio_providers"][0] == "piped"
+        and downloader.settings["bitrate"] != "disable"
+    ):
+        return "transcode"
+
+    # Only an explicit bitrate forces the audio to be re-encoded
+    bitrate = downloader.settings["bitrate"]
+    if bitrate in ["auto", "disable"]:
+        bitrate = None
+
+    return get_transcode_mode(
+        download_info["ext"],
+        downloader.settings["format"],
+        codec=download_info.get("acodec"),
+        bitrate=bitrate,
+        ffmpeg_args=downloader.settings["ffmpeg_args"],
+    )
+
+
+def transcode_song(downloader: "Downloader", job: DownloadJob) -> None:
+    """
+    Convert the downloaded file to the output format.
+
+    ### Arguments
+    - downloader: The downloader that runs the job.
+    - job: The job to convert the audio for.
+    """
+
+    if job.metadata_only:
+        return None
+
+    song = job.song
+    output_file: Path = job.output_file  # type: ignore
+
+    success, result = convert_song(downloader, job)
+
+    if not success and job.stream_url is not None:
+        # ffmpeg couldn't read the stream, e.g. because the media url expired
+        # or the server refused it, so the audio is downloaded and converted again
+        logger.debug("Streaming %s failed, downloading it instead", song.display_name)
+
+        if output_file.exists():
+            output_file.unlink()
+
+        with downloader.provider_pool.lease(
+            job.tracker.yt_dlp_progress_hook  # type: ignore
+        ) as audio_downloader:
+            download_stream(job, audio_downloader)
+
+        success, result = convert_song(downloader, job)
+
+    download_info: Dict = job.download_info  # type: ignore
+
+    # Remove the temp file
+    temp_file = job.temp_file
+    if temp_file is not None and temp_file.exists():
+        try:
+            temp_file.unlink()
+        except (PermissionError, OSError) as exc:
+            logger.debug("Could not remove temp file: %s, error: %s", temp_file, exc)
+
+            raise DownloaderError(
+                f"Could not remove temp file: {temp_file}, possible duplicate song"
+            ) from exc
+
+    if not success and result:
+        # If the conversion failed and there is an error message
+        # create a file with the error message
+        # and save it in the errors directory
+        # raise an exception with file path
+        file_name = (
+            get_errors_path()
+            / f"ffmpeg_error_{datetime.datetime.now().strftime('%Y-%m-%d-%H-%M-%S')}.txt"
+        )
+
+        error_message = ""
+        for key, value in result.items():
+            error_message += f"### {key}:\n{str(value).strip()}\n\n"
+
+        with open(file_name, "w", encoding="utf-8") as error_path:
+            error_path.write(error_message)
+
+        # Remove the file that failed to convert
+        if output_file.exists():
+            output_file.unlink()
+
+        raise FFmpegError(
+            f"Failed to convert {song.display_name}, "
+            f"you can find error here: {str(file_name.absolute())}"
+        )
+
+    download_info["filepath"] = str(output_file)
+
+    # Set the song's download url
+    if song.download_url is None:
+        song.download_url = job.download_url
+
+    job.tracker.notify_conversion_complete()  # type: ignore
+
+    return None
+
+
+def convert_song(
+    downloader: "Downloader", job: DownloadJob
+) -> Tuple[bool, Optional[Dict[str, Any]]]:
+    """
+    Move or convert the downloaded audio, or the stream, to the output file.
+
+    ### Arguments
+    - downloader: The downloader that runs the job.
+    - job: The job to convert the audio for.
+
+    ### Returns
+    - tuple with True if the conversion succeeded and the ffmpeg error if it failed.
+    """
+
+    song = job.song
+    output_file: Path = job.output_file  # type: ignore
+    download_info: Dict = job.download_info  # type: ignore
+
+    # Streamed songs are read from the media url, there's no temp file
+    input_file: Union[Path, Tuple[str, str]]
+    if job.stream_url is not None:
+        input_file = (job.stream_url, download_info["ext"])
+    else:
+        input_file = job.temp_file  # type: ignore
+
+    job.transcode_mode = choose_transcode_mode(downloader, download_info)
+    logger.debug("Transcode mode for %s: %s", song.display_name, job.transcode_mode)
+
+    if job.stream_url is None and job.transcode_mode == "move":
+        shutil.move(str(input_file), output_file)
+        success = True
+        result = None
+    else:
+        if job.transcode_mode != "transcode":
+            # The audio stream is copied, there's nothing to encode
+            bitrate = None
+        elif downloader.settings["bitrate"] in ["auto", None]:
+            # Use the bitrate from the download info if it exists
+            # otherwise use `copy`
+            bitrate = (
+                f"{int(download_info['abr'])}k" if download_info.get("abr") else "128k"
+            )
+        elif downloader.settings["bitrate"] == "disable":
+            bitrate = None
+        else:
+            bitrate = str(downloader.settings["bitrate"])
+
+        # Convert the downloaded file to the output format
+        success, result = downloader.transcode_service.convert(
+            input_file=input_file,
+            output_file=output_file,
+            output_format=downloader.settings["format"],
+            bitrate=bitrate,
+            ffmpeg_args=downloader.settings["ffmpeg_args"],
+            progress_handler=job.tracker.ffmpeg_progress_hook,  # type: ignore
+            headers=download_info.get("http_headers"),
+            duration=download_info.get("duration") or song.duration,
+            input_codec=download_info.get("acodec"),
+        )
+
+        if downloader.settings["create_skip_file"]:
+            with open(str(output_file) + ".skip", mode="w", encoding="utf-8") as _:
+                pass
+
+    return success, result
+
+
+def download_stream(job: DownloadJob, audio_downloader: AudioProvider) -> None:
+    """
+    Download the audio of a song that failed to stream into a temp file.
+
+    ### Arguments
+    - job: The job to download the audio for.
+    - audio_downloader: The audio provider to download with.
+
+    ### Notes
+    - The cached info dict is dropped first, so the media urls are extracted again.
+    """
+
+    get_info_cache().remove(
+        job.download_url, source=audio_downloader.INFO_SOURCE  # type: ignore
+    )
+
+    try:
+        download_info = audio_downloader.get_download_metadata(
+            job.download_url, download=True  # type: ignore
+        )
+    except Exception as exception:
+        raise DownloaderError(
+            f"Failed to download {job.song.display_name} after streaming failed"
+        ) from exception
+
+    job.stream_url = None
+    job.download_info = download_info
+    job.temp_file = Path(
+        get_temp_path() / f"{download_info['id']}.{download_info['ext']}"
+    )
+
+
+def tag_song(downloader: "Downloader", job: DownloadJob) -> None:
+    """
+    Remove sponsor segments and embed metadata into the output file.
+
+    ### Arguments
+    - downloader: The downloader that runs the job.
+    - job: The job to tag the output file for.
+    """
+
+    wait_for_lyrics(downloader, job)
+
+    if job.metadata_only:
+        update_song_metadata(downloader, job)
+        return None
+
+    song = job.song
+    output_file: Path = job.output_file  # type: ignore
+
+    # SponsorBlock post processor
+    if downloader.settings["sponsor_block"]:
+        # The provider used by the fetch stage is already back in the pool
+        with downloader.provider_pool.lease() as audio_downloader:
+            remove_sponsor_segments(job, audio_downloader)
+
+    try:
+        embed_metadata(
+            output_file,
+            song,
+            id3_separator=downloader.settings["id3_separator"],
+            skip_album_art=downloader.settings["skip_album_art"],
+        )
+    except Exception as exception:
+        raise MetadataError("Failed to embed metadata to the song") from exception
+
+    if downloader.settings["generate_lrc"]:
+        generate_lrc(song, output_file, downloader.lyrics_cache)
+
+    return None
+
+
+def remove_sponsor_segments(job: DownloadJob, audio_downloader: AudioProvider) -> None:
+    """
+    Remove the SponsorBlock segments from the output file.
+
+    ### Arguments
+    - job: The job to remove the sponsor segments for.
+    - audio_downloader: The audio provider whose yt-dlp handle runs the post processors.
+    """
+
+    # pylint: disable=import-outside-toplevel
+    from yt_dlp.postprocessor.modify_chapters import ModifyChaptersPP
+    from yt_dlp.postprocessor.sponsorblock import SponsorBlockPP
+
+    # Initialize the sponsorblock post processor
+    post_processor = SponsorBlockPP(
+        audio_downloader.audio_handler, SPONSOR_BLOCK_CATEGORIES
+    )
+
+    # Run the post processor to get the sponsor segments
+    _, download_info = post_processor.run(job.download_info)
+    chapters = download_info["sponsorblock_chapters"]
+
+    # If there are sponsor segments, remove them
+    if len(chapters) > 0:
+        logger.info(
+            "Removing %s sponsor segments for %s",
+            len(chapters),
+            job.song.display_name,
+        )
+
+        # Initialize the modify chapters post processor
+        modify_chapters = ModifyChaptersPP(
+            downloader=audio_downloader.audio_handler,
+            remove_sponsor_segments=SPONSOR_BLOCK_CATEGORIES,
+        )
+
+        # Run the post processor to remove the sponsor segments
+        # this returns a list of files to delete
+        files_to_delete, download_info = modify_chapters.run(download_info)
+
+        # Delete the files that were created by the post processor
+        for file_to_delete in files_to_delete:
+            Path(file_to_delete).unlink()
+
+    job.download_info = download_info
+
+
+def wait_for_lyrics(downloader: "Downloader", job: DownloadJob) -> None:
+    """
+    Wait for the lyrics search started by the search stage
+    and add the lyrics to the song object.
+
+    ### Arguments
+    - downloader: The downloader that runs the job.
+    - job: The job to wait for.
+    """
+
+    if job.lyrics_future is None:
+        return None
+
+    song = job.song
+    try:
+        lyrics = job.lyrics_future.result()
+        if lyrics is None:
+            logger.debug(
+                "No lyrics found for %s, lyrics providers: %s",
+                song.display_name,
+                ", ".join(
+                    [lprovider.name for lprovider in downloader.lyrics_providers]
+                ),
+            )
+        else:
+            song.lyrics = lyrics
+    except Exception as exc:
+        logger.debug("Could not search for lyrics: %s", exc)
+
+    job.lyrics_future = None
+
+    return None
+
+
+def update_song_metadata(downloader: "Downloader", job: DownloadJob) -> None:
+    """
+    Update the metadata of an already existing song file,
+    without downloading the song again.
+
+    ### Arguments
+    - downloader: The downloader that runs the job.
+    - job: The job to update the metadata for.
+    """
+
+    song = job.song
+    output_file: Path = job.output_file  # type: ignore
+
+    most_recent_duplicate: Optional[Path] = None
+    if job.dup_song_paths:
+        # Get the most recent duplicate song path and remove the rest
+        most_recent_duplicate = max(
+            job.dup_song_paths,
+            key=lambda dup_song_path: dup_song_path.stat().st_mtime
+            and dup_song_path.suffix == output_file.suffix,
+        )
+
+        # Remove the rest of the duplicate song paths
+        for old_song_path in job.dup_song_paths:
+            if most_recent_duplicate == old_song_path:
+                continue
+
+            try:
+                logger.info("Removing duplicate file: %s", old_song_path)
+                old_song_path.unlink()
+            except (PermissionError, OSError) as exc:
+                logger.debug(
+                    "Could not remove duplicate file: %s, error: %s",
+                    old_song_path,
+                    exc,
+                )
+
+        # Move the old file to the new location
+        if most_recent_duplicate and most_recent_duplicate.suffix == output_file.suffix:
+            most_recent_duplicate.replace(
+                output_file.with_suffix(f".{downloader.settings['format']}")
+            )
+
+    if most_recent_duplicate and most_recent_duplicate.suffix != output_file.suffix:
+        logger.info(
+            "Could not move duplicate file: %s, different file extension",
+            most_recent_duplicate,
+        )
+
+        job.tracker.notify_complete()  # type: ignore
+        job.finish(None)
+        return None
+
+    # Update the metadata
+    embed_metadata(
+        output_file=output_file,
+        song=song,
+        skip_album_art=downloader.settings["skip_album_art"],
+    )
+
+    if downloader.library_index is not None:
+        downloader.library_index.add(output_file, song.url, song.isrc)
+
+    logger.info(
+        f"Updated metadata for {song.display_name}"
+        f", moved to new location: {output_file}"
+        if most_recent_duplicate
+        else ""
+    )
+
+    job.tracker.notify_complete()  # type: ignore
+    job.finish(output_file)
+
+    return None
+
+
+def finalize_song(downloader: "Downloader", job: DownloadJob) -> None:
+    """
+    Mark the song as downloaded.
+
+    ### Arguments
+    - downloader: The downloader that runs the job.
+    - job: The job to finalize.
+    """
+
+    song = job.song
+    output_file: Path = job.output_file  # type: ignore
+
+    job.tracker.notify_complete()  # type: ignore
+
+    # Add the song to the known songs
+    downloader.known_songs.get(song.url, []).append(output_file)
+    if downloader.library_index is not None:
+        downloader.library_index.add(output_file, song.url, song.isrc)
+
+    logger.info('Downloaded "%s": %s', song.display_name, song.download_url)
+
+    job.finish(output_file)
+
+
+# Functions that run the stages, by stage name
+STAGE_FUNCTIONS: Dict[str, Callable[["Downloader", DownloadJob], None]] = {
+    "resolve": resolve_song,
+    "search": search_song,
+    "fetch": fetch_song,
+    "transcode": transcode_song,
+    "tag": tag_song,
+    "finalize": finalize_song,
+}
+
+ASYNC_STAGE_FUNCTIONS: Dict[
+    str, Callable[["Downloader", DownloadJob], Awaitable[None]]
+] = {
+    "search": search_song_async,
+}
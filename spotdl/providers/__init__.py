@@ -1,3 +1,34 @@
 """
 Different types of data providers for spotdl.
 """
+
+from typing import TYPE_CHECKING, Type
+
+from spotdl.utils.lazy import LazyRegistry
+
+if TYPE_CHECKING:
+    from spotdl.providers.audio.base import AudioProvider
+    from spotdl.providers.lyrics.base import LyricsProvider
+
+__all__ = ["AUDIO_PROVIDERS", "LYRICS_PROVIDERS"]
+
+# Providers are imported when they are first used,
+# since their dependencies take a long time to import
+AUDIO_PROVIDERS: LazyRegistry[Type["AudioProvider"]] = LazyRegistry(
+    {
+        "youtube": "spotdl.providers.audio.youtube:YouTube",
+        "youtube-music": "spotdl.providers.audio.ytmusic:YouTubeMusic",
+        "soundcloud": "spotdl.providers.audio.soundcloud:SoundCloud",
+        "bandcamp": "spotdl.providers.audio.bandcamp:BandCamp",
+        "piped": "spotdl.providers.audio.piped:Piped",
+    }
+)
+
+LYRICS_PROVIDERS: LazyRegistry[Type["LyricsProvider"]] = LazyRegistry(
+    {
+        "genius": "spotdl.providers.lyrics.genius:Genius",
+        "musixmatch": "spotdl.providers.lyrics.musixmatch:MusixMatch",
+        "azlyrics": "spotdl.providers.lyrics.azlyrics:AzLyrics",
+        "synced": "spotdl.providers.lyrics.synced:Synced",
+    }
+)
@@ -1,18 +1,25 @@
 """
 Audio providers for spotdl.
+The providers are imported on first access, see `spotdl.providers.AUDIO_PROVIDERS`.
 """
 
-from spotdl.providers.audio.bandcamp import BandCamp
-from spotdl.providers.audio.base import (
-    ISRC_REGEX,
-    AudioProvider,
-    AudioProviderError,
-    YTDLLogger,
-)
-from spotdl.providers.audio.piped import Piped
-from spotdl.providers.audio.soundcloud import SoundCloud
-from spotdl.providers.audio.youtube import YouTube
-from spotdl.providers.audio.ytmusic import YouTubeMusic
+from typing import TYPE_CHECKING, Any
+
+from spotdl.utils.lazy import import_object
+
+if TYPE_CHECKING:
+    from spotdl.providers.audio.bandcamp import BandCamp
+    from spotdl.providers.audio.base import (
+        ISRC_REGEX,
+        VERIFIED_MIN_SCORE,
+        AudioProvider,
+        AudioProviderError,
+        YTDLLogger,
+    )
+    from spotdl.providers.audio.piped import Piped
+    from spotdl.providers.audio.soundcloud import SoundCloud
+    from spotdl.providers.audio.youtube import YouTube
+    from spotdl.providers.audio.ytmusic import YouTubeMusic
 
 __all__ = [
     "YouTube",
@@ -24,4 +31,32 @@
     "AudioProviderError",
     "YTDLLogger",
     "ISRC_REGEX",
+    "VERIFIED_MIN_SCORE",
 ]
+
+_LAZY_ATTRIBUTES = {
+    "YouTube": "spotdl.providers.audio.youtube:YouTube",
+    "YouTubeMusic": "spotdl.providers.audio.ytmusic:YouTubeMusic",
+    "SoundCloud": "spotdl.providers.audio.soundcloud:SoundCloud",
+    "BandCamp": "spotdl.providers.audio.bandcamp:BandCamp",
+    "Piped": "spotdl.providers.audio.piped:Piped",
+    "AudioProvider": "spotdl.providers.audio.base:AudioProvider",
+    "AudioProviderError": "spotdl.providers.audio.base:AudioProviderError",
+    "YTDLLogger": "spotdl.providers.audio.base:YTDLLogger",
+    "ISRC_REGEX": "spotdl.providers.audio.base:ISRC_REGEX",
+    "VERIFIED_MIN_SCORE": "spotdl.providers.audio.base:VERIFIED_MIN_SCORE",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import the providers on first access.
+    """
+
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = import_object(_LAZY_ATTRIBUTES[name])
+    globals()[name] = value
+
+    return value
@@ -3,13 +3,14 @@
 """
 
 import logging
+import threading
 from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urljoin
 
-import requests
-
-from spotdl.providers.audio.base import AudioProvider
+from spotdl.providers.audio.base import AudioProvider, run_parallel
 from spotdl.types.result import Result
-from spotdl.utils.config import GlobalConfig
+from spotdl.types.song import Song
+from spotdl.utils.http import get_session
 
 __all__ = ["BandCamp"]
 
@@ -32,7 +33,7 @@ def __init__(self, artist_id: int, track_id: int):
         self.track_duration_seconds: float = 0.00
         self.track_streamable: Optional[bool] = None
         self.has_lyrics: Optional[bool] = None
-        self.lyrics: str = ""
+        self._lyrics: Optional[str] = None
         self.is_price_set: Optional[bool] = None
         self.price: dict = {}
         self.require_email: Optional[bool] = None
@@ -68,14 +69,13 @@ def __init__(self, artist_id: int, track_id: int):
         self.date_published_unix: int = 0
         self.supporters: list = []
 
-        response = requests.get(
+        response = get_session().get(
             url="https://bandcamp.com/api/mobile/25/tralbum_details?band_id="
             + str(artist_id)
             + "&tralbum_id="
             + str(track_id)
             + "&tralbum_type=t",
             timeout=10,
-            proxies=GlobalConfig.get_parameter("proxies"),
         )
         result = response.json()
         self.track_id = result["id"]
@@ -85,18 +85,6 @@ def __init__(self, artist_id: int, track_id: int):
         self.track_streamable = result["tracks"][0]["is_streamable"]
         self.has_lyrics = result["tracks"][0]["has_lyrics"]
 
-        # getting lyrics, if there is any
-        if self.has_lyrics is True:
-            resp = requests.get(
-                "https://bandcamp.com/api/mobile/25/tralbum_lyrics?tralbum_id="
-                + str(self.track_id)
-                + "&tralbum_type=t",
-                timeout=10,
-                proxies=GlobalConfig.get_parameter("proxies"),
-            )
-            rjson = resp.json()
-            self.lyrics = rjson["lyrics"][str(self.track_id)]
-
         self.is_price_set = result["is_set_price"]
         self.price = {"currency": result["currency"], "amount": result["price"]}
         self.require_email = result["require_email"]
@@ -126,6 +114,31 @@ def __init__(self, artist_id: int, track_id: int):
 
         self.track_url = result["bandcamp_url"]
 
+    @property
+    def lyrics(self) -> str:
+        """
+        Get the lyrics of the track, they are only fetched when they are needed.
+
+        ### Returns
+        - The lyrics or an empty string if the track has no lyrics.
+        """
+
+        if self._lyrics is None:
+            self._lyrics = ""
+
+            # getting lyrics, if there is any
+            if self.has_lyrics is True:
+                resp = get_session().get(
+                    "https://bandcamp.com/api/mobile/25/tralbum_lyrics?tralbum_id="
+                    + str(self.track_id)
+                    + "&tralbum_type=t",
+                    timeout=10,
+                )
+                rjson = resp.json()
+                self._lyrics = rjson["lyrics"][str(self.track_id)]
+
+        return self._lyrics
+
 
 def search(search_string: str = ""):
     """
@@ -138,26 +151,40 @@ def search(search_string: str = ""):
     - search_string: The search term to search for.
 
     ### Returns
-    - A list of artist and track ids if found
+    - A list of the track items of the search payload
     """
 
-    response = requests.get(
+    response = get_session().get(
         "https://bandcamp.com/api/fuzzysearch/2/app_autocomplete?q="
         + search_string
         + "&param_with_locations=true",
         timeout=10,
-        proxies=GlobalConfig.get_parameter("proxies"),
     )
 
     results = response.json()["results"]
 
-    return_results: List[Tuple[str, str]] = []
+    return [item for item in results if item["type"] == "t"]
 
-    for item in results:
-        if item["type"] == "t":
-            return_results.append((item["band_id"], item["id"]))
 
-    return return_results
+def get_item_url(item: Dict[str, Any]) -> str:
+    """
+    Get the absolute url of a search item.
+    The url path can be relative to the artist page.
+
+    ### Arguments
+    - item: The track item of the search payload.
+
+    ### Returns
+    - The url of the track, or an empty string if the item has no url.
+    """
+
+    url_path = item.get("item_url_path")
+    if not url_path:
+        return ""
+
+    url_root = item.get("item_url_root") or "https://bandcamp.com"
+
+    return urljoin(url_root.rstrip("/") + "/", url_path)
 
 
 class BandCamp(AudioProvider):
@@ -168,6 +195,21 @@ class BandCamp(AudioProvider):
     SUPPORTS_ISRC = False
     GET_RESULTS_OPTS: List[Dict[str, Any]] = [{}]
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """
+        Initialize the BandCamp provider
+
+        ### Arguments
+        - args: Arguments passed to the `AudioProvider` class.
+        - kwargs: Keyword arguments passed to the `AudioProvider` class.
+        """
+
+        super().__init__(*args, **kwargs)
+
+        # Track details are cached by artist and track id
+        self.track_cache: Dict[Tuple[int, int], BandCampTrack] = {}
+        self.track_cache_lock = threading.Lock()
+
     def get_results(self, search_term: str, *_args, **_kwargs) -> List[Result]:
         """
         Get results from slider.kz
@@ -189,23 +231,88 @@ def get_results(self, search_term: str, *_args, **_kwargs) -> List[Result]:
             logger.error("Failed to get results from BandCamp", exc_info=exc)
             return []
 
+        # The search payload has no duration, the details
+        # are fetched later for the results that can be matched
         simplified_results: List[Result] = []
         for result in results:
-            track = BandCampTrack(int(result[0]), int(result[1]))
+            band_name = result.get("band_name") or ""
 
             simplified_results.append(
                 Result(
                     source="bandcamp",
-                    url=track.track_url,
+                    url=get_item_url(result),
                     verified=False,
-                    name=track.track_title,
-                    duration=track.track_duration_seconds,
-                    author=track.artist_title,
-                    result_id=track.track_url,
+                    name=result["name"],
+                    duration=0,
+                    author=band_name,
+                    result_id=f"{result['band_id']}:{result['id']}",
                     search_query=search_term,
-                    album=track.album_title,
-                    artists=tuple(track.artist_title.split(", ")),
+                    album=result.get("album_name"),
+                    artists=tuple(band_name.split(", ")) if band_name else None,
                 )
             )
 
         return simplified_results
+
+    def enrich_results(self, results: List[Result], song: Song) -> List[Result]:
+        """
+        Fetch the details of the results that pass the first matching pass.
+
+        ### Arguments
+        - results: The results returned by `get_results`.
+        - song: The song that is being searched for.
+
+        ### Returns
+        - The candidates built from their track details.
+        """
+
+        candidates = self.get_candidates(results, song)
+        tracks = run_parallel(
+            self.get_track, [result.result_id for result in candidates]
+        )
+
+        return [
+            Result(
+                source="bandcamp",
+                url=track.track_url,
+                verified=False,
+                name=track.track_title,
+                duration=track.track_duration_seconds,
+                author=track.artist_title,
+                result_id=track.track_url,
+                search_query=result.search_query,
+                album=track.album_title,
+                artists=tuple(track.artist_title.split(", ")),
+            )
+            for result, track in zip(candidates, tracks)
+            if track is not None
+        ]
+
+    def get_track(self, result_id: str) -> Optional[BandCampTrack]:
+        """
+        Get the details of a track.
+
+        ### Arguments
+        - result_id: The id of the search result, `<artist id>:<track id>`.
+
+        ### Returns
+        - The track or None if the details couldn't be fetched.
+        """
+
+        artist_id, track_id = (int(part) for part in result_id.split(":"))
+        key = (artist_id, track_id)
+
+        with self.track_cache_lock:
+            if key in self.track_cache:
+                return self.track_cache[key]
+
+        try:
+            track = BandCampTrack(artist_id, track_id)
+        except Exception as exc:
+            logger.debug("Could not get details of track %s: %s", result_id, exc)
+            return None
+
+        with self.track_cache_lock:
+            self.track_cache[key] = track
+
+        return track
@@ -5,9 +5,11 @@
 import logging
 import re
 import shlex
-from typing import Any, Dict, List, Optional, Tuple
-
-from yt_dlp import YoutubeDL
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
 
 from spotdl.types.result import Result
 from spotdl.types.song import Song
@@ -17,12 +19,29 @@
     create_search_query,
     create_song_title,
 )
-from spotdl.utils.matching import get_best_matches, order_results
-
-__all__ = ["AudioProviderError", "AudioProvider", "ISRC_REGEX", "YTDLLogger"]
+from spotdl.utils.http import run_blocking, run_sync
+from spotdl.utils.info_cache import get_info_cache
+from spotdl.utils.matching import filter_candidates, get_best_matches, order_results
+
+__all__ = [
+    "AudioProviderError",
+    "AudioProvider",
+    "ISRC_REGEX",
+    "VERIFIED_MIN_SCORE",
+    "YTDLLogger",
+    "run_parallel",
+    "DEFAULT_PARALLEL_WORKERS",
+]
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Every search runs its lookups on its own threads,
+# so the number of threads per search is kept small
+DEFAULT_PARALLEL_WORKERS = 4
+
 
 class AudioProviderError(Exception):
     """
@@ -30,6 +49,37 @@ class AudioProviderError(Exception):
     """
 
 
+def run_parallel(
+    func: Callable[[T], R],
+    items: List[T],
+    max_workers: int = DEFAULT_PARALLEL_WORKERS,
+) -> List[R]:
+    """
+    Run a blocking lookup for every item on a small thread pool.
+
+    ### Arguments
+    - func: The function to run.
+    - items: The items to run the function for.
+    - max_workers: Maximum number of threads.
+
+    ### Returns
+    - The return values, in the same order as the items.
+
+    ### Notes
+    - A separate executor is used, since the callers already run
+    on the shared http executor.
+    """
+
+    if len(items) <= 1:
+        return [func(item) for item in items]
+
+    with ThreadPoolExecutor(
+        max_workers=min(len(items), max_workers),
+        thread_name_prefix="spotdl-details",
+    ) as executor:
+        return list(executor.map(func, items))
+
+
 class YTDLLogger:
     """
     Custom YT-dlp logger.
@@ -59,6 +109,9 @@ def error(self, msg):
 
 ISRC_REGEX = re.compile(r"^[A-Z]{2}-?\w{3}-?\d{2}-?\d{5}$")
 
+# Verified results with at least this score are accepted without further searching
+VERIFIED_MIN_SCORE = 80
+
 
 class AudioProvider:
     """
@@ -69,6 +122,12 @@ class AudioProvider:
     SUPPORTS_ISRC: bool
     GET_RESULTS_OPTS: List[Dict[str, Any]]
 
+    # Search options used in adaptive mode, starting with the cheapest search
+    ADAPTIVE_RESULTS_OPTS: Optional[List[Dict[str, Any]]] = None
+
+    # Info dicts are cached per source, since the sources build different dicts
+    INFO_SOURCE = "yt-dlp"
+
     def __init__(
         self,
         output_format: str = "mp3",
@@ -76,6 +135,7 @@ def __init__(
         search_query: Optional[str] = None,
         filter_results: bool = True,
         yt_dlp_args: Optional[str] = None,
+        adaptive_search: bool = False,
     ) -> None:
         """
         Base class for audio providers.
@@ -86,12 +146,17 @@ def __init__(
         - cookie_file: The path to a file containing cookies to be used by YTDL.
         - search_query: The query to use when searching for songs.
         - filter_results: Whether to filter results.
+        - yt_dlp_args: Additional yt-dlp arguments.
+        - adaptive_search: Whether to use `ADAPTIVE_RESULTS_OPTS` if the provider has them.
         """
 
         self.output_format = output_format
         self.cookie_file = cookie_file
         self.search_query = search_query
         self.filter_results = filter_results
+        self.adaptive_search = adaptive_search
+        self.search_depths: "Counter[int]" = Counter()
+        self.search_depths_lock = threading.Lock()
 
         if self.output_format == "m4a":
             ytdl_format = "bestaudio[ext=m4a]/bestaudio/best"
@@ -117,7 +182,47 @@ def __init__(
                 shlex.split(yt_dlp_args), yt_dlp_options
             )
 
-        self.audio_handler = YoutubeDL(yt_dlp_options)
+        self.yt_dlp_options = yt_dlp_options
+        self.audio_handler = self.create_handler()
+
+        # yt-dlp handles are not thread safe, lookups that run
+        # on their own threads lease a handle of their own
+        self.idle_handlers: List[Any] = []
+        self.idle_handlers_lock = threading.Lock()
+
+    def create_handler(self) -> Any:
+        """
+        Create a new yt-dlp handle with the options of the provider.
+
+        ### Returns
+        - The new `YoutubeDL` instance.
+        """
+
+        # yt-dlp takes a long time to import, only do it when it's needed
+        from yt_dlp import YoutubeDL  # pylint: disable=import-outside-toplevel
+
+        return YoutubeDL(self.yt_dlp_options)
+
+    @contextmanager
+    def lease_handler(self) -> Iterator[Any]:
+        """
+        Lease a yt-dlp handle for the duration of the context.
+
+        ### Returns
+        - A handle that isn't used by any other thread.
+        """
+
+        with self.idle_handlers_lock:
+            handler = self.idle_handlers.pop() if self.idle_handlers else None
+
+        if handler is None:
+            handler = self.create_handler()
+
+        try:
+            yield handler
+        finally:
+            with self.idle_handlers_lock:
+                self.idle_handlers.append(handler)
 
     def get_results(self, search_term: str, **kwargs) -> List[Result]:
         """
@@ -133,6 +238,88 @@ def get_results(self, search_term: str, **kwargs) -> List[Result]:
 
         raise NotImplementedError
 
+    async def get_results_async(self, search_term: str, **kwargs) -> List[Result]:
+        """
+        Get results from audio provider without blocking the event loop.
+
+        ### Arguments
+        - search_term: The search term to use.
+        - kwargs: Additional arguments.
+
+        ### Returns
+        - A list of results.
+
+        ### Notes
+        - Runs `get_results` on the http executor by default,
+        providers with an asynchronous api can override this.
+        """
+
+        return await run_blocking(self.get_results, search_term, **kwargs)
+
+    def get_results_opts(self) -> List[Dict[str, Any]]:
+        """
+        Get the search options, they are tried in order until a confident match is found.
+
+        ### Returns
+        - The adaptive options in adaptive mode, `GET_RESULTS_OPTS` otherwise.
+        """
+
+        if self.adaptive_search and self.ADAPTIVE_RESULTS_OPTS:
+            return self.ADAPTIVE_RESULTS_OPTS
+
+        return self.GET_RESULTS_OPTS
+
+    def record_search_depth(self, song: Song, depth: int) -> None:
+        """
+        Record how many searches were needed to match the song.
+
+        ### Arguments
+        - song: The song that was searched for.
+        - depth: Number of search options that were tried, 0 for isrc matches.
+        """
+
+        logger.debug("[%s] Search depth: %s", song.song_id, depth)
+        with self.search_depths_lock:
+            self.search_depths[depth] += 1
+
+    def enrich_results(  # pylint: disable=unused-argument
+        self, results: List[Result], song: Song
+    ) -> List[Result]:
+        """
+        Fill in the details that are missing from the search results.
+
+        ### Arguments
+        - results: The results returned by `get_results`.
+        - song: The song that is being searched for.
+
+        ### Returns
+        - The results that should be matched against the song.
+
+        ### Notes
+        - Providers whose search payload lacks details override this,
+        the default implementation returns the results unchanged.
+        """
+
+        return results
+
+    def get_candidates(self, results: List[Result], song: Song) -> List[Result]:
+        """
+        Get the results that are worth fetching the details for.
+
+        ### Arguments
+        - results: The results returned by `get_results`.
+        - song: The song that is being searched for.
+
+        ### Returns
+        - The results that pass the cheap first pass of the matching,
+        or only the first result if the results are not filtered.
+        """
+
+        if not self.filter_results:
+            return results[:1]
+
+        return filter_candidates(results, song, self.search_query)
+
     def get_views(self, url: str) -> int:
         """
         Get the number of views for a video.
@@ -144,9 +331,11 @@ def get_views(self, url: str) -> int:
         - The number of views.
         """
 
-        data = self.get_download_metadata(url)
+        # Views are fetched in parallel, see `get_best_result`
+        with self.lease_handler() as handler:
+            data = self.get_info(url, handler)
 
-        return data["view_count"]
+        return data.get("view_count") or 0
 
     def search(self, song: Song, only_verified: bool = False) -> Optional[str]:
         """
@@ -154,170 +343,249 @@ def search(self, song: Song, only_verified: bool = False) -> Optional[str]:
 
         ### Arguments
         - song: The song to search for.
+        - only_verified: Whether to only return verified results.
 
         ### Returns
         - The url of the best match or None if no match was found.
         """
 
-        # Create initial search query
-        search_query = create_song_title(song.name, song.artists).lower()
-        if self.search_query:
-            search_query = create_search_query(
-                song, self.search_query, False, None, True
-            )
+        match = self.find_match(song, only_verified)
+        if match is None:
+            return None
 
-        logger.debug("[%s] Searching for %s", song.song_id, search_query)
+        return match[0].url
 
-        isrc_urls: List[str] = []
+    async def search_async(
+        self, song: Song, only_verified: bool = False
+    ) -> Optional[str]:
+        """
+        Search for a song and return best match, asynchronously.
 
-        # search for song using isrc if it's available
-        if song.isrc and self.SUPPORTS_ISRC and not self.search_query:
-            isrc_results = self.get_results(song.isrc)
+        ### Arguments
+        - song: The song to search for.
+        - only_verified: Whether to only return verified results.
 
-            if only_verified:
-                isrc_results = [result for result in isrc_results if result.verified]
-                logger.debug(
-                    "[%s] Filtered to %s verified ISRC results",
-                    song.song_id,
-                    len(isrc_results),
-                )
+        ### Returns
+        - The url of the best match or None if no match was found.
+        """
 
-            isrc_urls = [result.url for result in isrc_results]
-            logger.debug(
-                "[%s] Found %s results for ISRC %s",
-                song.song_id,
-                len(isrc_results),
-                song.isrc,
-            )
+        match = await self.find_match_async(song, only_verified)
+        if match is None:
+            return None
 
-            if len(isrc_results) == 1 and isrc_results[0].verified:
-                # If we only have one verified result, return it
-                # What's the chance of it being wrong?
-                logger.debug(
-                    "[%s] Returning only ISRC result %s",
-                    song.song_id,
-                    isrc_results[0].url,
-                )
+        return match[0].url
 
-                return isrc_results[0].url
+    def find_match(
+        self, song: Song, only_verified: bool = False
+    ) -> Optional[Tuple[Result, float]]:
+        """
+        Search for a song and return best match together with its score.
 
-            if len(isrc_results) > 0:
-                sorted_isrc_results = order_results(
-                    isrc_results, song, self.search_query
-                )
+        ### Arguments
+        - song: The song to search for.
+        - only_verified: Whether to only return verified results.
+
+        ### Returns
+        - A tuple with the best match and its score or None if no match was found.
+
+        ### Notes
+        - This is a synchronous wrapper around `find_match_async`,
+        it can't be called from a running event loop.
+        """
+
+        return run_sync(self.find_match_async(song, only_verified))
 
-                # get the best result, if the score is above 80 return it
-                best_isrc_results = sorted(
-                    sorted_isrc_results.items(), key=lambda x: x[1], reverse=True
+    async def find_match_async(
+        self, song: Song, only_verified: bool = False
+    ) -> Optional[Tuple[Result, float]]:
+        """
+        Search for a song and return best match together with its score, asynchronously.
+
+        ### Arguments
+        - song: The song to search for.
+        - only_verified: Whether to only return verified results.
+
+        ### Returns
+        - A tuple with the best match and its score or None if no match was found.
+        """
+
+        # Number of search options that were tried, reported as telemetry
+        depth = 0
+        try:
+            # Create initial search query
+            search_query = create_song_title(song.name, song.artists).lower()
+            if self.search_query:
+                search_query = create_search_query(
+                    song, self.search_query, False, None, True
                 )
 
+            logger.debug("[%s] Searching for %s", song.song_id, search_query)
+
+            isrc_urls: List[str] = []
+
+            # search for song using isrc if it's available
+            if song.isrc and self.SUPPORTS_ISRC and not self.search_query:
+                isrc_results = await self.get_results_async(song.isrc)
+
+                if only_verified:
+                    isrc_results = [
+                        result for result in isrc_results if result.verified
+                    ]
+                    logger.debug(
+                        "[%s] Filtered to %s verified ISRC results",
+                        song.song_id,
+                        len(isrc_results),
+                    )
+
+                isrc_urls = [result.url for result in isrc_results]
                 logger.debug(
-                    "[%s] Filtered to %s ISRC results",
+                    "[%s] Found %s results for ISRC %s",
                     song.song_id,
-                    len(best_isrc_results),
+                    len(isrc_results),
+                    song.isrc,
                 )
 
-                if len(best_isrc_results) > 0:
-                    best_isrc = best_isrc_results[0]
-                    if best_isrc[1] > 80.0:
-                        logger.debug(
-                            "[%s] Best ISRC result is %s with score %s",
-                            song.song_id,
-                            best_isrc[0].url,
-                            best_isrc[1],
-                        )
+                if len(isrc_results) == 1 and isrc_results[0].verified:
+                    # If we only have one verified result, return it
+                    # What's the chance of it being wrong?
+                    logger.debug(
+                        "[%s] Returning only ISRC result %s",
+                        song.song_id,
+                        isrc_results[0].url,
+                    )
 
-                        return best_isrc[0].url
+                    return isrc_results[0], 100.0
 
-        results: Dict[Result, float] = {}
-        for options in self.GET_RESULTS_OPTS:
-            # Query YTM by songs only first, this way if we get correct result on the first try
-            # we don't have to make another request
-            search_results = self.get_results(search_query, **options)
+                if len(isrc_results) > 0:
+                    sorted_isrc_results = order_results(
+                        isrc_results, song, self.search_query
+                    )
 
-            if only_verified:
-                search_results = [
-                    result for result in search_results if result.verified
-                ]
+                    # get the best result, if the score is above 80 return it
+                    best_isrc_results = sorted(
+                        sorted_isrc_results.items(), key=lambda x: x[1], reverse=True
+                    )
 
-            logger.debug(
-                "[%s] Found %s results for search query %s with options %s",
-                song.song_id,
-                len(search_results),
-                search_query,
-                options,
-            )
+                    logger.debug(
+                        "[%s] Filtered to %s ISRC results",
+                        song.song_id,
+                        len(best_isrc_results),
+                    )
 
-            # Check if any of the search results is in the
-            # first isrc results, since they are not hashable we have to check
-            # by name
-            isrc_result = next(
-                (result for result in search_results if result.url in isrc_urls),
-                None,
-            )
+                    if len(best_isrc_results) > 0:
+                        best_isrc = best_isrc_results[0]
+                        if best_isrc[1] > 80.0:
+                            logger.debug(
+                                "[%s] Best ISRC result is %s with score %s",
+                                song.song_id,
+                                best_isrc[0].url,
+                                best_isrc[1],
+                            )
+
+                            return best_isrc[0], best_isrc[1]
+
+            results: Dict[Result, float] = {}
+            for depth, options in enumerate(self.get_results_opts(), 1):
+                # Query YTM by songs only first, this way if we get correct result on the first try
+                # we don't have to make another request
+                search_results = await self.get_results_async(search_query, **options)
+
+                if only_verified:
+                    search_results = [
+                        result for result in search_results if result.verified
+                    ]
+
+                # Details missing from the search payload are only fetched
+                # for the results that can still be matched
+                search_results = await run_blocking(
+                    self.enrich_results, search_results, song
+                )
 
-            if isrc_result:
                 logger.debug(
-                    "[%s] Best ISRC result is %s", song.song_id, isrc_result.url
+                    "[%s] Found %s results for search query %s with options %s",
+                    song.song_id,
+                    len(search_results),
+                    search_query,
+                    options,
                 )
 
-                return isrc_result.url
+                # Check if any of the search results is in the
+                # first isrc results, since they are not hashable we have to check
+                # by name
+                isrc_result = next(
+                    (result for result in search_results if result.url in isrc_urls),
+                    None,
+                )
 
-            logger.debug(
-                "[%s] Have to filter results: %s", song.song_id, self.filter_results
-            )
+                if isrc_result:
+                    logger.debug(
+                        "[%s] Best ISRC result is %s", song.song_id, isrc_result.url
+                    )
+
+                    return isrc_result, 100.0
 
-            if self.filter_results:
-                # Order results
-                new_results = order_results(search_results, song, self.search_query)
-            else:
-                new_results = {}
-                if len(search_results) > 0:
-                    new_results = {search_results[0]: 100.0}
-
-            logger.debug("[%s] Filtered to %s results", song.song_id, len(new_results))
-
-            # song type results are always more accurate than video type,
-            # so if we get score of 80 or above
-            # we are almost 100% sure that this is the correct link
-            if len(new_results) != 0:
-                # get the result with highest score
-                best_result, best_score = self.get_best_result(new_results)
                 logger.debug(
-                    "[%s] Best result is %s with score %s",
-                    song.song_id,
-                    best_result.url,
-                    best_score,
+                    "[%s] Have to filter results: %s", song.song_id, self.filter_results
+                )
+
+                if self.filter_results:
+                    # Order results
+                    new_results = order_results(search_results, song, self.search_query)
+                else:
+                    new_results = {}
+                    if len(search_results) > 0:
+                        new_results = {search_results[0]: 100.0}
+
+                logger.debug(
+                    "[%s] Filtered to %s results", song.song_id, len(new_results)
                 )
 
-                if best_score >= 80 and best_result.verified:
+                # song type results are always more accurate than video type,
+                # so if we get score of 80 or above
+                # we are almost 100% sure that this is the correct link
+                if len(new_results) != 0:
+                    # get the result with highest score
+                    # Views might have to be fetched to pick the best result
+                    best_result, best_score = await run_blocking(
+                        self.get_best_result, new_results
+                    )
                     logger.debug(
-                        "[%s] Returning verified best result %s with score %s",
+                        "[%s] Best result is %s with score %s",
                         song.song_id,
                         best_result.url,
                         best_score,
                     )
 
-                    return best_result.url
+                    if best_score >= VERIFIED_MIN_SCORE and best_result.verified:
+                        logger.debug(
+                            "[%s] Returning verified best result %s with score %s",
+                            song.song_id,
+                            best_result.url,
+                            best_score,
+                        )
 
-                # Update final results with new results
-                results.update(new_results)
+                        return best_result, best_score
 
-        # No matches found
-        if not results:
-            logger.debug("[%s] No results found", song.song_id)
-            return None
+                    # Update final results with new results
+                    results.update(new_results)
 
-        # get the result with highest score
-        best_result, best_score = self.get_best_result(results)
-        logger.debug(
-            "[%s] Returning best result %s with score %s",
-            song.song_id,
-            best_result.url,
-            best_score,
-        )
+            # No matches found
+            if not results:
+                logger.debug("[%s] No results found", song.song_id)
+                return None
 
-        return best_result.url
+            # get the result with highest score
+            best_result, best_score = await run_blocking(self.get_best_result, results)
+            logger.debug(
+                "[%s] Returning best result %s with score %s",
+                song.song_id,
+                best_result.url,
+                best_score,
+            )
+
+            return best_result, best_score
+        finally:
+            self.record_search_depth(song, depth)
 
     def get_best_result(self, results: Dict[Result, float]) -> Tuple[Result, float]:
         """
@@ -349,16 +617,22 @@ def get_best_result(self, results: Dict[Result, float]) -> Tuple[Result, float]:
         # return the one with the highest score
         # and most views
         if len(best_results) > 1:
-            views: List[int] = []
-            for best_result in best_results:
-                if best_result[0].views:
-                    views.append(best_result[0].views)
-                else:
-                    views.append(self.get_views(best_result[0].url))
+            # Views of the results that don't have them are fetched in parallel
+            missing_views = [
+                result.url for result, _ in best_results if not result.views
+            ]
+            fetched_views = dict(
+                zip(missing_views, run_parallel(self.get_views, missing_views))
+            )
+
+            views: List[int] = [
+                result.views or fetched_views[result.url] for result, _ in best_results
+            ]
 
             highest_views = max(views)
             lowest_views = min(views)
 
+            # Views can't tell the results apart, keep the best scored result
             if highest_views in (0, lowest_views):
                 return best_result[0], best_result[1]
 
@@ -376,6 +650,36 @@ def get_best_result(self, results: Dict[Result, float]) -> Tuple[Result, float]:
 
         return best_result[0], best_result[1]
 
+    def get_info(self, url: str, audio_handler: Any = None) -> Dict:
+        """
+        Get the unprocessed yt-dlp info dict, using the shared info cache.
+
+        ### Arguments
+        - url: The url to get the info for.
+        - audio_handler: The yt-dlp handle to extract the info with,
+        `self.audio_handler` by default.
+
+        ### Returns
+        - A copy of the info dict, formats are not selected yet.
+        """
+
+        handler = audio_handler or self.audio_handler
+
+        try:
+            data = get_info_cache().get_or_fetch(
+                url,
+                lambda url: handler.extract_info(url, download=False, process=False),
+                source=self.INFO_SOURCE,
+            )
+
+            if data:
+                return data
+        except Exception as exception:
+            logger.debug(exception)
+            raise AudioProviderError(f"YT-DLP download error - {url}") from exception
+
+        raise AudioProviderError(f"No metadata found for the provided url {url}")
+
     def get_download_metadata(self, url: str, download: bool = False) -> Dict:
         """
         Get metadata for a download using yt-dlp.
@@ -385,10 +689,15 @@ def get_download_metadata(self, url: str, download: bool = False) -> Dict:
 
         ### Returns
         - A dictionary containing the metadata.
+
+        ### Notes
+        - The info extracted during the search is reused if it's still cached.
         """
 
+        info = self.get_info(url)
+
         try:
-            data = self.audio_handler.extract_info(url, download=download)
+            data = self.audio_handler.process_ie_result(info, download=download)
 
             if data:
                 return data
@@ -4,9 +4,10 @@
 
 import logging
 import shlex
+import threading
+from collections import Counter
 from typing import Any, Dict, List, Optional
 
-import requests
 from yt_dlp import YoutubeDL
 
 from spotdl.providers.audio.base import (
@@ -16,8 +17,10 @@
     YTDLLogger,
 )
 from spotdl.types.result import Result
-from spotdl.utils.config import GlobalConfig, get_temp_path
+from spotdl.utils.config import get_temp_path
 from spotdl.utils.formatter import args_to_ytdlp_options
+from spotdl.utils.http import SharedSession, get_session
+from spotdl.utils.info_cache import get_info_cache
 
 __all__ = ["Piped"]
 logger = logging.getLogger(__name__)
@@ -33,6 +36,7 @@ class Piped(AudioProvider):
     """
 
     SUPPORTS_ISRC = True
+    INFO_SOURCE = "piped"
     GET_RESULTS_OPTS: List[Dict[str, Any]] = [
         {"filter": "music_songs"},
         {"filter": "music_videos"},
@@ -45,6 +49,7 @@ def __init__(  # pylint: disable=super-init-not-called
         search_query: Optional[str] = None,
         filter_results: bool = True,
         yt_dlp_args: Optional[str] = None,
+        adaptive_search: bool = False,
     ) -> None:
         """
         Pipe audio provider class
@@ -55,12 +60,17 @@ def __init__(  # pylint: disable=super-init-not-called
         - cookie_file: The path to a file containing cookies to be used by YTDL.
         - search_query: The query to use when searching for songs.
         - filter_results: Whether to filter results.
+        - yt_dlp_args: Additional yt-dlp arguments.
+        - adaptive_search: Piped has no adaptive search options, the flag is ignored.
         """
 
         self.output_format = output_format
         self.cookie_file = cookie_file
         self.search_query = search_query
         self.filter_results = filter_results
+        self.adaptive_search = adaptive_search
+        self.search_depths: "Counter[int]" = Counter()
+        self.search_depths_lock = threading.Lock()
 
         if self.output_format == "m4a":
             ytdl_format = "best[ext=m4a]/best"
@@ -84,8 +94,11 @@ def __init__(  # pylint: disable=super-init-not-called
             user_options = args_to_ytdlp_options(shlex.split(yt_dlp_args))
             yt_dlp_options.update(user_options)
 
+        self.yt_dlp_options = yt_dlp_options
         self.audio_handler = YoutubeDL(yt_dlp_options)
-        self.session = requests.Session()
+        self.idle_handlers: List[Any] = []
+        self.idle_handlers_lock = threading.Lock()
+        self.session = SharedSession()
 
     def get_results(self, search_term: str, **kwargs) -> List[Result]:
         """
@@ -149,22 +162,55 @@ def get_results(self, search_term: str, **kwargs) -> List[Result]:
 
         return results
 
-    def get_download_metadata(self, url: str, download: bool = False) -> Dict:
+    def get_info(  # pylint: disable=unused-argument
+        self, url: str, audio_handler: Any = None
+    ) -> Dict:
         """
-        Get metadata for a download using yt-dlp.
+        Get the unprocessed info dict from the Piped API, using the shared info cache.
 
         ### Arguments
-        - url: The url to get metadata for.
+        - url: The url to get the info for.
+        - audio_handler: Unused, the info comes from the Piped API.
 
         ### Returns
-        - A dictionary containing the metadata.
+        - A copy of the info dict, formats are not selected yet.
+        """
+
+        return get_info_cache().get_or_fetch(  # type: ignore
+            url, self.get_piped_info, source=self.INFO_SOURCE
+        )
+
+    def get_views(self, url: str) -> int:
+        """
+        Get the number of views for a video.
+
+        ### Arguments
+        - url: The url of the video.
+
+        ### Returns
+        - The number of views.
+
+        ### Notes
+        - The Piped API is thread safe, so no yt-dlp handle is leased.
+        """
+
+        return self.get_info(url).get("view_count") or 0
+
+    def get_piped_info(self, url: str) -> Dict:
+        """
+        Get the stream info from the Piped API in the yt-dlp format.
+
+        ### Arguments
+        - url: The url to get the info for.
+
+        ### Returns
+        - The unprocessed info dict.
         """
 
         url_id = url.split("?v=")[1]
-        piped_response = requests.get(
+        piped_response = get_session().get(
             f"https://piped.video/streams/{url_id}",
             timeout=10,
-            proxies=GlobalConfig.get_parameter("proxies"),
         )
 
         if piped_response.status_code != 200:
@@ -192,4 +238,19 @@ def get_download_metadata(self, url: str, download: bool = False) -> Dict:
                 }
             )
 
-        return self.audio_handler.process_video_result(yt_dlp_json, download=download)
+        return yt_dlp_json
+
+    def get_download_metadata(self, url: str, download: bool = False) -> Dict:
+        """
+        Get metadata for a download using yt-dlp.
+
+        ### Arguments
+        - url: The url to get metadata for.
+
+        ### Returns
+        - A dictionary containing the metadata.
+        """
+
+        return self.audio_handler.process_video_result(
+            self.get_info(url), download=download
+        )
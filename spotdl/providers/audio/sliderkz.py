@@ -5,11 +5,9 @@
 import logging
 from typing import Any, Dict, List
 
-import requests
-
 from spotdl.providers.audio.base import AudioProvider
 from spotdl.types.result import Result
-from spotdl.utils.config import GlobalConfig
+from spotdl.utils.http import get_session
 
 __all__ = ["SliderKZ"]
 
@@ -50,11 +48,10 @@ def get_results(self, search_term: str, *_args, **_kwargs) -> List[Result]:
 
         while not search_results and max_retries < 3:
             try:
-                search_response = requests.get(
+                search_response = get_session().get(
                     url="https://hayqbhgr.slider.kz/vk_auth.php?q=" + search_term,
                     headers=HEADERS,
                     timeout=5,
-                    proxies=GlobalConfig.get_parameter("proxies"),
                 )
 
                 # Check if the response is valid
@@ -4,14 +4,17 @@
 
 import logging
 import re
+import threading
+from dataclasses import replace
 from itertools import islice
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from soundcloud import SoundCloud as SoundCloudClient
 from soundcloud.resource.track import Track
 
-from spotdl.providers.audio.base import AudioProvider
+from spotdl.providers.audio.base import AudioProvider, run_parallel
 from spotdl.types.result import Result
+from spotdl.types.song import Song
 
 __all__ = ["SoundCloud"]
 
@@ -38,6 +41,10 @@ def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
         self.client = SoundCloudClient()
 
+        # Album lookups are cached by track id
+        self.album_cache: Dict[str, Optional[str]] = {}
+        self.album_cache_lock = threading.Lock()
+
     def get_results(self, search_term: str, *_args, **_kwargs) -> List[Result]:
         """
         Get results from slider.kz
@@ -68,13 +75,7 @@ def get_results(self, search_term: str, *_args, **_kwargs) -> List[Result]:
             if "/preview/" in result.media.transcodings[0].url:
                 continue
 
-            album = self.client.get_track_albums(result.id)
-
-            try:
-                album_name = next(album).title
-            except StopIteration:
-                album_name = None
-
+            # Albums are fetched later, only for the results that can be matched
             simplified_results.append(
                 Result(
                     source="soundcloud",
@@ -88,8 +89,59 @@ def get_results(self, search_term: str, *_args, **_kwargs) -> List[Result]:
                     search_query=search_term,
                     views=result.playback_count,
                     explicit=False,
-                    album=album_name,
                 )
             )
 
         return simplified_results
+
+    def enrich_results(self, results: List[Result], song: Song) -> List[Result]:
+        """
+        Fetch the albums of the results that pass the first matching pass.
+
+        ### Arguments
+        - results: The results returned by `get_results`.
+        - song: The song that is being searched for.
+
+        ### Returns
+        - The candidates with their albums filled in.
+        """
+
+        candidates = self.get_candidates(results, song)
+        albums = run_parallel(
+            self.get_album, [result.result_id for result in candidates]
+        )
+
+        return [
+            replace(result, album=album) for result, album in zip(candidates, albums)
+        ]
+
+    def get_album(self, track_id: str) -> Optional[str]:
+        """
+        Get the name of the first album that contains the track.
+
+        ### Arguments
+        - track_id: The SoundCloud id of the track.
+
+        ### Returns
+        - The album name or None if the track isn't in any album.
+        """
+
+        with self.album_cache_lock:
+            if track_id in self.album_cache:
+                return self.album_cache[track_id]
+
+        try:
+            album_name: Optional[str] = next(
+                self.client.get_track_albums(int(track_id))
+            ).title
+        except StopIteration:
+            album_name = None
+        except Exception as exc:
+            # The album only improves the match, so the result is kept without it
+            logger.debug("Could not get albums of track %s: %s", track_id, exc)
+            return None
+
+        with self.album_cache_lock:
+            self.album_cache[track_id] = album_name
+
+        return album_name
@@ -2,16 +2,22 @@
 YTMusic module for downloading and searching songs.
 """
 
-from typing import Any, Dict, List
+import logging
+from typing import Any, Dict, List, Optional, Tuple
 
 from ytmusicapi import YTMusic
 
-from spotdl.providers.audio.base import ISRC_REGEX, AudioProvider
+from spotdl.providers.audio.base import ISRC_REGEX, VERIFIED_MIN_SCORE, AudioProvider
 from spotdl.types.result import Result
-from spotdl.utils.formatter import parse_duration
+from spotdl.types.song import Song
+from spotdl.utils.formatter import parse_duration, ratio, slugify
+from spotdl.utils.http import SharedSession
+from spotdl.utils.matching import order_results
 
 __all__ = ["YouTubeMusic"]
 
+logger = logging.getLogger(__name__)
+
 
 class YouTubeMusic(AudioProvider):
     """
@@ -24,6 +30,14 @@ class YouTubeMusic(AudioProvider):
         {"filter": "videos", "ignore_spelling": True, "limit": 50},
     ]
 
+    # Most songs are matched by the first few song results,
+    # so the search only goes deeper when they don't contain a confident match
+    ADAPTIVE_RESULTS_OPTS: List[Dict[str, Any]] = [
+        {"filter": "songs", "ignore_spelling": True, "limit": 10},
+        {"filter": "songs", "ignore_spelling": True, "limit": 50},
+        {"filter": "videos", "ignore_spelling": True, "limit": 50},
+    ]
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """
         Initialize the YouTube Music API
@@ -35,7 +49,7 @@ def __init__(self, *args: Any, **kwargs: Any) -> None:
 
         super().__init__(*args, **kwargs)
 
-        self.client = YTMusic(language="de")
+        self.client = YTMusic(language="de", requests_session=SharedSession())
 
     def get_results(self, search_term: str, **kwargs) -> List[Result]:
         """
@@ -91,3 +105,127 @@ def get_results(self, search_term: str, **kwargs) -> List[Result]:
             )
 
         return results
+
+    def match_album(self, songs: List[Song]) -> Dict[str, Tuple[Result, float]]:
+        """
+        Match the songs of one album against a single YouTube Music album.
+        The album is searched once and the tracklists are aligned locally.
+
+        ### Arguments
+        - songs: Songs of the same album.
+
+        ### Returns
+        - Dictionary of song urls and their matches with the match score,
+        songs that couldn't be aligned are missing and have to be searched one by one.
+        """
+
+        if not songs or not songs[0].album_name:
+            return {}
+
+        try:
+            tracks = self.get_album_tracks(songs[0])
+        except Exception as exc:
+            logger.debug("Could not match album %s: %s", songs[0].album_name, exc)
+            return {}
+
+        matches: Dict[str, Tuple[Result, float]] = {}
+        used_tracks = set()
+        for song in songs:
+            if not song.url:
+                continue
+
+            scores = order_results(
+                [track for track in tracks if track.result_id not in used_tracks],
+                song,
+                self.search_query,
+            )
+
+            # Tracks at the same position are preferred over similar ones,
+            # e.g. when the album contains multiple versions of a song
+            candidates = sorted(
+                scores.items(),
+                key=lambda item, song=song: item[1]
+                + (10 if item[0].track_number == song.track_number else 0),
+                reverse=True,
+            )
+
+            if candidates and candidates[0][1] >= VERIFIED_MIN_SCORE:
+                result, score = candidates[0]
+                used_tracks.add(result.result_id)
+                matches[song.url] = (result, score)
+
+        logger.debug(
+            "Aligned %d of %d songs with album %s",
+            len(matches),
+            len(songs),
+            songs[0].album_name,
+        )
+
+        return matches
+
+    def get_album_tracks(self, song: Song) -> List[Result]:
+        """
+        Find the YouTube Music album of the song and get its tracks.
+
+        ### Arguments
+        - song: A song of the album.
+
+        ### Returns
+        - The tracks of the album, empty if no matching album was found.
+        """
+
+        album_artist = song.album_artist or song.artist
+        album_results = self.client.search(
+            f"{album_artist} - {song.album_name}",
+            filter="albums",
+            ignore_spelling=True,
+            limit=10,
+        )
+
+        best_album: Optional[Dict[str, Any]] = None
+        best_score = 0.0
+        for album in album_results:
+            if not album.get("browseId") or not album.get("artists"):
+                continue
+
+            name_match = ratio(slugify(album["title"]), slugify(song.album_name))
+            artist_match = max(
+                ratio(slugify(artist["name"]), slugify(album_artist))
+                for artist in album["artists"]
+            )
+
+            score = (name_match + artist_match) / 2
+            if score > best_score:
+                best_album, best_score = album, score
+
+        if best_album is None or best_score < VERIFIED_MIN_SCORE:
+            logger.debug("No YouTube Music album found for %s", song.album_name)
+            return []
+
+        album = self.client.get_album(best_album["browseId"])
+
+        tracks = []
+        for track in album["tracks"]:
+            if not track.get("videoId") or track.get("isAvailable") is False:
+                continue
+
+            artists = track.get("artists") or album["artists"]
+            tracks.append(
+                Result(
+                    source=self.name,
+                    url=f"https://music.youtube.com/watch?v={track['videoId']}",
+                    verified=True,
+                    name=track["title"],
+                    result_id=track["videoId"],
+                    author=artists[0]["name"],
+                    artists=tuple(artist["name"] for artist in artists),
+                    duration=track.get("duration_seconds") or 0,
+                    isrc_search=False,
+                    search_query=f"{album_artist} - {song.album_name}",
+                    explicit=track.get("isExplicit"),
+                    album=album["title"],
+                    track_number=track.get("trackNumber"),
+                )
+            )
+
+        return tracks
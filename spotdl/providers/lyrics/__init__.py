@@ -1,11 +1,39 @@
 """
 Lyrics providers for spotdl.
+The providers are imported on first access, see `spotdl.providers.LYRICS_PROVIDERS`.
 """
 
-from spotdl.providers.lyrics.azlyrics import AzLyrics
-from spotdl.providers.lyrics.base import LyricsProvider
-from spotdl.providers.lyrics.genius import Genius
-from spotdl.providers.lyrics.musixmatch import MusixMatch
-from spotdl.providers.lyrics.synced import Synced
+from typing import TYPE_CHECKING, Any
+
+from spotdl.utils.lazy import import_object
+
+if TYPE_CHECKING:
+    from spotdl.providers.lyrics.azlyrics import AzLyrics
+    from spotdl.providers.lyrics.base import LyricsProvider
+    from spotdl.providers.lyrics.genius import Genius
+    from spotdl.providers.lyrics.musixmatch import MusixMatch
+    from spotdl.providers.lyrics.synced import Synced
 
 __all__ = ["AzLyrics", "Genius", "MusixMatch", "Synced", "LyricsProvider"]
+
+_LAZY_ATTRIBUTES = {
+    "AzLyrics": "spotdl.providers.lyrics.azlyrics:AzLyrics",
+    "Genius": "spotdl.providers.lyrics.genius:Genius",
+    "MusixMatch": "spotdl.providers.lyrics.musixmatch:MusixMatch",
+    "Synced": "spotdl.providers.lyrics.synced:Synced",
+    "LyricsProvider": "spotdl.providers.lyrics.base:LyricsProvider",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import the providers on first access.
+    """
+
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = import_object(_LAZY_ATTRIBUTES[name])
+    globals()[name] = value
+
+    return value
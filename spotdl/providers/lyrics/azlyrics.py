@@ -9,6 +9,7 @@
 from bs4 import BeautifulSoup, Tag
 
 from spotdl.providers.lyrics.base import LyricsProvider
+from spotdl.utils.http import SharedSession
 
 __all__ = ["AzLyrics"]
 logger = logging.getLogger(__name__)
@@ -23,27 +24,25 @@ class AzLyrics(LyricsProvider):
     def __init__(self):
         super().__init__()
 
-        self.session = requests.Session()
-        self.session.headers.update(
-            {
-                "Host": "www.azlyrics.com",
-                "User-Agent": (
-                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-                    "(KHTML, like Gecko) Chrome/96.0.4664.110 Safari/537.36"
-                ),
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-                "Accept-Language": "en-US,en;q=0.5",
-                "Accept-Encoding": "gzip, deflate, br, zstd",
-                "DNT": "1",
-                "Connection": "keep-alive",
-                "Upgrade-Insecure-Requests": "1",
-                "Sec-Fetch-Dest": "document",
-                "Sec-Fetch-Mode": "navigate",
-                "Sec-Fetch-Site": "none",
-                "Sec-Fetch-User": "?1",
-                "Priority": "u=0, i",
-            }
-        )
+        self.session = SharedSession()
+        self.headers = {
+            "Host": "www.azlyrics.com",
+            "User-Agent": (
+                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                "(KHTML, like Gecko) Chrome/96.0.4664.110 Safari/537.36"
+            ),
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+            "Accept-Language": "en-US,en;q=0.5",
+            "Accept-Encoding": "gzip, deflate, br, zstd",
+            "DNT": "1",
+            "Connection": "keep-alive",
+            "Upgrade-Insecure-Requests": "1",
+            "Sec-Fetch-Dest": "document",
+            "Sec-Fetch-Mode": "navigate",
+            "Sec-Fetch-Site": "none",
+            "Sec-Fetch-User": "?1",
+            "Priority": "u=0, i",
+        }
 
         self.x_code = self._get_x_code()
 
@@ -75,7 +74,10 @@ def get_results(self, name: str, artists: List[str], **_) -> Dict[str, str]:
         for i in range(4):  # Retry up to 4 times
             try:
                 response = self.session.get(
-                    "https://www.azlyrics.com/search/", params=params
+                    "https://www.azlyrics.com/search/",
+                    params=params,
+                    headers=self.headers,
+                    timeout=10,
                 )
 
                 if not response.ok:
@@ -134,7 +136,7 @@ def extract_lyrics(self, url: str, **_) -> Optional[str]:
         - The lyrics of the song or None if no lyrics were found.
         """
 
-        response = self.session.get(url)
+        response = self.session.get(url, headers=self.headers, timeout=10)
         soup = BeautifulSoup(response.content, "html.parser")
 
         # Find all divs that don't have a class
@@ -161,9 +163,13 @@ def _get_x_code(self) -> Optional[str]:
         js_code = None
 
         try:
-            self.session.get("https://www.azlyrics.com/")
+            self.session.get(
+                "https://www.azlyrics.com/", headers=self.headers, timeout=10
+            )
 
-            resp = self.session.get("https://www.azlyrics.com/geo.js")
+            resp = self.session.get(
+                "https://www.azlyrics.com/geo.js", headers=self.headers, timeout=10
+            )
             js_code = resp.text
 
             # /geo.js returns a JS script, in which that 'x' code is located. e.g.
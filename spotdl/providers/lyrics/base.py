@@ -6,6 +6,7 @@
 from typing import Dict, List, Optional
 
 from spotdl.utils.formatter import ratio, slugify
+from spotdl.utils.http import run_blocking
 from spotdl.utils.matching import based_sort
 
 __all__ = ["LyricsProvider"]
@@ -17,6 +18,9 @@ class LyricsProvider:
     Base class for all other lyrics providers.
     """
 
+    # Number of seconds after which the downloader stops waiting for the provider
+    TIMEOUT = 20
+
     def __init__(self):
         """
         Init the lyrics provider searchand set headers.
@@ -65,6 +69,41 @@ def extract_lyrics(self, url: str, **kwargs) -> Optional[str]:
 
         raise NotImplementedError
 
+    async def get_results_async(
+        self, name: str, artists: List[str], **kwargs
+    ) -> Dict[str, str]:
+        """
+        Returns the results for the given song without blocking the event loop.
+
+        ### Arguments
+        - name: The name of the song.
+        - artists: The artists of the song.
+        - kwargs: Additional arguments.
+
+        ### Returns
+        - A dictionary with the results. (The key is the title and the value is the url.)
+
+        ### Notes
+        - Runs `get_results` on the http executor by default,
+        providers with an asynchronous api can override this.
+        """
+
+        return await run_blocking(self.get_results, name, artists, **kwargs)
+
+    async def extract_lyrics_async(self, url: str, **kwargs) -> Optional[str]:
+        """
+        Extracts the lyrics from the given url without blocking the event loop.
+
+        ### Arguments
+        - url: The url to extract the lyrics from.
+        - kwargs: Additional arguments.
+
+        ### Returns
+        - The lyrics of the song or None if no lyrics were found.
+        """
+
+        return await run_blocking(self.extract_lyrics, url, **kwargs)
+
     def get_lyrics(self, name: str, artists: List[str], **kwargs) -> Optional[str]:
         """
         Returns the lyrics for the given song.
@@ -77,6 +116,7 @@ def get_lyrics(self, name: str, artists: List[str], **kwargs) -> Optional[str]:
         ### Returns
         - The lyrics of the song or None if no lyrics were found.
         """
+
         try:
             results = self.get_results(name, artists, **kwargs)
         except Exception as exc:
@@ -89,6 +129,60 @@ def get_lyrics(self, name: str, artists: List[str], **kwargs) -> Optional[str]:
             )
             return None
 
+        url = self.get_best_url(name, artists, results)
+        if url is None:
+            return None
+
+        try:
+            return self.extract_lyrics(url, **kwargs)
+        except Exception as exc:
+            logger.debug(
+                "%s: Failed to extract lyrics from %s: %s", self.name, url, exc
+            )
+            return None
+
+    async def get_lyrics_async(
+        self, name: str, artists: List[str], **kwargs
+    ) -> Optional[str]:
+        """
+        Returns the lyrics for the given song, asynchronously.
+
+        ### Arguments
+        - name: The name of the song.
+        - artists: The artists of the song.
+        - kwargs: Additional arguments.
+
+        ### Returns
+        - The lyrics of the song or None if no lyrics were found.
+
+        ### Notes
+        - Unlike `get_lyrics`, errors are raised, so the caller can tell
+        a provider that failed apart from one that has no lyrics for the song.
+        """
+
+        results = await self.get_results_async(name, artists, **kwargs)
+
+        url = self.get_best_url(name, artists, results)
+        if url is None:
+            return None
+
+        return await self.extract_lyrics_async(url, **kwargs)
+
+    def get_best_url(
+        self, name: str, artists: List[str], results: Dict[str, str]
+    ) -> Optional[str]:
+        """
+        Get the url of the result that matches the song best.
+
+        ### Arguments
+        - name: The name of the song.
+        - artists: The artists of the song.
+        - results: The results from `get_results`.
+
+        ### Returns
+        - The url of the best result or None if no result matches well enough.
+        """
+
         if not results:
             return None
 
@@ -115,13 +209,7 @@ def get_lyrics(self, name: str, artists: List[str], **kwargs) -> Optional[str]:
         if score < 55:
             return None
 
-        try:
-            return self.extract_lyrics(url, **kwargs)
-        except Exception as exc:
-            logger.debug(
-                "%s: Failed to extract lyrics from %s: %s", self.name, url, exc
-            )
-            return None
+        return url
 
     @property
     def name(self) -> str:
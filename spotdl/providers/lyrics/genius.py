@@ -4,11 +4,10 @@
 
 from typing import Dict, List, Optional
 
-import requests
 from bs4 import BeautifulSoup
 
 from spotdl.providers.lyrics.base import LyricsProvider
-from spotdl.utils.config import GlobalConfig
+from spotdl.utils.http import SharedSession
 
 __all__ = ["Genius"]
 
@@ -33,8 +32,7 @@ def __init__(self, access_token: str):
             }
         )
 
-        self.session = requests.Session()
-        self.session.headers.update(self.headers)
+        self.session = SharedSession()
 
     def get_results(self, name: str, artists: List[str], **_) -> Dict[str, str]:
         """
@@ -57,7 +55,6 @@ def get_results(self, name: str, artists: List[str], **_) -> Dict[str, str]:
             params={"q": title},
             headers=self.headers,
             timeout=10,
-            proxies=GlobalConfig.get_parameter("proxies"),
         )
 
         results: Dict[str, str] = {}
@@ -83,7 +80,6 @@ def extract_lyrics(self, url: str, **_) -> Optional[str]:
             url,
             headers=self.headers,
             timeout=10,
-            proxies=GlobalConfig.get_parameter("proxies"),
         )
         url = song_response.json()["response"]["song"]["url"]
 
@@ -94,7 +90,6 @@ def extract_lyrics(self, url: str, **_) -> Optional[str]:
                 url,
                 headers=self.headers,
                 timeout=10,
-                proxies=GlobalConfig.get_parameter("proxies"),
             )
 
             if not genius_page_response.ok:
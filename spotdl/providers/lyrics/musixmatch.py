@@ -5,11 +5,10 @@
 from typing import Dict, List, Optional
 from urllib.parse import quote
 
-import requests
 from bs4 import BeautifulSoup
 
 from spotdl.providers.lyrics.base import LyricsProvider
-from spotdl.utils.config import GlobalConfig
+from spotdl.utils.http import get_session
 
 __all__ = ["MusixMatch"]
 
@@ -31,11 +30,10 @@ def extract_lyrics(self, url: str, **_) -> Optional[str]:
         - The lyrics of the song or None if no lyrics were found.
         """
 
-        lyrics_resp = requests.get(
+        lyrics_resp = get_session().get(
             url,
             headers=self.headers,
             timeout=10,
-            proxies=GlobalConfig.get_parameter("proxies"),
         )
 
         lyrics_soup = BeautifulSoup(lyrics_resp.text, "html.parser")
@@ -71,11 +69,10 @@ def get_results(self, name: str, artists: List[str], **kwargs) -> Dict[str, str]
             query += "/tracks"
 
         search_url = f"https://www.musixmatch.com/search/{query}"
-        search_resp = requests.get(
+        search_resp = get_session().get(
             search_url,
             headers=self.headers,
             timeout=10,
-            proxies=GlobalConfig.get_parameter("proxies"),
         )
         search_soup = BeautifulSoup(search_resp.text, "html.parser")
         song_url_tag = search_soup.select("a[href^='/lyrics/']")
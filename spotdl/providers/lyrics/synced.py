@@ -8,6 +8,7 @@
 import syncedlyrics
 
 from spotdl.providers.lyrics.base import LyricsProvider
+from spotdl.utils.http import run_blocking
 
 __all__ = ["Synced"]
 
@@ -61,14 +62,29 @@ def get_lyrics(self, name: str, artists: List[str], **kwargs) -> Optional[str]:
         """
 
         try:
-            lyrics = syncedlyrics.search(
-                f"{name} - {artists[0]}",
-                synced_only=not kwargs.get("allow_plain_format", True),
-            )
-            return lyrics
+            return self.search_lyrics(name, artists, **kwargs)
         except requests.exceptions.SSLError:
             # Max retries reached
             return None
+
+    def search_lyrics(self, name: str, artists: List[str], **kwargs) -> Optional[str]:
+        """
+        Search for the lyrics using syncedlyrics, network errors are raised.
+
+        ### Arguments
+        - name: The name of the song.
+        - artists: The artists of the song.
+        - kwargs: Additional arguments.
+
+        ### Returns
+        - The lyrics of the song or None if no lyrics were found.
+        """
+
+        try:
+            return syncedlyrics.search(
+                f"{name} - {artists[0]}",
+                synced_only=not kwargs.get("allow_plain_format", True),
+            )
         except TypeError:
             # Error at syncedlyrics.providers.musixmatch L89 -
             #   Because `body` is occasionally an empty list instead of a dictionary.
@@ -76,3 +92,20 @@ def get_lyrics(self, name: str, artists: List[str], **kwargs) -> Optional[str]:
             #   and there are no synced lyrics present
             # Because its empty, we know there are no lyrics
             return None
+
+    async def get_lyrics_async(
+        self, name: str, artists: List[str], **kwargs
+    ) -> Optional[str]:
+        """
+        Try to get lyrics using syncedlyrics without blocking the event loop.
+
+        ### Arguments
+        - name: The name of the song.
+        - artists: The artists of the song.
+        - kwargs: Additional arguments.
+
+        ### Returns
+        - The lyrics of the song or None if no lyrics were found.
+        """
+
+        return await run_blocking(self.search_lyrics, name, artists, **kwargs)
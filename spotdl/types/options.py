@@ -34,6 +34,8 @@ class SpotifyOptions(TypedDict):
     no_cache: bool
     max_retries: int
     use_cache_file: bool
+    spotify_cache_ttl: Optional[int]
+    spotify_cache_size: Optional[int]
 
 
 class DownloaderOptions(TypedDict):
@@ -89,6 +91,24 @@ class DownloaderOptions(TypedDict):
     create_skip_file: Optional[bool]
     respect_skip_file: Optional[bool]
     sync_remove_lrc: Optional[bool]
+    pipeline: bool
+    search_threads: Optional[int]
+    transcode_threads: Optional[int]
+    match_cache: Optional[str]
+    match_cache_ttl: Optional[int]
+    cover_size: Optional[int]
+    race_providers: bool
+    lyrics_cache: Optional[str]
+    slugify_cache_size: int
+    ratio_cache_size: int
+    slug_cache: Optional[str]
+    journal: Optional[str]
+    resume: Optional[str]
+    stream: bool
+    adaptive_search: bool
+    album_matching: bool
+    http_retries: Optional[int]
+    cover_cache_size: Optional[int]
 
 
 class WebOptions(TypedDict):
@@ -131,6 +151,8 @@ class SpotifyOptionalOptions(TypedDict, total=False):
     no_cache: bool
     max_retries: int
     use_cache_file: bool
+    spotify_cache_ttl: Optional[int]
+    spotify_cache_size: Optional[int]
 
 
 class DownloaderOptionalOptions(TypedDict, total=False):
@@ -185,6 +207,24 @@ class DownloaderOptionalOptions(TypedDict, total=False):
     create_skip_file: Optional[bool]
     respect_skip_file: Optional[bool]
     sync_remove_lrc: Optional[bool]
+    pipeline: bool
+    search_threads: Optional[int]
+    transcode_threads: Optional[int]
+    match_cache: Optional[str]
+    match_cache_ttl: Optional[int]
+    cover_size: Optional[int]
+    race_providers: bool
+    lyrics_cache: Optional[str]
+    slugify_cache_size: int
+    ratio_cache_size: int
+    slug_cache: Optional[str]
+    journal: Optional[str]
+    resume: Optional[str]
+    stream: bool
+    adaptive_search: bool
+    album_matching: bool
+    http_retries: Optional[int]
+    cover_cache_size: Optional[int]
 
 
 class WebOptionalOptions(TypedDict, total=False):
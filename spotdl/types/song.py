@@ -4,7 +4,7 @@
 
 import json
 from dataclasses import asdict, dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from rapidfuzz import fuzz
 
@@ -25,6 +25,41 @@ class SongListError(Exception):
     """
 
 
+def get_batched(
+    method: Callable[[List[str]], Optional[Dict[str, Any]]],
+    key: str,
+    ids: List[str],
+    batch_size: int,
+) -> Dict[str, Optional[Dict[str, Any]]]:
+    """
+    Request spotify objects in batches using one of the multi-get endpoints.
+
+    ### Arguments
+    - method: The spotify client method to call, e.g. `tracks`.
+    - key: The key of the list in the response, e.g. `tracks`.
+    - ids: The ids of the objects to get.
+    - batch_size: The maximum number of ids per request.
+
+    ### Returns
+    - Dictionary mapping the requested ids to the objects, None if not found.
+    """
+
+    objects: Dict[str, Optional[Dict[str, Any]]] = {}
+    for index in range(0, len(ids), batch_size):
+        batch = ids[index : index + batch_size]
+        response = method(batch)
+
+        if response is None:
+            raise SongError(f"Couldn't get {key} metadata from spotify")
+
+        # Spotify returns the objects in the same order as the ids,
+        # with null for ids that are not found
+        for object_id, raw_object in zip(batch, response[key]):
+            objects[object_id] = raw_object
+
+    return objects
+
+
 @dataclass
 class Song:
     """
@@ -100,12 +135,33 @@ def from_url(cls, url: str) -> "Song":
         raw_album_meta: Dict[str, Any] = spotify_client.album(album_id)  # type: ignore
 
         # create song object
+        return cls.from_raw_data(raw_track_meta, raw_artist_meta, raw_album_meta)
+
+    @classmethod
+    def from_raw_data(
+        cls,
+        raw_track_meta: Dict[str, Any],
+        raw_artist_meta: Dict[str, Any],
+        raw_album_meta: Dict[str, Any],
+    ) -> "Song":
+        """
+        Creates a Song object from the raw spotify responses.
+
+        ### Arguments
+        - raw_track_meta: The track object.
+        - raw_artist_meta: The primary artist object of the track.
+        - raw_album_meta: The album object of the track.
+
+        ### Returns
+        - The Song object.
+        """
+
         return cls(
             name=raw_track_meta["name"],
             artists=[artist["name"] for artist in raw_track_meta["artists"]],
             artist=raw_track_meta["artists"][0]["name"],
-            artist_id=primary_artist_id,
-            album_id=album_id,
+            artist_id=raw_track_meta["artists"][0]["id"],
+            album_id=raw_track_meta["album"]["id"],
             album_name=raw_album_meta["name"],
             album_artist=raw_album_meta["artists"][0]["name"],
             album_type=raw_album_meta.get("album_type"),
@@ -137,6 +193,90 @@ def from_url(cls, url: str) -> "Song":
             ),
         )
 
+    @classmethod
+    def list_from_urls(cls, urls: List[str]) -> "List[Optional[Song]]":
+        """
+        Creates Song objects from a list of URLs.
+        Tracks, artists and albums are requested in batches,
+        and artists and albums shared between tracks are only requested once.
+
+        ### Arguments
+        - urls: The URLs of the songs.
+
+        ### Returns
+        - The list of Song objects, in the same order as the urls.
+        None for tracks that couldn't be found.
+        """
+
+        for url in urls:
+            if "open.spotify.com" not in url or "track" not in url:
+                raise SongError(f"Invalid URL: {url}")
+
+        spotify_client = SpotifyClient()
+
+        track_ids = [
+            spotify_client._get_id("track", url)  # pylint: disable=W0212
+            for url in urls
+        ]
+
+        # Tracks that are already cached are not requested again
+        raw_tracks = {
+            track_id: spotify_client.get_cached_track(track_id)
+            for track_id in dict.fromkeys(track_ids)
+        }
+
+        raw_tracks.update(
+            get_batched(
+                spotify_client.tracks,
+                "tracks",
+                [track_id for track_id, track in raw_tracks.items() if track is None],
+                50,
+            )
+        )
+
+        # Remove tracks that no longer exist
+        for track_id, raw_track_meta in raw_tracks.items():
+            if raw_track_meta is not None and (
+                raw_track_meta["duration_ms"] == 0
+                or raw_track_meta["name"].strip() == ""
+            ):
+                raw_tracks[track_id] = None
+
+        valid_tracks = [track for track in raw_tracks.values() if track is not None]
+
+        raw_artists = get_batched(
+            spotify_client.artists,
+            "artists",
+            list(dict.fromkeys(track["artists"][0]["id"] for track in valid_tracks)),
+            50,
+        )
+
+        raw_albums = get_batched(
+            spotify_client.albums,
+            "albums",
+            list(dict.fromkeys(track["album"]["id"] for track in valid_tracks)),
+            20,
+        )
+
+        songs: List[Optional[Song]] = []
+        for track_id in track_ids:
+            raw_track_meta = raw_tracks.get(track_id)
+            if raw_track_meta is None:
+                songs.append(None)
+                continue
+
+            raw_artist_meta = raw_artists.get(raw_track_meta["artists"][0]["id"])
+            raw_album_meta = raw_albums.get(raw_track_meta["album"]["id"])
+            if raw_artist_meta is None or raw_album_meta is None:
+                songs.append(None)
+                continue
+
+            songs.append(
+                cls.from_raw_data(raw_track_meta, raw_artist_meta, raw_album_meta)
+            )
+
+        return songs
+
     @staticmethod
     def search(search_term: str):
         """
@@ -2,10 +2,27 @@
 Module for archiving sets of data
 """
 
+import logging
+import os
+import re
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Set
+from typing import Iterator, List, Optional, Set, Union
 
-__all__ = ["Archive"]
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None  # type: ignore # pylint: disable=invalid-name
+
+__all__ = ["Archive", "ArchiveFile", "get_archive_id", "get_archive_line"]
+
+logger = logging.getLogger(__name__)
+
+SPOTIFY_TRACK_REGEX = re.compile(
+    r"^https?://open\.spotify\.com/(?:intl-[\w-]+/)?track/([A-Za-z0-9]{22})"
+)
+SPOTIFY_ID_REGEX = re.compile(r"^[A-Za-z0-9]{22}$")
 
 
 class Archive(Set):
@@ -47,3 +64,305 @@ def save(self, file: str) -> bool:
                 archive.write(f"{element}\n")
 
         return True
+
+
+def get_archive_id(url: str) -> str:
+    """
+    Get the id that is used to look up the song in the archive.
+
+    ### Arguments
+    - url: the url of the song
+
+    ### Returns
+    - the spotify track id for spotify urls, the url itself otherwise
+    """
+
+    match = SPOTIFY_TRACK_REGEX.match(url)
+
+    return match.group(1) if match else url
+
+
+def get_archive_line(entry: str) -> str:
+    """
+    Get the line that is written to the archive file.
+    Spotify songs are stored as track urls, so older versions can read the file.
+
+    ### Arguments
+    - entry: the archive id of the song
+
+    ### Returns
+    - the spotify track url for spotify ids, the entry itself otherwise
+    """
+
+    if SPOTIFY_ID_REGEX.match(entry):
+        return f"https://open.spotify.com/track/{entry}"
+
+    return entry
+
+
+class ArchiveFile:
+    """
+    Append only archive file, that can be shared by multiple processes.
+    New urls are written to the file as soon as they are added,
+    and the file is compacted when it contains too many duplicate entries.
+    Without a path the archive is only kept in memory.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Union[str, Path]] = None,
+        sync_every: int = 32,
+        compact_threshold: int = 1000,
+    ) -> None:
+        """
+        Open the archive file and load its entries.
+
+        ### Arguments
+        - path: the path to the archive file, None to only keep the archive in memory
+        - sync_every: number of new entries after which the file is synced to disk
+        - compact_threshold: minimum number of duplicate lines before the file
+        is compacted
+
+        ### Notes
+        - Songs are looked up by their spotify id, so urls with a different
+        locale or query match the same song.
+        """
+
+        self.path = Path(path) if path is not None else None
+        self.sync_every = sync_every
+        self.compact_threshold = compact_threshold
+
+        self.entries: Set[str] = set()
+        self._lines = 0
+        self._offset = 0
+        self._unsynced = 0
+        self._fd: Optional[int] = None
+        self._inode: Optional[int] = None
+        self._lock = threading.Lock()
+
+        if self.path is None:
+            return
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        with self._lock, self._file_lock():
+            self._open()
+            self._read()
+
+            duplicates = self._lines - len(self.entries)
+            if duplicates > max(self.compact_threshold, len(self.entries) // 2):
+                self._compact()
+
+    @contextmanager
+    def _file_lock(self) -> Iterator[None]:
+        """
+        Lock the archive for the other processes.
+        A separate lock file is used, since compaction replaces the archive file.
+        """
+
+        if fcntl is None or self.path is None:
+            yield
+            return
+
+        lock_path = self.path.with_name(self.path.name + ".lock")
+        with open(lock_path, "a", encoding="utf-8") as lock_file:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def _open(self) -> None:
+        """
+        Open the archive file for appending.
+        """
+
+        if self._fd is not None:
+            os.close(self._fd)
+
+        self._fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        self._inode = os.fstat(self._fd).st_ino
+
+    def _read(self) -> None:
+        """
+        Read the lines that were appended since the last read.
+        """
+
+        with open(self.path, "rb") as archive:
+            archive.seek(self._offset)
+            data = archive.read()
+
+        # Incomplete lines are written by the other processes right now
+        end = data.rfind(b"\n") + 1
+        self._offset += end
+
+        for line in data[:end].decode("utf-8").splitlines():
+            line = line.strip()
+            if not line:
+                continue
+
+            self._lines += 1
+            self.entries.add(get_archive_id(line))
+
+    def _check_replaced(self) -> None:
+        """
+        Reopen the archive file if it was compacted by another process.
+        """
+
+        try:
+            inode = os.stat(self.path).st_ino
+        except FileNotFoundError:
+            inode = None
+
+        if inode != self._inode:
+            self._lines = 0
+            self._offset = 0
+            self._open()
+
+    def _compact(self) -> None:
+        """
+        Rewrite the archive file with one line per song.
+        """
+
+        temp_path = self.path.with_name(self.path.name + ".tmp")  # type: ignore
+        with open(temp_path, "w", encoding="utf-8") as archive:
+            for entry in sorted(self.entries):
+                archive.write(f"{get_archive_line(entry)}\n")
+
+            archive.flush()
+            os.fsync(archive.fileno())
+
+        # Open files can't be replaced on Windows
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+        os.replace(temp_path, self.path)  # type: ignore
+
+        logger.debug(
+            "Compacted archive %s from %d to %d lines",
+            self.path,
+            self._lines,
+            len(self.entries),
+        )
+
+        self._open()
+        self._lines = len(self.entries)
+        self._offset = os.fstat(self._fd).st_size  # type: ignore
+
+    def refresh(self) -> None:
+        """
+        Load the entries that were added by the other processes.
+        """
+
+        if self.path is None:
+            return
+
+        with self._lock, self._file_lock():
+            self._check_replaced()
+            self._read()
+
+    def add(self, url: str) -> bool:
+        """
+        Add the url to the archive and append it to the file.
+
+        ### Arguments
+        - url: the url of the song
+
+        ### Returns
+        - True if the url wasn't in the archive yet
+        """
+
+        return self.add_many([url]) == 1
+
+    def add_many(self, urls: List[str]) -> int:
+        """
+        Add the urls to the archive and append the new ones to the file.
+
+        ### Arguments
+        - urls: the urls of the songs
+
+        ### Returns
+        - number of urls that weren't in the archive yet
+        """
+
+        with self._lock:
+            entries = {get_archive_id(url) for url in urls}
+            if entries <= self.entries:
+                return 0
+
+            if self.path is None:
+                new_entries = sorted(entries - self.entries)
+                self.entries.update(new_entries)
+                return len(new_entries)
+
+            with self._file_lock():
+                # Catch up with the other processes, so the new lines
+                # are appended after the ones we know about
+                self._check_replaced()
+                self._read()
+
+                new_entries = sorted(entries - self.entries)
+                if not new_entries:
+                    return 0
+
+                data = "".join(
+                    f"{get_archive_line(entry)}\n" for entry in new_entries
+                ).encode("utf-8")
+                os.write(self._fd, data)  # type: ignore
+
+                self.entries.update(new_entries)
+                self._lines += len(new_entries)
+                self._offset += len(data)
+
+                self._unsynced += len(new_entries)
+                if self._unsynced >= self.sync_every:
+                    os.fsync(self._fd)  # type: ignore
+                    self._unsynced = 0
+
+            return len(new_entries)
+
+    def flush(self) -> None:
+        """
+        Sync the entries that were added to disk.
+        """
+
+        with self._lock:
+            if self._fd is not None and self._unsynced:
+                os.fsync(self._fd)
+                self._unsynced = 0
+
+    def close(self) -> None:
+        """
+        Sync and close the archive file.
+        """
+
+        self.flush()
+
+        with self._lock:
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+
+    def __contains__(self, url: object) -> bool:
+        """
+        Check if the url is in the archive.
+
+        ### Arguments
+        - url: the url of the song
+
+        ### Returns
+        - True if the url is in the archive
+        """
+
+        return isinstance(url, str) and get_archive_id(url) in self.entries
+
+    def __len__(self) -> int:
+        """
+        Get the number of songs in the archive.
+
+        ### Returns
+        - the number of songs
+        """
+
+        return len(self.entries)
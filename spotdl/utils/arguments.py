@@ -2,6 +2,8 @@
 Module that handles the command line arguments.
 """
 
+# pylint: disable=too-many-lines
+
 import argparse
 import sys
 import textwrap
@@ -9,7 +11,12 @@
 from typing import List
 
 from spotdl import _version
-from spotdl.download.downloader import AUDIO_PROVIDERS, LYRICS_PROVIDERS
+from spotdl.providers import AUDIO_PROVIDERS, LYRICS_PROVIDERS
+from spotdl.utils.config import (
+    get_lyrics_cache_path,
+    get_match_cache_path,
+    get_slug_cache_path,
+)
 from spotdl.utils.ffmpeg import FFMPEG_FORMATS
 from spotdl.utils.formatter import VARS
 from spotdl.utils.logging import NAME_TO_LEVEL
@@ -177,6 +184,40 @@ def parse_main_options(parser: _ArgumentGroup):
         help="Use only verified results. (Not all providers support this)",
     )
 
+    # Add race providers argument
+    parser.add_argument(
+        "--race-providers",
+        action="store_const",
+        const=True,
+        help=(
+            "Search all audio providers at the same time "
+            "and use the first verified match."
+        ),
+    )
+
+    # Add adaptive search argument
+    parser.add_argument(
+        "--adaptive-search",
+        action="store_const",
+        const=True,
+        help=(
+            "Start with a small page of search results and only search deeper "
+            "when no result is a confident match. (Only YouTube Music supports this)"
+        ),
+    )
+
+    # Add album matching argument
+    parser.add_argument(
+        "--album-matching",
+        action="store_const",
+        const=True,
+        help=(
+            "Match the songs of an album against a single YouTube Music album "
+            "and only search the songs that couldn't be matched one by one. "
+            "(Requires the youtube-music audio provider)"
+        ),
+    )
+
 
 def parse_spotify_options(parser: _ArgumentGroup):
     """
@@ -252,14 +293,28 @@ def parse_spotify_options(parser: _ArgumentGroup):
         const=True,
         help=(
             "Use the cache file to get metadata. "
-            "It's located under C:\\Users\\user\\.spotdl\\.spotify_cache "
-            "or ~/.spotdl/.spotify_cache under linux. "
+            "It's located under C:\\Users\\user\\.spotdl\\spotify_cache.db "
+            "or ~/.spotdl/spotify_cache.db under linux. "
             "It only caches tracks and "
             "gets updated whenever spotDL gets metadata from Spotify. "
             "(It may provide outdated metadata use with caution)"
         ),
     )
 
+    # Add spotify cache ttl argument
+    parser.add_argument(
+        "--spotify-cache-ttl",
+        type=int,
+        help="Number of days after which the responses in the cache file expire.",
+    )
+
+    # Add spotify cache size argument
+    parser.add_argument(
+        "--spotify-cache-size",
+        type=int,
+        help="Maximum size of the cache file in megabytes.",
+    )
+
 
 def parse_ffmpeg_options(parser: _ArgumentGroup):
     """
@@ -283,6 +338,38 @@ def parse_ffmpeg_options(parser: _ArgumentGroup):
         help="The number of threads to use when downloading songs.",
     )
 
+    # Add pipeline argument
+    parser.add_argument(
+        "--pipeline",
+        action="store_const",
+        const=True,
+        help=(
+            "Run searching, downloading, converting and tagging as separate stages "
+            "with their own worker pools."
+        ),
+    )
+
+    # Add pipeline search threads argument
+    parser.add_argument(
+        "--search-threads",
+        type=int,
+        help=(
+            "The number of threads to use when searching for songs in pipeline mode. "
+            "Defaults to the value of --threads."
+        ),
+    )
+
+    # Add transcode threads argument
+    parser.add_argument(
+        "--transcode-threads",
+        type=int,
+        help=(
+            "The number of ffmpeg processes to run at once. "
+            "Defaults to the number of CPU cores in pipeline mode "
+            "and to the value of --threads otherwise."
+        ),
+    )
+
     # Add constant bit rate argument
     parser.add_argument(
         "--bitrate",
@@ -324,6 +411,24 @@ def parse_ffmpeg_options(parser: _ArgumentGroup):
         help="Additional ffmpeg arguments passed as a string.",
     )
 
+    # Add cover size argument
+    parser.add_argument(
+        "--cover-size",
+        type=int,
+        help=(
+            "Maximum width/height of the embedded album art in pixels. "
+            "Larger covers are resized and recompressed once per album."
+        ),
+    )
+
+    # Add cover cache size argument
+    parser.add_argument(
+        "--cover-cache-size",
+        type=int,
+        help="Maximum size of the album art cache on disk in megabytes. "
+        "Covers are only cached in memory if not set.",
+    )
+
 
 def parse_output_options(parser: _ArgumentGroup):
     """
@@ -445,6 +550,99 @@ def parse_output_options(parser: _ArgumentGroup):
         help="Specify the file name for an archive of already downloaded songs",
     )
 
+    # Add match cache argument
+    parser.add_argument(
+        "--match-cache",
+        type=str,
+        nargs="?",
+        const=str(get_match_cache_path()),
+        help=(
+            "Store the download urls found for songs in a cache file, "
+            "so they don't have to be matched again. "
+            "Defaults to match_cache.db in the spotdl directory."
+        ),
+    )
+
+    # Add match cache ttl argument
+    parser.add_argument(
+        "--match-cache-ttl",
+        type=int,
+        help="Number of days after which the cached matches expire.",
+    )
+
+    # Add lyrics cache argument
+    parser.add_argument(
+        "--lyrics-cache",
+        type=str,
+        nargs="?",
+        const=str(get_lyrics_cache_path()),
+        help=(
+            "Store the lyrics found for songs, and the songs without lyrics, "
+            "in a cache file, so they don't have to be searched for again. "
+            "Defaults to lyrics_cache.db in the spotdl directory."
+        ),
+    )
+
+    # Add slugify cache size argument
+    parser.add_argument(
+        "--slugify-cache-size",
+        type=int,
+        help="Number of slugified strings to keep in memory while matching songs.",
+    )
+
+    # Add ratio cache size argument
+    parser.add_argument(
+        "--ratio-cache-size",
+        type=int,
+        help=(
+            "Number of string similarity ratios to keep in memory "
+            "while matching songs."
+        ),
+    )
+
+    # Add slug cache argument
+    parser.add_argument(
+        "--slug-cache",
+        type=str,
+        nargs="?",
+        const=str(get_slug_cache_path()),
+        help=(
+            "Keep the slugified artist and song names in a cache file between runs. "
+            "Defaults to slug_cache.db in the spotdl directory."
+        ),
+    )
+
+    # Add journal argument
+    parser.add_argument(
+        "--journal",
+        type=str,
+        help=(
+            "Write the progress of every song to a journal file, "
+            "so an interrupted download can be resumed with --resume."
+        ),
+    )
+
+    # Add resume argument
+    parser.add_argument(
+        "--resume",
+        type=str,
+        help=(
+            "Resume the download from a journal file, finished songs are skipped "
+            "and interrupted songs continue from the last completed stage."
+        ),
+    )
+
+    # Add stream argument
+    parser.add_argument(
+        "--stream",
+        action="store_const",
+        const=True,
+        help=(
+            "Stream the audio straight into ffmpeg instead of downloading it "
+            "to the temp directory first, so the download and the conversion overlap."
+        ),
+    )
+
     # Option to set the track number & album of tracks in a playlist to their index in the playlist
     # & the name of playlist respectively.
     parser.add_argument(
@@ -603,6 +801,13 @@ def parse_output_options(parser: _ArgumentGroup):
         help="Http(s) proxy server for download song. Example: http://host:port",
     )
 
+    # Add http retries argument
+    parser.add_argument(
+        "--http-retries",
+        type=int,
+        help="Number of times failed http requests are retried.",
+    )
+
     # Skip songs having a skip flag file
     parser.add_argument(
         "--create-skip-file",
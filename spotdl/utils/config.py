@@ -24,8 +24,14 @@
     "get_spotdl_path",
     "get_config_file",
     "get_cache_path",
+    "get_spotify_cache_db_path",
     "get_temp_path",
     "get_errors_path",
+    "get_match_cache_path",
+    "get_lyrics_cache_path",
+    "get_slug_cache_path",
+    "get_cover_cache_path",
+    "get_library_index_path",
     "get_web_ui_path",
     "get_config",
     "create_settings_type",
@@ -117,6 +123,17 @@ def get_spotify_cache_path() -> Path:
     return get_spotdl_path() / ".spotify_cache"
 
 
+def get_spotify_cache_db_path() -> Path:
+    """
+    Get the path to the spotify cache database.
+
+    ### Returns
+    - The path to the spotify cache database.
+    """
+
+    return get_spotdl_path() / "spotify_cache.db"
+
+
 def get_temp_path() -> Path:
     """
     Get the path to the temp folder.
@@ -151,6 +168,61 @@ def get_errors_path() -> Path:
     return errors_path
 
 
+def get_match_cache_path() -> Path:
+    """
+    Get the path to the match cache file.
+
+    ### Returns
+    - The path to the match cache file.
+    """
+
+    return get_spotdl_path() / "match_cache.db"
+
+
+def get_lyrics_cache_path() -> Path:
+    """
+    Get the path to the lyrics cache file.
+
+    ### Returns
+    - The path to the lyrics cache file.
+    """
+
+    return get_spotdl_path() / "lyrics_cache.db"
+
+
+def get_slug_cache_path() -> Path:
+    """
+    Get the path to the slug cache file.
+
+    ### Returns
+    - The path to the slug cache file.
+    """
+
+    return get_spotdl_path() / "slug_cache.db"
+
+
+def get_cover_cache_path() -> Path:
+    """
+    Get the path to the cover cache folder.
+
+    ### Returns
+    - The path to the cover cache folder.
+    """
+
+    return get_spotdl_path() / "covers"
+
+
+def get_library_index_path() -> Path:
+    """
+    Get the path to the library index file.
+
+    ### Returns
+    - The path to the library index file.
+    """
+
+    return get_spotdl_path() / "library.db"
+
+
 def get_web_ui_path() -> Path:
     """
     Get the path to the web-ui folder.
@@ -314,6 +386,8 @@ def get_parameter(cls, key):
     "no_cache": False,
     "max_retries": 3,
     "use_cache_file": False,
+    "spotify_cache_ttl": 90,
+    "spotify_cache_size": 512,
 }
 
 DOWNLOADER_OPTIONS: DownloaderOptions = {
@@ -365,6 +439,24 @@ def get_parameter(cls, key):
     "create_skip_file": False,
     "respect_skip_file": False,
     "sync_remove_lrc": False,
+    "pipeline": False,
+    "search_threads": None,
+    "transcode_threads": None,
+    "match_cache": None,
+    "match_cache_ttl": 30,
+    "cover_size": None,
+    "race_providers": False,
+    "lyrics_cache": None,
+    "slugify_cache_size": 8192,
+    "ratio_cache_size": 16384,
+    "slug_cache": None,
+    "journal": None,
+    "resume": None,
+    "stream": False,
+    "adaptive_search": False,
+    "album_matching": False,
+    "http_retries": None,
+    "cover_cache_size": None,
 }
 
 WEB_OPTIONS: WebOptions = {
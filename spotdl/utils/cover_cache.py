@@ -0,0 +1,341 @@
+"""
+Module that holds the album art cache.
+Covers are downloaded once per url and shared by all songs of an album.
+
+The cache is configured through `GlobalConfig`:
+- `cover_size`: Maximum width/height of the covers, covers are resized
+and recompressed with ffmpeg if set.
+- `cover_cache_size`: Maximum size of the covers stored on disk in bytes,
+the disk cache is disabled if not set.
+- `ffmpeg`: The ffmpeg executable used for resizing.
+"""
+
+import hashlib
+import logging
+import os
+import subprocess
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from spotdl.utils.config import GlobalConfig, get_cover_cache_path
+from spotdl.utils.http import get_session
+
+__all__ = ["CoverCache", "get_cover", "reset_cover_cache", "DEFAULT_COVER_CACHE_SIZE"]
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_COVER_CACHE_SIZE = 100 * 1024 * 1024
+
+# Cache is created per process, like the http session
+_CACHE: Optional[Tuple[int, "CoverCache"]] = None
+_CACHE_LOCK = threading.Lock()
+
+
+class CoverCache:
+    """
+    Cover cache with a small in memory cache for the hot entries
+    and a bigger on disk cache evicted by the total size of the covers.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        max_size: int = DEFAULT_COVER_CACHE_SIZE,
+        memory_entries: int = 32,
+        cover_size: Optional[int] = None,
+        ffmpeg: str = "ffmpeg",
+    ) -> None:
+        """
+        Initialize the cover cache.
+
+        ### Arguments
+        - path: The directory to store the covers in.
+        - max_size: Maximum size of the covers on disk in bytes, 0 to disable the disk cache.
+        - memory_entries: Number of covers to keep in memory.
+        - cover_size: Maximum width/height of the covers, None to keep the original covers.
+        - ffmpeg: The ffmpeg executable used for resizing.
+        """
+
+        self.path = Path(path)
+        self.max_size = max_size
+        self.memory_entries = memory_entries
+        self.cover_size = cover_size
+        self.ffmpeg = ffmpeg
+
+        self.memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self.lock = threading.Lock()
+        self.key_locks: Dict[str, threading.Lock] = {}
+        self.key_users: Dict[str, int] = {}
+
+        self.disk_size: Optional[int] = None
+
+    def get_key(self, url: str) -> str:
+        """
+        Get the cache key of the cover.
+
+        ### Arguments
+        - url: The url of the cover.
+
+        ### Returns
+        - The cache key.
+        """
+
+        return hashlib.sha256(f"{url}|{self.cover_size}".encode("utf-8")).hexdigest()
+
+    def get(self, url: str) -> Optional[bytes]:
+        """
+        Get the cover, downloading it if it's not cached.
+
+        ### Arguments
+        - url: The url of the cover.
+
+        ### Returns
+        - The cover data or None if the cover couldn't be downloaded.
+
+        ### Notes
+        - Threads requesting the same cover wait for the first download
+        instead of downloading the cover again.
+        """
+
+        key = self.get_key(url)
+
+        with self.lock:
+            if key in self.memory:
+                self.memory.move_to_end(key)
+                return self.memory[key]
+
+            self.key_users[key] = self.key_users.get(key, 0) + 1
+            key_lock = self.key_locks.setdefault(key, threading.Lock())
+
+        try:
+            with key_lock:
+                # Another thread might have fetched the cover while we were waiting
+                with self.lock:
+                    if key in self.memory:
+                        self.memory.move_to_end(key)
+                        return self.memory[key]
+
+                data = self.read(key)
+                if data is None:
+                    data = self.download(url)
+                    if data is None:
+                        return None
+
+                    self.write(key, data)
+
+                with self.lock:
+                    self.memory[key] = data
+                    while len(self.memory) > self.memory_entries:
+                        self.memory.popitem(last=False)
+        finally:
+            # Drop the lock only once no other thread holds or waits for it
+            with self.lock:
+                self.key_users[key] -= 1
+                if self.key_users[key] == 0:
+                    del self.key_users[key]
+                    del self.key_locks[key]
+
+        return data
+
+    def download(self, url: str) -> Optional[bytes]:
+        """
+        Download the cover and resize it if needed.
+
+        ### Arguments
+        - url: The url of the cover.
+
+        ### Returns
+        - The cover data or None if the download failed.
+        """
+
+        try:
+            response = get_session().get(url, timeout=10)
+        except Exception as exc:
+            logger.debug("Could not download cover %s: %s", url, exc)
+            return None
+
+        if not response.ok:
+            logger.debug("Could not download cover %s: %s", url, response.status_code)
+            return None
+
+        data = response.content
+        if self.cover_size:
+            data = self.resize(data)
+
+        return data
+
+    def resize(self, data: bytes) -> bytes:
+        """
+        Scale the cover down to the cover size and recompress it using ffmpeg.
+
+        ### Arguments
+        - data: The cover data.
+
+        ### Returns
+        - The resized cover, or the original cover if resizing failed.
+        """
+
+        size = self.cover_size
+        command = [
+            self.ffmpeg,
+            "-v",
+            "error",
+            "-i",
+            "pipe:0",
+            "-vf",
+            f"scale='min({size},iw)':'min({size},ih)':force_original_aspect_ratio=decrease",
+            "-q:v",
+            "3",
+            "-f",
+            "mjpeg",
+            "pipe:1",
+        ]
+
+        try:
+            process = subprocess.run(
+                command, input=data, capture_output=True, timeout=30, check=True
+            )
+        except (OSError, subprocess.SubprocessError) as exc:
+            logger.debug("Could not resize cover: %s", exc)
+            return data
+
+        return process.stdout or data
+
+    def read(self, key: str) -> Optional[bytes]:
+        """
+        Read a cover from the disk cache.
+
+        ### Arguments
+        - key: The cache key.
+
+        ### Returns
+        - The cover data or None if the cover is not on disk.
+        """
+
+        if not self.max_size:
+            return None
+
+        file_path = self.path / f"{key}.jpg"
+        try:
+            data = file_path.read_bytes()
+
+            # Access time is tracked with mtime, atime is often disabled
+            os.utime(file_path)
+        except OSError:
+            return None
+
+        return data
+
+    def write(self, key: str, data: bytes) -> None:
+        """
+        Write a cover to the disk cache and evict the least recently used covers.
+
+        ### Arguments
+        - key: The cache key.
+        - data: The cover data.
+        """
+
+        if not self.max_size:
+            return None
+
+        try:
+            self.path.mkdir(parents=True, exist_ok=True)
+
+            # Write to a temp file first so other processes never read partial covers
+            temp_path = self.path / f"{key}.{os.getpid()}.{threading.get_ident()}.tmp"
+            temp_path.write_bytes(data)
+            temp_path.replace(self.path / f"{key}.jpg")
+        except OSError as exc:
+            logger.debug("Could not save cover %s: %s", key, exc)
+            return None
+
+        with self.lock:
+            if self.disk_size is None:
+                self.disk_size = sum(
+                    file.stat().st_size for file in self.path.glob("*.jpg")
+                )
+            else:
+                self.disk_size += len(data)
+
+            if self.disk_size > self.max_size:
+                self.evict()
+
+        return None
+
+    def evict(self) -> None:
+        """
+        Remove the least recently used covers until the cache fits in the limit.
+        """
+
+        files = []
+        for file in self.path.glob("*.jpg"):
+            try:
+                stat = file.stat()
+            except OSError:
+                continue
+
+            files.append((stat.st_mtime, stat.st_size, file))
+
+        files.sort()
+        total_size = sum(size for _, size, _ in files)
+
+        # Leave some free space so we don't evict on every write
+        target_size = self.max_size * 0.9
+        for _, size, file in files:
+            if total_size <= target_size:
+                break
+
+            try:
+                file.unlink()
+                total_size -= size
+            except OSError:
+                continue
+
+        self.disk_size = total_size
+        logger.debug("Cover cache size after eviction: %d bytes", total_size)
+
+
+def get_cover(url: str) -> Optional[bytes]:
+    """
+    Get a cover using the shared cover cache.
+
+    ### Arguments
+    - url: The url of the cover.
+
+    ### Returns
+    - The cover data or None if the cover couldn't be downloaded.
+    """
+
+    global _CACHE  # pylint: disable=global-statement
+
+    with _CACHE_LOCK:
+        if _CACHE is None or _CACHE[0] != os.getpid():
+            cache_size = GlobalConfig.get_parameter("cover_cache_size")
+            _CACHE = (
+                os.getpid(),
+                CoverCache(
+                    get_cover_cache_path(),
+                    # The disk cache is opt-in, only the memory cache is used by default
+                    max_size=cache_size or 0,
+                    cover_size=GlobalConfig.get_parameter("cover_size"),
+                    ffmpeg=GlobalConfig.get_parameter("ffmpeg") or "ffmpeg",
+                ),
+            )
+
+        cache = _CACHE[1]
+
+    return cache.get(url)
+
+
+def reset_cover_cache() -> None:
+    """
+    Drop the shared cover cache, the next call to `get_cover`
+    will create a new one with the current settings.
+    """
+
+    global _CACHE  # pylint: disable=global-statement
+
+    with _CACHE_LOCK:
+        _CACHE = None
@@ -2,7 +2,7 @@
 Module for functions related to downloading songs.
 """
 
-from spotdl.providers.audio import YouTubeMusic
+from spotdl.providers import AUDIO_PROVIDERS
 
 __all__ = ["check_ytmusic_connection"]
 
@@ -17,7 +17,7 @@ def check_ytmusic_connection() -> bool:
     """
 
     # Check if we are getting results from YouTube Music
-    ytm = YouTubeMusic()
+    ytm = AUDIO_PROVIDERS["youtube-music"]()
     test_results = ytm.get_results("a")
     if len(test_results) == 0:
         return False
@@ -10,13 +10,14 @@
 import shutil
 import stat
 import subprocess
+import tempfile
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import requests
 
 from spotdl.utils.config import get_spotdl_path
-from spotdl.utils.formatter import to_ms
 
 __all__ = [
     "FFMPEG_URLS",
@@ -29,8 +30,12 @@
     "is_ffmpeg_installed",
     "get_ffmpeg_path",
     "get_ffmpeg_version",
+    "get_cached_ffmpeg_version",
     "get_local_ffmpeg",
     "download_ffmpeg",
+    "COPY_CODECS",
+    "CONTAINER_CODECS",
+    "get_transcode_mode",
     "convert",
 ]
 
@@ -66,6 +71,27 @@
 TIME_REGEX = re.compile(
     r"out_time=(?P<hour>\d{2}):(?P<min>\d{2}):(?P<sec>\d{2})\.(?P<ms>\d{2})"
 )
+# Audio codecs that can be stored in the output formats without re-encoding
+COPY_CODECS = {
+    "mp3": ["mp3"],
+    "flac": ["flac"],
+    "ogg": ["vorbis"],
+    "opus": ["opus"],
+    "m4a": ["aac", "mp4a"],
+    "wav": ["pcm_s16le"],
+}
+
+# Codecs that are assumed when the codec of the input is unknown
+CONTAINER_CODECS = {
+    "webm": "opus",
+    "m4a": "aac",
+    "mp3": "mp3",
+    "flac": "flac",
+    "ogg": "vorbis",
+    "opus": "opus",
+    "wav": "pcm_s16le",
+}
+
 VERSION_REGEX = re.compile(r"ffmpeg version \w?(\d+\.)?(\d+)")
 YEAR_REGEX = re.compile(r"Copyright \(c\) \d\d\d\d\-\d\d\d\d")
 
@@ -182,6 +208,26 @@ def get_ffmpeg_version(ffmpeg: str = "ffmpeg") -> Tuple[Optional[float], Optiona
     return (version, build_year)
 
 
+@lru_cache(maxsize=None)
+def get_cached_ffmpeg_version(
+    ffmpeg: str = "ffmpeg",
+) -> Tuple[Optional[float], Optional[int]]:
+    """
+    Get ffmpeg version, the version of every executable is only checked once.
+
+    ### Arguments
+    - ffmpeg: ffmpeg executable to check
+
+    ### Returns
+    - Tuple of optional version and optional year.
+
+    ### Errors
+    - FFmpegError if ffmpeg is not installed.
+    """
+
+    return get_ffmpeg_version(ffmpeg)
+
+
 def get_local_ffmpeg() -> Optional[Path]:
     """
     Get local ffmpeg binary path.
@@ -248,6 +294,47 @@ def download_ffmpeg() -> Path:
     return ffmpeg_path
 
 
+def get_transcode_mode(
+    file_format: str,
+    output_format: str,
+    codec: Optional[str] = None,
+    bitrate: Optional[str] = None,
+    ffmpeg_args: Optional[str] = None,
+) -> str:
+    """
+    Decide how the input has to be converted to the output format.
+
+    ### Arguments
+    - file_format: format (container) of the input.
+    - output_format: output format.
+    - codec: audio codec of the input, as reported by yt-dlp (e.g. opus, mp4a.40.2).
+    - bitrate: bitrate the output has to be encoded with.
+    - ffmpeg_args: ffmpeg arguments.
+
+    ### Returns
+    - "move" if the input already is in the output format,
+    "copy" if only the container has to change
+    and "transcode" if the audio has to be re-encoded.
+    """
+
+    # Extra ffmpeg arguments (filters, metadata...) have to be applied
+    # even if the input already is in the output format
+    if bitrate or ffmpeg_args:
+        return "transcode"
+
+    if file_format == output_format:
+        return "move"
+
+    codec = codec if codec and codec != "none" else CONTAINER_CODECS.get(file_format)
+    if codec and any(
+        codec.lower().startswith(copy_codec)
+        for copy_codec in COPY_CODECS.get(output_format, [])
+    ):
+        return "copy"
+
+    return "transcode"
+
+
 def convert(
     input_file: Union[Path, Tuple[str, str]],
     output_file: Path,
@@ -256,6 +343,9 @@ def convert(
     bitrate: Optional[str] = None,
     ffmpeg_args: Optional[str] = None,
     progress_handler: Optional[Callable[[int], None]] = None,
+    headers: Optional[Dict[str, str]] = None,
+    duration: Optional[float] = None,
+    input_codec: Optional[str] = None,
 ) -> Tuple[bool, Optional[Dict[str, Any]]]:
     """
     Convert the input file to the output file synchronously with progress handler.
@@ -268,27 +358,48 @@ def convert(
     - bitrate: constant/variable bitrate.
     - ffmpeg_args: ffmpeg arguments.
     - progress_handler: progress handler, has to accept an integer as argument.
+    - headers: http headers to send when the input is an url.
+    - duration: duration of the input in seconds, used to calculate the progress.
+    - input_codec: audio codec of the input, see `get_transcode_mode`.
 
     ### Returns
     - Tuple of conversion status and error dictionary.
 
     ### Notes
     - Make sure to check if ffmpeg is installed before calling this function.
+    - Urls are streamed into ffmpeg, so the download and the conversion overlap.
     """
 
+    # Input options have to come before the input file
+    input_arguments: List[str] = []
+    if isinstance(input_file, tuple) and input_file[0].startswith("http"):
+        # Reconnect if the connection drops in the middle of the stream
+        input_arguments.extend(
+            ["-reconnect", "1", "-reconnect_streamed", "1", "-reconnect_delay_max", "5"]
+        )
+
+        if headers:
+            input_arguments.extend(
+                [
+                    "-headers",
+                    "".join(f"{key}: {value}\r\n" for key, value in headers.items()),
+                ]
+            )
+
     # Initialize ffmpeg command
     # -i is the input file
     arguments: List[str] = [
         "-nostdin",
         "-y",
+        *input_arguments,
         "-i",
         str(input_file.resolve()) if isinstance(input_file, Path) else input_file[0],
         "-movflags",
         "+faststart",
         "-v",
-        "debug",
+        "error",
         "-progress",
-        "-",
+        "pipe:1",
         "-nostats",
     ]
 
@@ -302,18 +413,17 @@ def convert(
     # -c:a is used if the file is not an matroska container
     # and we want to convert to opus
     # otherwise we use arguments from FFMPEG_FORMATS
-    if output_format == "opus" and file_format != "webm":
+    mode = get_transcode_mode(
+        file_format, output_format, input_codec, bitrate, ffmpeg_args
+    )
+
+    if mode in ["copy", "move"]:
+        # Copy the audio stream to the output file
+        arguments.extend(["-vn", "-c:a", "copy"])
+    elif output_format == "opus" and file_format != "webm":
         arguments.extend(["-c:a", "libopus"])
     else:
-        if (
-            (output_format == "opus" and file_format == "webm")
-            or (output_format == "m4a" and file_format == "m4a")
-            and not (bitrate or ffmpeg_args)
-        ):
-            # Copy the audio stream to the output file
-            arguments.extend(["-vn", "-c:a", "copy"])
-        else:
-            arguments.extend(FFMPEG_FORMATS[output_format])
+        arguments.extend(FFMPEG_FORMATS[output_format])
 
     # Add bitrate if specified
     if bitrate:
@@ -331,77 +441,51 @@ def convert(
     # Add output file at the end
     arguments.append(str(output_file.resolve()))
 
-    # Run ffmpeg
-    with subprocess.Popen(
-        [ffmpeg, *arguments],
-        stdin=subprocess.PIPE,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,
-        universal_newlines=False,
-    ) as process:
-        if not progress_handler:
-            # Wait for process to finish
-            proc_out = process.communicate()
-
-            if process.returncode != 0:
-                # get version and build year
-                version = get_ffmpeg_version(ffmpeg)
-
-                # join stdout and stderr and decode to utf-8
-                message = b"".join([out for out in proc_out if out]).decode("utf-8")
-
-                # return error dictionary
-                return False, {
-                    "return_code": process.returncode,
-                    "arguments": arguments,
-                    "ffmpeg": ffmpeg,
-                    "version": version[0],
-                    "build_year": version[1],
-                    "error": message,
-                }
-
-            return True, None
-
-        progress_handler(0)
-
-        out_buffer = []
-        total_dur = None
-        while True:
-            if process.stdout is None:
+    # Run ffmpeg, progress is written to stdout as key=value lines
+    # and errors to stderr, which goes to a file so it can't fill up the pipe
+    with (
+        tempfile.TemporaryFile() as error_file,
+        subprocess.Popen(
+            [ffmpeg, *arguments],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=error_file,
+            universal_newlines=False,
+        ) as process,
+    ):
+        if progress_handler:
+            progress_handler(0)
+
+        for line in process.stdout:  # type: ignore
+            if not (progress_handler and duration):
                 continue
 
-            out_line = (
-                process.stdout.readline().decode("utf-8", errors="replace").strip()
-            )
-
-            if out_line == "" and process.poll() is not None:
-                break
+            # out_time_ms is in microseconds as well, older versions don't have out_time_us
+            key, _, value = line.decode("utf-8", errors="replace").partition("=")
+            if key in ["out_time_us", "out_time_ms"] and value.strip().isdigit():
+                elapsed_time = int(value) / 1_000_000
+                progress_handler(min(int(elapsed_time / duration * 100), 100))
 
-            out_buffer.append(out_line.strip())
-
-            total_dur_match = DUR_REGEX.search(out_line)
-            if total_dur is None and total_dur_match:
-                total_dur = to_ms(**total_dur_match.groupdict())  # type: ignore
-                continue
-            if total_dur:
-                progress_time = TIME_REGEX.search(out_line)
-                if progress_time:
-                    elapsed_time = to_ms(**progress_time.groupdict())  # type: ignore
-                    progress_handler(int(elapsed_time / total_dur * 100))  # type: ignore
+        process.wait()
 
         if process.returncode != 0:
             # get version and build year
-            version = get_ffmpeg_version(ffmpeg)
+            version = get_cached_ffmpeg_version(ffmpeg)
+
+            error_file.seek(0)
+            message = error_file.read().decode("utf-8", errors="replace")
 
+            # return error dictionary
             return False, {
                 "return_code": process.returncode,
                 "arguments": arguments,
                 "ffmpeg": ffmpeg,
                 "version": version[0],
                 "build_year": version[1],
-                "error": "\n".join(out_buffer),
+                "error": message,
             }
 
-        progress_handler(100)
+        if progress_handler:
+            progress_handler(100)
 
         return True, None
@@ -12,11 +12,8 @@
 from typing import Any, Dict, List, Optional
 from unicodedata import normalize
 
-import pykakasi
 from rapidfuzz import fuzz
 from slugify import slugify as py_slugify
-from yt_dlp import parse_options
-from yt_dlp.utils import sanitize_filename
 
 from spotdl.types.song import Song
 
@@ -34,6 +31,16 @@
     "to_ms",
     "restrict_filename",
     "ratio",
+    "get_kakasi",
+    "configure_caches",
+    "get_cache_stats",
+    "log_cache_stats",
+    "warm_slug_cache",
+    "record_slugs",
+    "get_new_slugs",
+    "clear_new_slugs",
+    "DEFAULT_SLUGIFY_CACHE_SIZE",
+    "DEFAULT_RATIO_CACHE_SIZE",
     "smart_split",
     "create_path_object",
     "args_to_ytdlp_options",
@@ -62,7 +69,8 @@
     "{output-ext}",
 ]
 
-KKS = pykakasi.kakasi()
+# Created on first use, loading the pykakasi dictionaries is slow
+_KAKASI: Optional[Any] = None
 
 JAP_REGEX = re.compile(
     "[\u3000-\u303f\u3040-\u309f\u30a0-\u30ff\uff00-\uff9f\u4e00-\u9faf\u3400-\u4dbf]"
@@ -70,6 +78,15 @@
 
 DISALLOWED_REGEX = re.compile(r"[^-a-zA-Z0-9\!\@\$]+")
 
+DEFAULT_SLUGIFY_CACHE_SIZE = 8192
+DEFAULT_RATIO_CACHE_SIZE = 16384
+
+# Slugs loaded from the persistent slug cache, and the song slugs
+# used in this run that have to be saved to it
+SLUG_WARM_CACHE: Dict[str, str] = {}
+SLUG_NEW_ENTRIES: Dict[str, str] = {}
+_RECORD_SLUGS = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -119,7 +136,6 @@ def sanitize_string(string: str) -> str:
     return output
 
 
-@lru_cache()
 def slugify(string: str) -> str:
     """
     Slugify the string.
@@ -127,6 +143,59 @@ def slugify(string: str) -> str:
     ### Arguments
     - string: the string to slugify
 
+    ### Returns
+    - the slugified string
+
+    ### Notes
+    - Results are cached, see `configure_caches`.
+    """
+
+    return _SLUGIFY_CACHE(string)
+
+
+def _slugify(string: str) -> str:
+    """
+    Slugify the string, without the lru cache.
+
+    ### Arguments
+    - string: the string to slugify
+
+    ### Returns
+    - the slugified string
+    """
+
+    slug = SLUG_WARM_CACHE.get(string)
+    if slug is not None:
+        return slug
+
+    return _create_slug(string)
+
+
+def get_kakasi() -> Any:
+    """
+    Get the pykakasi converter used for japanese strings, creating it if needed.
+
+    ### Returns
+    - the pykakasi converter
+    """
+
+    global _KAKASI  # pylint: disable=global-statement
+
+    if _KAKASI is None:
+        import pykakasi  # pylint: disable=import-outside-toplevel
+
+        _KAKASI = pykakasi.kakasi()
+
+    return _KAKASI
+
+
+def _create_slug(string: str) -> str:
+    """
+    Create the slug of the string.
+
+    ### Arguments
+    - string: the string to slugify
+
     ### Returns
     - the slugified string
     """
@@ -145,7 +214,7 @@ def slugify(string: str) -> str:
         regex_pattern=JAP_REGEX.pattern,
     )
 
-    results = KKS.convert(normal_slug)
+    results = get_kakasi().convert(normal_slug)
 
     result = ""
     for index, item in enumerate(results):
@@ -514,6 +583,9 @@ def restrict_filename(pathobj: Path, strict: bool = True) -> Path:
     - Based on the `sanitize_filename` function from yt-dlp
     """
     if strict:
+        # pylint: disable=import-outside-toplevel
+        from yt_dlp.utils import sanitize_filename
+
         result = sanitize_filename(pathobj.name, True, False)  # type: ignore
         result = result.replace("_-_", "-")
     else:
@@ -527,7 +599,6 @@ def restrict_filename(pathobj: Path, strict: bool = True) -> Path:
     return pathobj.with_name(result)
 
 
-@lru_cache()
 def ratio(string1: str, string2: str) -> float:
     """
     Wrapper for fuzz.ratio
@@ -541,7 +612,125 @@ def ratio(string1: str, string2: str) -> float:
     - the ratio
     """
 
-    return fuzz.ratio(string1, string2)
+    return _RATIO_CACHE(string1, string2)
+
+
+def configure_caches(
+    slugify_size: Optional[int] = None, ratio_size: Optional[int] = None
+) -> None:
+    """
+    Set the sizes of the `slugify` and `ratio` caches.
+    The cached values are dropped.
+
+    ### Arguments
+    - slugify_size: Number of slugified strings to cache, None for the default.
+    - ratio_size: Number of ratios to cache, None for the default.
+    """
+
+    global _SLUGIFY_CACHE, _RATIO_CACHE  # pylint: disable=global-statement
+
+    _SLUGIFY_CACHE = lru_cache(
+        maxsize=DEFAULT_SLUGIFY_CACHE_SIZE if slugify_size is None else slugify_size
+    )(_slugify)
+
+    _RATIO_CACHE = lru_cache(
+        maxsize=DEFAULT_RATIO_CACHE_SIZE if ratio_size is None else ratio_size
+    )(fuzz.ratio)
+
+
+def get_cache_stats() -> Dict[str, Any]:
+    """
+    Get the statistics of the `slugify` and `ratio` caches.
+
+    ### Returns
+    - Dictionary with the `CacheInfo` (hits, misses, maxsize, currsize) of each cache.
+    """
+
+    return {
+        "slugify": _SLUGIFY_CACHE.cache_info(),
+        "ratio": _RATIO_CACHE.cache_info(),
+    }
+
+
+def log_cache_stats() -> None:
+    """
+    Log the hit rates of the `slugify` and `ratio` caches.
+    """
+
+    for name, info in get_cache_stats().items():
+        calls = info.hits + info.misses
+        logger.debug(
+            "%s cache: %d hits, %d misses (%.1f%% hit rate), %d/%s entries",
+            name,
+            info.hits,
+            info.misses,
+            100 * info.hits / calls if calls else 0.0,
+            info.currsize,
+            info.maxsize,
+        )
+
+
+def warm_slug_cache(slugs: Dict[str, str]) -> None:
+    """
+    Load slugified strings from a previous run,
+    and start recording the song slugs so they can be saved.
+
+    ### Arguments
+    - slugs: Dictionary of strings and their slugs.
+    """
+
+    global _RECORD_SLUGS  # pylint: disable=global-statement
+
+    SLUG_WARM_CACHE.update(slugs)
+    _RECORD_SLUGS = True
+
+
+def record_slugs(slugs: Dict[str, str]) -> None:
+    """
+    Record the slugs of song names and artists, so they can be saved.
+
+    ### Arguments
+    - slugs: Dictionary of strings and their slugs.
+
+    ### Notes
+    - Nothing is recorded if the slug cache wasn't warmed.
+    - Slugs of the search results are not recorded,
+    the same results are rarely seen again.
+    """
+
+    if _RECORD_SLUGS:
+        SLUG_NEW_ENTRIES.update(slugs)
+
+
+def get_new_slugs() -> Dict[str, str]:
+    """
+    Get the slugs that were recorded since the slug cache was warmed.
+
+    ### Returns
+    - Dictionary of strings and their slugs.
+    """
+
+    return dict(SLUG_NEW_ENTRIES)
+
+
+def clear_new_slugs(slugs: Dict[str, str]) -> None:
+    """
+    Forget the recorded slugs once they are saved,
+    they are kept in the warm cache.
+
+    ### Arguments
+    - slugs: The saved slugs, returned by `get_new_slugs`.
+    """
+
+    for string in slugs:
+        SLUG_NEW_ENTRIES.pop(string, None)
+
+    SLUG_WARM_CACHE.update(slugs)
+
+
+# Caches are replaced by configure_caches, so slugify and ratio look them up on every call
+_SLUGIFY_CACHE = lru_cache(maxsize=DEFAULT_SLUGIFY_CACHE_SIZE)(_slugify)
+_RATIO_CACHE = lru_cache(maxsize=DEFAULT_RATIO_CACHE_SIZE)(fuzz.ratio)
 
 
 def smart_split(
@@ -620,6 +809,8 @@ def args_to_ytdlp_options(
     - the dictionary of options
     """
 
+    from yt_dlp import parse_options  # pylint: disable=import-outside-toplevel
+
     parsed_options = parse_options(argument_list).ydl_opts
 
     if defaults is None:
@@ -0,0 +1,263 @@
+"""
+Module that holds the http session shared by all of the providers,
+so connections (and TLS handshakes) are reused between requests.
+
+The session is configured through `GlobalConfig`:
+- `proxies`: The proxies to use for all requests.
+- `http_pool_size`: The number of connections to keep open per host.
+- `http_retries`: The number of retries for failed requests.
+"""
+
+import asyncio
+import functools
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from spotdl.utils.config import GlobalConfig
+
+__all__ = [
+    "TimeoutHTTPAdapter",
+    "SharedSession",
+    "get_session",
+    "reset_session",
+    "get_http_executor",
+    "run_blocking",
+    "run_sync",
+    "DEFAULT_POOL_SIZE",
+    "DEFAULT_RETRIES",
+    "DEFAULT_TIMEOUT",
+]
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_SIZE = 10
+DEFAULT_RETRIES = 3
+DEFAULT_TIMEOUT = 30
+
+# Session is created per process, since sessions can't be shared after a fork
+_SESSION: Optional[Tuple[int, requests.Session]] = None
+_SESSION_LOCK = threading.Lock()
+
+_EXECUTOR: Optional[Tuple[int, ThreadPoolExecutor]] = None
+_EXECUTOR_LOCK = threading.Lock()
+
+
+class TimeoutHTTPAdapter(HTTPAdapter):
+    """
+    HTTP adapter that applies a default timeout
+    to the requests that don't set one.
+    """
+
+    def __init__(self, *args, timeout: float = DEFAULT_TIMEOUT, **kwargs):
+        """
+        Initialize the adapter.
+
+        ### Arguments
+        - timeout: The default timeout in seconds.
+        - args: Arguments passed to the `HTTPAdapter` class.
+        - kwargs: Keyword arguments passed to the `HTTPAdapter` class.
+        """
+
+        self.timeout = timeout
+        super().__init__(*args, **kwargs)
+
+    def send(self, request, *args, **kwargs):  # pylint: disable=W0221
+        """
+        Send the request, using the default timeout if none is set.
+        """
+
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.timeout
+
+        return super().send(request, *args, **kwargs)
+
+
+class SharedSession(requests.Session):
+    """
+    Session that sends every request through the shared session.
+    Clients that keep a reference to their session (ytmusicapi)
+    keep working after the shared session is reset.
+    """
+
+    def request(self, method, url, *args, **kwargs):  # pylint: disable=W0221
+        """
+        Send the request with the current shared session.
+        """
+
+        return get_session().request(method, url, *args, **kwargs)
+
+
+def create_session() -> requests.Session:
+    """
+    Create a new session using the settings from `GlobalConfig`.
+
+    ### Returns
+    - The new session.
+    """
+
+    pool_size = GlobalConfig.get_parameter("http_pool_size") or DEFAULT_POOL_SIZE
+    retries = GlobalConfig.get_parameter("http_retries")
+    proxies = GlobalConfig.get_parameter("proxies")
+
+    retry = Retry(
+        total=DEFAULT_RETRIES if retries is None else retries,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=("GET", "HEAD"),
+        raise_on_status=False,
+        respect_retry_after_header=True,
+    )
+
+    adapter = TimeoutHTTPAdapter(
+        pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry
+    )
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    if proxies:
+        # Environment proxies would take priority over the session proxies
+        session.trust_env = False
+        session.proxies.update(proxies)
+
+    logger.debug("Created http session, pool size: %s", pool_size)
+
+    return session
+
+
+def get_session() -> requests.Session:
+    """
+    Get the shared session, creating it if needed.
+
+    ### Returns
+    - The shared session.
+
+    ### Notes
+    - Headers are not set on the shared session, pass them with every request.
+    """
+
+    global _SESSION  # pylint: disable=global-statement
+
+    with _SESSION_LOCK:
+        if _SESSION is None or _SESSION[0] != os.getpid():
+            _SESSION = (os.getpid(), create_session())
+
+        return _SESSION[1]
+
+
+def reset_session() -> None:
+    """
+    Close the shared session and the http executor, the next calls
+    to `get_session` and `get_http_executor` will create new ones
+    with the current settings.
+
+    ### Notes
+    - Calls that are already running on the old executor are finished.
+    """
+
+    global _SESSION, _EXECUTOR  # pylint: disable=global-statement
+
+    with _SESSION_LOCK:
+        if _SESSION is not None:
+            pid, session = _SESSION
+            if pid == os.getpid():
+                session.close()
+
+        _SESSION = None
+
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is not None:
+            pid, executor = _EXECUTOR
+            if pid == os.getpid():
+                executor.shutdown(wait=False)
+
+        _EXECUTOR = None
+
+
+def get_http_executor() -> ThreadPoolExecutor:
+    """
+    Get the executor used to run blocking http calls from coroutines.
+    It has as many workers as there are connections in the session pool.
+
+    ### Returns
+    - The shared executor.
+    """
+
+    global _EXECUTOR  # pylint: disable=global-statement
+
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None or _EXECUTOR[0] != os.getpid():
+            pool_size = (
+                GlobalConfig.get_parameter("http_pool_size") or DEFAULT_POOL_SIZE
+            )
+
+            _EXECUTOR = (
+                os.getpid(),
+                ThreadPoolExecutor(
+                    max_workers=pool_size, thread_name_prefix="spotdl-http"
+                ),
+            )
+
+        return _EXECUTOR[1]
+
+
+async def run_blocking(func: Callable[..., Any], *args, **kwargs) -> Any:
+    """
+    Run a blocking function on the http executor without blocking the event loop.
+
+    ### Arguments
+    - func: The function to run.
+    - args: Arguments passed to the function.
+    - kwargs: Keyword arguments passed to the function.
+
+    ### Returns
+    - The return value of the function.
+    """
+
+    loop = asyncio.get_running_loop()
+
+    return await loop.run_in_executor(
+        get_http_executor(), functools.partial(func, *args, **kwargs)
+    )
+
+
+def run_sync(coroutine: Awaitable[Any]) -> Any:
+    """
+    Run a coroutine to completion from synchronous code.
+
+    ### Arguments
+    - coroutine: The coroutine to run.
+
+    ### Returns
+    - The return value of the coroutine.
+
+    ### Notes
+    - Unlike `asyncio.run` this doesn't replace the event loop of the current thread,
+    so it's safe to use next to the downloader loop.
+    - It can't be called from a running event loop.
+    """
+
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        try:
+            # Let the cancelled tasks (losing providers etc.) finish cleanly
+            pending = asyncio.all_tasks(loop)
+            for task in pending:
+                task.cancel()
+
+            if pending:
+                loop.run_until_complete(
+                    asyncio.gather(*pending, return_exceptions=True)
+                )
+        finally:
+            loop.close()
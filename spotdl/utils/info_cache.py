@@ -0,0 +1,247 @@
+"""
+Module that holds the yt-dlp info dict cache.
+The search stage extracts the info of the candidates to get their views,
+the cached info is reused by the download stage, so the winner isn't extracted twice.
+
+Only unprocessed info dicts (`extract_info(url, process=False)`) are cached,
+every user processes its own copy with the format options of its yt-dlp handle.
+The entries are keyed by the source of the info dict (yt-dlp, piped) and the url,
+since the sources build different dicts for the same url.
+Media urls expire after a few hours, so the entries are only kept for a short time.
+"""
+
+import copy
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+__all__ = [
+    "InfoCache",
+    "get_info_cache",
+    "reset_info_cache",
+    "DEFAULT_INFO_CACHE_SIZE",
+    "DEFAULT_INFO_CACHE_TTL",
+    "DEFAULT_INFO_SOURCE",
+]
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INFO_CACHE_SIZE = 256
+DEFAULT_INFO_CACHE_TTL = 600
+DEFAULT_INFO_SOURCE = "yt-dlp"
+
+# Cache is created per process, like the http session
+_CACHE: Optional[Tuple[int, "InfoCache"]] = None
+_CACHE_LOCK = threading.Lock()
+
+
+class InfoCache:
+    """
+    Size bounded in memory cache of info dicts that expire after a ttl.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_INFO_CACHE_SIZE,
+        ttl: float = DEFAULT_INFO_CACHE_TTL,
+    ) -> None:
+        """
+        Initialize the info cache.
+
+        ### Arguments
+        - max_entries: Maximum number of info dicts to keep.
+        - ttl: Number of seconds after which the info dicts expire.
+        """
+
+        self.max_entries = max_entries
+        self.ttl = ttl
+
+        self.entries: "OrderedDict[Tuple[str, str], Tuple[float, Dict[str, Any]]]" = (
+            OrderedDict()
+        )
+        self.lock = threading.Lock()
+        self.key_locks: Dict[Tuple[str, str], threading.Lock] = {}
+        self.key_users: Dict[Tuple[str, str], int] = {}
+
+        self.hits = 0
+        self.misses = 0
+
+    def get(
+        self, url: str, source: str = DEFAULT_INFO_SOURCE
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get a copy of the cached info dict.
+
+        ### Arguments
+        - url: The url of the video.
+        - source: The source that built the info dict.
+
+        ### Returns
+        - The info dict or None if it's not cached or expired.
+        """
+
+        key = (source, url)
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+
+            timestamp, info = entry
+            if time.monotonic() - timestamp > self.ttl:
+                del self.entries[key]
+                return None
+
+            self.entries.move_to_end(key)
+
+        return copy.deepcopy(info)
+
+    def set(
+        self, url: str, info: Dict[str, Any], source: str = DEFAULT_INFO_SOURCE
+    ) -> None:
+        """
+        Store a copy of the info dict and evict the least recently used entries.
+
+        ### Arguments
+        - url: The url of the video.
+        - info: The unprocessed info dict.
+        - source: The source that built the info dict.
+        """
+
+        if not self.max_entries:
+            return None
+
+        key = (source, url)
+        with self.lock:
+            self.entries[key] = (time.monotonic(), copy.deepcopy(info))
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+        return None
+
+    def get_or_fetch(
+        self,
+        url: str,
+        fetch: Callable[[str], Optional[Dict[str, Any]]],
+        source: str = DEFAULT_INFO_SOURCE,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get the info dict, extracting it if it's not cached.
+
+        ### Arguments
+        - url: The url of the video.
+        - fetch: Function that extracts the unprocessed info dict.
+        - source: The source that builds the info dict.
+
+        ### Returns
+        - A copy of the info dict, that can be modified by the caller.
+
+        ### Notes
+        - Threads requesting the same url wait for the first extraction
+        instead of extracting the info again.
+        """
+
+        info = self.get(url, source)
+        if info is not None:
+            with self.lock:
+                self.hits += 1
+
+            return info
+
+        key = (source, url)
+        with self.lock:
+            self.key_users[key] = self.key_users.get(key, 0) + 1
+            key_lock = self.key_locks.setdefault(key, threading.Lock())
+
+        try:
+            with key_lock:
+                # Another thread might have extracted the info while we were waiting
+                info = self.get(url, source)
+                if info is not None:
+                    with self.lock:
+                        self.hits += 1
+
+                    return info
+
+                with self.lock:
+                    self.misses += 1
+
+                info = fetch(url)
+                if info is not None:
+                    self.set(url, info, source)
+        finally:
+            # Drop the lock only once no other thread holds or waits for it
+            with self.lock:
+                self.key_users[key] -= 1
+                if self.key_users[key] == 0:
+                    del self.key_users[key]
+                    del self.key_locks[key]
+
+        return info
+
+    def remove(self, url: str, source: str = DEFAULT_INFO_SOURCE) -> None:
+        """
+        Remove the info dict of a video, e.g. when its media urls expired.
+
+        ### Arguments
+        - url: The url of the video.
+        - source: The source that built the info dict.
+        """
+
+        with self.lock:
+            self.entries.pop((source, url), None)
+
+    def clear(self) -> None:
+        """
+        Remove all entries from the cache.
+        """
+
+        with self.lock:
+            self.entries.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get the statistics of the cache.
+
+        ### Returns
+        - Dictionary with the number of hits, misses and cached entries.
+        """
+
+        with self.lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self.entries),
+            }
+
+
+def get_info_cache() -> InfoCache:
+    """
+    Get the info cache shared by the search and download stages.
+
+    ### Returns
+    - The shared info cache.
+    """
+
+    global _CACHE  # pylint: disable=global-statement
+
+    with _CACHE_LOCK:
+        if _CACHE is None or _CACHE[0] != os.getpid():
+            _CACHE = (os.getpid(), InfoCache())
+
+        return _CACHE[1]
+
+
+def reset_info_cache() -> None:
+    """
+    Drop the shared info cache, the next call to `get_info_cache`
+    will create a new one.
+    """
+
+    global _CACHE  # pylint: disable=global-statement
+
+    with _CACHE_LOCK:
+        _CACHE = None
@@ -0,0 +1,223 @@
+"""
+Module that holds the job journal.
+Every download stage that a song completes is appended to the journal as a json line,
+so an interrupted run can be resumed without downloading the finished songs again.
+
+```python
+journal = JobJournal("journal.jsonl", resume=True)
+entry = journal.get(song)
+journal.record(song, "search", download_url="https://...")
+```
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+from spotdl.types.song import Song
+
+__all__ = ["JournalEntry", "JobJournal"]
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class JournalEntry:
+    """
+    Last recorded state of a song.
+    """
+
+    key: str
+    stage: Optional[str]
+    finished: bool
+    download_url: Optional[str] = None
+    path: Optional[str] = None
+    error: Optional[str] = None
+    timestamp: float = 0.0
+    transcode_mode: Optional[str] = None
+    metadata_only: bool = False
+
+    @property
+    def done(self) -> bool:
+        """
+        Check if the song doesn't have to be processed again.
+
+        ### Returns
+        - True if the song finished without an error and its file still exists.
+        """
+
+        if not self.finished or self.error is not None:
+            return False
+
+        return self.path is None or Path(self.path).exists()
+
+    @property
+    def output_path(self) -> Optional[Path]:
+        """
+        Get the path to the downloaded file.
+
+        ### Returns
+        - The path or None if the song wasn't downloaded.
+        """
+
+        return Path(self.path) if self.path else None
+
+
+class JobJournal:
+    """
+    Append only journal of the download jobs, stored as json lines.
+    """
+
+    def __init__(self, path: Union[str, Path], resume: bool = False) -> None:
+        """
+        Open the journal.
+
+        ### Arguments
+        - path: The path to the journal file.
+        - resume: Load the entries of the previous run,
+        otherwise the journal is cleared.
+        """
+
+        self.path = Path(path)
+        self.entries: Dict[str, JournalEntry] = {}
+        self._lock = threading.Lock()
+
+        if resume and self.path.exists():
+            self.load()
+        else:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text("", encoding="utf-8")
+
+        # Line buffered, so every entry is written as soon as it's recorded
+        self._file = open(  # pylint: disable=consider-using-with
+            self.path, "a", encoding="utf-8", buffering=1
+        )
+
+    @staticmethod
+    def get_key(song: Song) -> str:
+        """
+        Get the journal key of the song.
+
+        ### Arguments
+        - song: The song to get the key for.
+
+        ### Returns
+        - The url of the song, or its display name if it has no url.
+        """
+
+        return song.url or song.display_name
+
+    def load(self) -> None:
+        """
+        Load the journal file, the last entry of every song wins.
+        """
+
+        with open(self.path, "r", encoding="utf-8") as journal_file:
+            for line_number, line in enumerate(journal_file, 1):
+                if not line.strip():
+                    continue
+
+                try:
+                    entry = JournalEntry(**json.loads(line))
+                except (ValueError, TypeError):
+                    # The last line might be incomplete if the run was killed
+                    logger.debug("Skipping invalid journal line %d", line_number)
+                    continue
+
+                self.entries[entry.key] = entry
+
+        logger.debug("Loaded %d entries from %s", len(self.entries), self.path)
+
+    def get(self, song: Song) -> Optional[JournalEntry]:
+        """
+        Get the last recorded state of the song.
+
+        ### Arguments
+        - song: The song to get the state for.
+
+        ### Returns
+        - The journal entry or None if the song isn't in the journal.
+        """
+
+        return self.entries.get(self.get_key(song))
+
+    def record(
+        self,
+        song: Song,
+        stage: Optional[str],
+        finished: bool = False,
+        download_url: Optional[str] = None,
+        path: Optional[Path] = None,
+        error: Optional[str] = None,
+        transcode_mode: Optional[str] = None,
+        metadata_only: bool = False,
+    ) -> JournalEntry:
+        """
+        Append the state of the song to the journal.
+
+        ### Arguments
+        - song: The song to record.
+        - stage: The last download stage the song completed.
+        - finished: Whether the song went through all of its stages.
+        - download_url: The url the song is downloaded from.
+        - path: The path to the downloaded file.
+        - error: The error that stopped the song.
+        - transcode_mode: How the audio was converted, see `get_transcode_mode`.
+        - metadata_only: Whether only the metadata of an existing file is updated.
+
+        ### Returns
+        - The recorded entry.
+        """
+
+        entry = JournalEntry(
+            key=self.get_key(song),
+            stage=stage,
+            finished=finished,
+            download_url=download_url,
+            path=str(path) if path else None,
+            error=error,
+            timestamp=time.time(),
+            transcode_mode=transcode_mode,
+            metadata_only=metadata_only,
+        )
+
+        with self._lock:
+            self.entries[entry.key] = entry
+            self._file.write(json.dumps(asdict(entry), ensure_ascii=False) + "\n")
+
+        return entry
+
+    def flush(self) -> None:
+        """
+        Sync the recorded entries to disk.
+        """
+
+        with self._lock:
+            if not self._file.closed:
+                self._file.flush()
+                os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        """
+        Sync and close the journal file.
+        """
+
+        self.flush()
+
+        with self._lock:
+            self._file.close()
+
+    def __len__(self) -> int:
+        """
+        Get the number of songs in the journal.
+
+        ### Returns
+        - The number of songs.
+        """
+
+        return len(self.entries)
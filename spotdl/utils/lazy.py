@@ -0,0 +1,88 @@
+"""
+Module that holds the helpers for importing modules lazily.
+Heavy libraries (yt-dlp, ytmusicapi, fastapi...) are only imported
+when they are used, so the cli starts quickly.
+
+```python
+PROVIDERS = LazyRegistry({"youtube": "spotdl.providers.audio.youtube:YouTube"})
+"youtube" in PROVIDERS  # doesn't import anything
+PROVIDERS["youtube"]  # imports the module and returns the class
+```
+"""
+
+import importlib
+import threading
+from typing import Any, Dict, Iterator, Mapping, TypeVar
+
+__all__ = ["LazyRegistry", "import_object"]
+
+T = TypeVar("T")
+
+
+def import_object(path: str) -> Any:
+    """
+    Import an object from its path.
+
+    ### Arguments
+    - path: The path to the object, in the `module:attribute` format.
+
+    ### Returns
+    - The imported object.
+    """
+
+    module_name, _, attribute = path.partition(":")
+    module = importlib.import_module(module_name)
+
+    return getattr(module, attribute) if attribute else module
+
+
+class LazyRegistry(Mapping[str, T]):
+    """
+    Read only mapping of names to objects that are imported on first access.
+    Checking the names (`in`, `keys()`, `len()`) doesn't import anything.
+    """
+
+    def __init__(self, paths: Dict[str, str]) -> None:
+        """
+        Initialize the registry.
+
+        ### Arguments
+        - paths: Dictionary of names and object paths, see `import_object`.
+        """
+
+        self._paths = dict(paths)
+        self._objects: Dict[str, T] = {}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, name: str) -> T:
+        """
+        Get the object, importing it if needed.
+
+        ### Arguments
+        - name: The name of the object.
+
+        ### Returns
+        - The imported object.
+        """
+
+        if name in self._objects:
+            return self._objects[name]
+
+        path = self._paths[name]
+        with self._lock:
+            if name not in self._objects:
+                self._objects[name] = import_object(path)
+
+        return self._objects[name]
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._paths
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._paths)
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self._paths)})"
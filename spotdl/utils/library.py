@@ -0,0 +1,149 @@
+"""
+Module that holds the library index.
+It remembers the spotify url of every song file in the output directory,
+so only new and changed files have to be read when scanning for songs.
+"""
+
+import logging
+import os
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from spotdl.utils.store import SQLiteStore
+
+__all__ = ["LibraryIndex"]
+
+logger = logging.getLogger(__name__)
+
+
+class LibraryIndex(SQLiteStore):
+    """
+    Sqlite backed index of the song files in the library.
+    """
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS files (
+        path TEXT PRIMARY KEY,
+        size INTEGER NOT NULL,
+        mtime REAL NOT NULL,
+        url TEXT,
+        format TEXT NOT NULL,
+        isrc TEXT
+    );
+    CREATE INDEX IF NOT EXISTS files_format ON files (format);
+    """
+
+    def scan(
+        self,
+        base_dir: Path,
+        output_format: str,
+        resolve: Callable[[Path], Tuple[Optional[str], Optional[str]]],
+    ) -> Dict[str, List[Path]]:
+        """
+        Scan the directory for song files, updating the index
+        for the files that were added, changed or removed since the last scan.
+
+        ### Arguments
+        - base_dir: The directory to scan.
+        - output_format: The format of the files to scan for.
+        - resolve: Function that returns the spotify url and isrc of a new/changed file.
+
+        ### Returns
+        - Dictionary containing all known songs and their paths
+        """
+
+        base_path = str(base_dir.absolute())
+        prefix = base_path if base_path.endswith(os.sep) else base_path + os.sep
+
+        indexed = {
+            path: (size, mtime, url)
+            for path, size, mtime, url in self.execute(
+                "SELECT path, size, mtime, url FROM files WHERE format = ?",
+                (output_format,),
+            )
+            if path.startswith(prefix)
+        }
+
+        known_songs: Dict[str, List[Path]] = {}
+        updates = []
+        for path in base_dir.glob(f"**/*.{output_format}"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+
+            key = str(path.absolute())
+            entry = indexed.pop(key, None)
+            if (
+                entry is not None
+                and entry[0] == stat.st_size
+                and entry[1] == stat.st_mtime
+            ):
+                url = entry[2]
+            else:
+                url, isrc = resolve(path)
+                updates.append(
+                    (key, stat.st_size, stat.st_mtime, url, output_format, isrc)
+                )
+
+            if url is None:
+                continue
+
+            known_songs.setdefault(url, []).append(path)
+
+        self.executemany(
+            "INSERT OR REPLACE INTO files (path, size, mtime, url, format, isrc) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            updates,
+        )
+
+        # Files that weren't found anymore have been removed
+        self.executemany("DELETE FROM files WHERE path = ?", [(p,) for p in indexed])
+
+        logger.debug(
+            "Library index: %d new/changed files, %d removed files",
+            len(updates),
+            len(indexed),
+        )
+
+        return known_songs
+
+    def add(self, path: Path, url: Optional[str], isrc: Optional[str] = None) -> None:
+        """
+        Add a file that was written by spotdl to the index.
+
+        ### Arguments
+        - path: The path to the file.
+        - url: The spotify url of the song.
+        - isrc: The isrc of the song.
+        """
+
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+
+        self.execute(
+            "INSERT OR REPLACE INTO files (path, size, mtime, url, format, isrc) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                str(path.absolute()),
+                stat.st_size,
+                stat.st_mtime,
+                url,
+                path.suffix[1:],
+                isrc,
+            ),
+        )
+
+        return None
+
+    def remove(self, path: Path) -> None:
+        """
+        Remove a file from the index.
+
+        ### Arguments
+        - path: The path to the file.
+        """
+
+        self.execute("DELETE FROM files WHERE path = ?", (str(path.absolute()),))
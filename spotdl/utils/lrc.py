@@ -5,33 +5,50 @@
 import logging
 import re
 from pathlib import Path
-
-from syncedlyrics import search as syncedlyrics_search
-from syncedlyrics.utils import Lyrics, TargetType, has_translation
+from typing import Optional
 
 from spotdl.types.song import Song
+from spotdl.utils.lyrics_cache import LyricsCache
 
 logger = logging.getLogger(__name__)
 
 __all__ = ["generate_lrc", "remomve_lrc"]
 
 
-def generate_lrc(song: Song, output_file: Path):
+def generate_lrc(
+    song: Song, output_file: Path, lyrics_cache: Optional[LyricsCache] = None
+):
     """
     Generates an LRC file for the current song
 
     ### Arguments
     - song: Song object
     - output_file: Path to the output file
+    - lyrics_cache: Lyrics cache to look up and store the lrc data in
     """
 
+    # pylint: disable=import-outside-toplevel
+    from syncedlyrics import search as syncedlyrics_search
+    from syncedlyrics.utils import Lyrics, TargetType, has_translation
+
     if song.lyrics and has_translation(song.lyrics):
         lrc_data = song.lyrics
     else:
-        try:
-            lrc_data = syncedlyrics_search(song.display_name)
-        except Exception:
-            lrc_data = None
+        cached_lrc = (
+            lyrics_cache.get(song, kind="lrc") if lyrics_cache is not None else None
+        )
+
+        if cached_lrc is not None:
+            lrc_data = cached_lrc.lyrics
+        else:
+            try:
+                lrc_data = syncedlyrics_search(song.display_name)
+            except Exception:
+                lrc_data = None
+            else:
+                # Failed searches are not cached, they might succeed next time
+                if lyrics_cache is not None:
+                    lyrics_cache.set(song, lrc_data, "syncedlyrics", kind="lrc")
 
     if lrc_data:
         Lyrics(lrc_data).save_lrc_file(
@@ -0,0 +1,218 @@
+"""
+Module that holds the persistent lyrics cache.
+It stores the lyrics found by the lyrics providers, and the songs
+that no provider has lyrics for, so they don't have to be searched again.
+
+```python
+cache = LyricsCache("lyrics_cache.db")
+cache.set(song, "lyrics...", "Genius")
+cached = cache.get(song)
+```
+"""
+
+import logging
+import re
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Union
+
+from spotdl.types.song import Song
+from spotdl.utils.formatter import slugify
+from spotdl.utils.store import SQLiteStore
+
+__all__ = ["CachedLyrics", "LyricsCache", "is_synced"]
+
+logger = logging.getLogger(__name__)
+
+SYNCED_REGEX = re.compile(r"^\[\d+:\d+(?:[.:]\d+)?\]", re.MULTILINE)
+
+
+def is_synced(lyrics: str) -> bool:
+    """
+    Check if the lyrics have lrc timestamps.
+
+    ### Arguments
+    - lyrics: The lyrics to check.
+
+    ### Returns
+    - True if the lyrics are synced.
+    """
+
+    return SYNCED_REGEX.search(lyrics) is not None
+
+
+@dataclass(frozen=True)
+class CachedLyrics:
+    """
+    Lyrics stored in the lyrics cache.
+    `lyrics` is None for songs that have no lyrics.
+    """
+
+    lyrics: Optional[str]
+    provider: str
+    synced: bool
+    timestamp: float
+
+
+class LyricsCache(SQLiteStore):
+    """
+    Sqlite backed cache of song lyrics.
+    """
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS lyrics (
+        key TEXT PRIMARY KEY,
+        lyrics TEXT,
+        provider TEXT NOT NULL,
+        synced INTEGER NOT NULL,
+        timestamp REAL NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS lyrics_timestamp ON lyrics (timestamp);
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        ttl: Optional[int] = 90,
+        negative_ttl: Optional[int] = 7,
+    ) -> None:
+        """
+        Open the lyrics cache and remove the expired entries.
+
+        ### Arguments
+        - path: The path to the cache file.
+        - ttl: Number of days after which the lyrics expire, None to never expire.
+        - negative_ttl: Number of days after which songs without lyrics
+        are searched again, None to never search again.
+        """
+
+        super().__init__(path)
+
+        self.ttl = ttl * 86400 if ttl else None
+        self.negative_ttl = negative_ttl * 86400 if negative_ttl else None
+
+        now = time.time()
+        if self.ttl:
+            self.execute(
+                "DELETE FROM lyrics WHERE lyrics IS NOT NULL AND timestamp < ?",
+                (now - self.ttl,),
+            )
+
+        if self.negative_ttl:
+            self.execute(
+                "DELETE FROM lyrics WHERE lyrics IS NULL AND timestamp < ?",
+                (now - self.negative_ttl,),
+            )
+
+    @staticmethod
+    def get_keys(song: Song, kind: str = "lyrics") -> List[str]:
+        """
+        Get the cache keys for the song.
+
+        ### Arguments
+        - song: The song to get the keys for.
+        - kind: The kind of lyrics, "lyrics" for the lyrics providers
+        and "lrc" for the lrc files.
+
+        ### Returns
+        - list of keys, the song id first and the normalized name second.
+        """
+
+        keys = []
+        if song.song_id:
+            keys.append(f"{kind}:id:{song.song_id}")
+
+        artists = ",".join(slugify(artist) for artist in song.artists)
+        keys.append(f"{kind}:name:{slugify(song.name)}|{artists}")
+
+        return keys
+
+    def get(
+        self,
+        song: Song,
+        providers: Optional[List[str]] = None,
+        kind: str = "lyrics",
+    ) -> Optional[CachedLyrics]:
+        """
+        Get the cached lyrics for the song.
+
+        ### Arguments
+        - song: The song to get the lyrics for.
+        - providers: Names of the lyrics providers that are used.
+        - kind: The kind of lyrics, see `get_keys`.
+
+        ### Returns
+        - The cached lyrics or None if the song is not in the cache.
+
+        ### Notes
+        - Songs without lyrics are only returned if they were searched for
+        with all of the providers.
+        """
+
+        now = time.time()
+        for key in self.get_keys(song, kind):
+            rows = self.execute(
+                "SELECT lyrics, provider, synced, timestamp FROM lyrics WHERE key = ?",
+                (key,),
+            )
+
+            if not rows:
+                continue
+
+            lyrics, provider, synced, timestamp = rows[0]
+            ttl = self.ttl if lyrics is not None else self.negative_ttl
+            if ttl and timestamp < now - ttl:
+                continue
+
+            if providers is not None:
+                if lyrics is not None and provider not in providers:
+                    continue
+
+                # Negative results store all of the providers that were tried
+                if lyrics is None and not set(providers) <= set(provider.split(",")):
+                    continue
+
+            return CachedLyrics(lyrics, provider, bool(synced), timestamp)
+
+        return None
+
+    def set(
+        self,
+        song: Song,
+        lyrics: Optional[str],
+        provider: str,
+        kind: str = "lyrics",
+    ) -> None:
+        """
+        Store the lyrics for the song.
+
+        ### Arguments
+        - song: The song the lyrics were searched for.
+        - lyrics: The lyrics, None if no lyrics were found.
+        - provider: The name of the lyrics provider that found the lyrics,
+        or the comma separated names of all providers if no lyrics were found.
+        - kind: The kind of lyrics, see `get_keys`.
+        """
+
+        timestamp = time.time()
+        synced = lyrics is not None and is_synced(lyrics)
+        self.executemany(
+            "INSERT OR REPLACE INTO lyrics "
+            "(key, lyrics, provider, synced, timestamp) "
+            "VALUES (?, ?, ?, ?, ?)",
+            [
+                (key, lyrics, provider, int(synced), timestamp)
+                for key in self.get_keys(song, kind)
+            ],
+        )
+
+    def __len__(self) -> int:
+        """
+        Get the number of entries in the cache.
+
+        ### Returns
+        - The number of entries.
+        """
+
+        return self.execute("SELECT COUNT(*) FROM lyrics")[0][0]
@@ -0,0 +1,187 @@
+"""
+Module that holds the persistent match cache.
+It maps spotify track ids and isrc codes to the download urls
+found by the audio providers, so songs don't have to be matched again.
+
+```python
+cache = MatchCache("match_cache.db", ttl=30)
+cache.set(song, "https://music.youtube.com/watch?v=...", 95.0, "YouTubeMusic")
+match = cache.get(song)
+```
+"""
+
+import logging
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Union
+
+from spotdl.types.song import Song
+from spotdl.utils.store import SQLiteStore
+
+__all__ = ["CachedMatch", "MatchCache"]
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CachedMatch:
+    """
+    Match stored in the match cache.
+    """
+
+    url: str
+    score: float
+    provider: str
+    verified: bool
+    timestamp: float
+
+
+class MatchCache(SQLiteStore):
+    """
+    Sqlite backed cache of song matches.
+    """
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS matches (
+        key TEXT PRIMARY KEY,
+        url TEXT NOT NULL,
+        score REAL NOT NULL,
+        provider TEXT NOT NULL,
+        verified INTEGER NOT NULL,
+        timestamp REAL NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS matches_timestamp ON matches (timestamp);
+    """
+
+    def __init__(self, path: Union[str, Path], ttl: Optional[int] = 30) -> None:
+        """
+        Open the match cache and remove the expired entries.
+
+        ### Arguments
+        - path: The path to the cache file.
+        - ttl: Number of days after which the matches expire, None to never expire.
+        """
+
+        super().__init__(path)
+
+        self.ttl = ttl * 86400 if ttl else None
+
+        if self.ttl:
+            self.execute(
+                "DELETE FROM matches WHERE timestamp < ?", (time.time() - self.ttl,)
+            )
+
+    @staticmethod
+    def get_keys(song: Song) -> List[str]:
+        """
+        Get the cache keys for the song.
+
+        ### Arguments
+        - song: The song to get the keys for.
+
+        ### Returns
+        - list of keys, the song id first and the isrc second.
+        """
+
+        keys = []
+        if song.song_id:
+            keys.append(f"id:{song.song_id}")
+
+        if song.isrc:
+            keys.append(f"isrc:{song.isrc}")
+
+        return keys
+
+    def get(
+        self,
+        song: Song,
+        providers: Optional[List[str]] = None,
+        only_verified: bool = False,
+    ) -> Optional[CachedMatch]:
+        """
+        Get the cached match for the song.
+
+        ### Arguments
+        - song: The song to get the match for.
+        - providers: Names of the audio providers to accept matches from.
+        - only_verified: Whether to only return verified matches.
+
+        ### Returns
+        - The cached match or None if the song is not in the cache.
+        """
+
+        min_timestamp = time.time() - self.ttl if self.ttl else 0
+        for key in self.get_keys(song):
+            rows = self.execute(
+                "SELECT url, score, provider, verified, timestamp FROM matches "
+                "WHERE key = ? AND timestamp >= ?",
+                (key, min_timestamp),
+            )
+
+            if not rows:
+                continue
+
+            url, score, provider, verified, timestamp = rows[0]
+            if providers is not None and provider not in providers:
+                continue
+
+            if only_verified and not verified:
+                continue
+
+            return CachedMatch(url, score, provider, bool(verified), timestamp)
+
+        return None
+
+    def set(
+        self,
+        song: Song,
+        url: str,
+        score: float,
+        provider: str,
+        verified: bool = False,
+    ) -> None:
+        """
+        Store the match for the song.
+
+        ### Arguments
+        - song: The song that was matched.
+        - url: The url of the match.
+        - score: The match score.
+        - provider: The name of the audio provider that found the match.
+        - verified: Whether the match is a verified result.
+        """
+
+        timestamp = time.time()
+        self.executemany(
+            "INSERT OR REPLACE INTO matches "
+            "(key, url, score, provider, verified, timestamp) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                (key, url, score, provider, int(verified), timestamp)
+                for key in self.get_keys(song)
+            ],
+        )
+
+    def delete(self, song: Song) -> None:
+        """
+        Remove the match for the song.
+
+        ### Arguments
+        - song: The song to remove.
+        """
+
+        self.executemany(
+            "DELETE FROM matches WHERE key = ?",
+            [(key,) for key in self.get_keys(song)],
+        )
+
+    def __len__(self) -> int:
+        """
+        Get the number of entries in the cache.
+
+        ### Returns
+        - The number of entries.
+        """
+
+        return self.execute("SELECT COUNT(*) FROM matches")[0][0]
@@ -2,10 +2,15 @@
 Module for all things matching related
 """
 
+# pylint: disable=too-many-lines
+
 import logging
+from dataclasses import dataclass
 from itertools import product, zip_longest
 from math import exp
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from rapidfuzz import fuzz, process
 
 from spotdl.types.result import Result
 from spotdl.types.song import Song
@@ -13,12 +18,14 @@
     create_search_query,
     create_song_title,
     ratio,
+    record_slugs,
     slugify,
 )
 from spotdl.utils.logging import MATCH
 
 __all__ = [
     "FORBIDDEN_WORDS",
+    "MatchContext",
     "fill_string",
     "create_clean_string",
     "sort_string",
@@ -35,6 +42,9 @@
     "calc_name_match",
     "calc_time_match",
     "calc_album_match",
+    "calc_album_matches",
+    "filter_candidates",
+    "order_results",
 ]
 
 logger = logging.getLogger(__name__)
@@ -60,15 +70,133 @@
 ]
 
 
-def debug(song_id: str, result_id: str, message: str) -> None:
+def debug(song_id: str, result_id: str, message: str, *args) -> None:
     """
     Log a message with MATCH level
 
     ### Arguments
-    - message: message to log
+    - message: message to log, formatted with `args` only if MATCH level is enabled
+    - args: arguments for the message
+    """
+
+    logger.log(MATCH, "[%s|%s] " + message, song_id, result_id, *args)
+
+
+@dataclass(frozen=True)
+class MatchContext:
+    """
+    Normalized forms of the song, created once per song
+    so that matching the results only has to normalize the result side.
+    """
+
+    # slugify(song.name) and its variants
+    slug_name: str
+    slug_name_joined: str
+    name_words: Tuple[str, ...]
+
+    # slugify(create_song_title(...)) or the slugified search query
+    slug_title: str
+
+    # slugify(create_song_title(song.name, [song.artist]))
+    slug_main_title: str
+
+    # slugify(song.artist) and slugify(song.album_name)
+    slug_artist: str
+    slug_album: str
+
+    # slugify of every song artist, and the same without dashes
+    slug_artists: Tuple[str, ...]
+    slug_artists_joined: Tuple[str, ...]
+
+    # Words of every artist sorted and joined (used for single artist results)
+    sorted_artists: Tuple[str, ...]
+
+    # Words of all of the artists
+    artist_words: Tuple[str, ...]
+
+    # Artists without the words of the song name, sorted and joined
+    clean_artists: str
+
+    # Forbidden words that are not part of the song name
+    forbidden_words: Tuple[str, ...]
+
+    @classmethod
+    def from_song(
+        cls, song: Song, search_query: Optional[str] = None
+    ) -> "MatchContext":
+        """
+        Create the match context for the song.
+
+        ### Arguments
+        - song: song to match
+        - search_query: search query used to find the results
+
+        ### Returns
+        - The match context.
+        """
+
+        slug_name = slugify(song.name)
+        slug_name_joined = slug_name.replace("-", "")
+        slug_artists = tuple(slugify(artist) for artist in song.artists)
+
+        # Only the song names and artists are saved in the slug cache
+        record_slugs({song.name: slug_name, **dict(zip(song.artists, slug_artists))})
+
+        return cls(
+            slug_name=slug_name,
+            slug_name_joined=slug_name_joined,
+            name_words=tuple(slug_name.split("-")),
+            slug_title=slugify(
+                create_song_title(song.name, song.artists)
+                if not search_query
+                else create_search_query(song, search_query, False, None, True)
+            ),
+            # Partial songs (from_missing_data) might not have these fields
+            slug_main_title=(
+                slugify(create_song_title(song.name, [song.artist]))
+                if song.artist
+                else slug_name
+            ),
+            slug_artist=slugify(song.artist) if song.artist else "",
+            slug_album=slugify(song.album_name) if song.album_name else "",
+            slug_artists=slug_artists,
+            slug_artists_joined=tuple(
+                artist.replace("-", "") for artist in slug_artists
+            ),
+            sorted_artists=tuple(
+                sort_string(artist.split("-"), "-") for artist in slug_artists
+            ),
+            artist_words=tuple(
+                word for artist in slug_artists for word in artist.split("-")
+            ),
+            clean_artists=create_clean_string(song.artists, slug_name, True),
+            forbidden_words=tuple(
+                word for word in FORBIDDEN_WORDS if word not in slug_name_joined
+            ),
+        )
+
+
+def get_context(
+    song: Song,
+    context: Optional[MatchContext],
+    search_query: Optional[str] = None,
+) -> MatchContext:
+    """
+    Get the match context for the song, creating it if it wasn't passed.
+
+    ### Arguments
+    - song: song to match
+    - context: the match context created by the caller, if any
+    - search_query: search query used to find the results
+
+    ### Returns
+    - The match context.
     """
 
-    logger.log(MATCH, "[%s|%s] %s", song_id, result_id, message)
+    if context is not None:
+        return context
+
+    return MatchContext.from_song(song, search_query)
 
 
 def fill_string(strings: List[str], main_string: str, string_to_check: str) -> str:
@@ -86,12 +214,31 @@ def fill_string(strings: List[str], main_string: str, string_to_check: str) -> s
     - string with strings from `strings` list
     """
 
+    return fill_slugs(
+        [slugify(string).replace("-", "") for string in strings],
+        main_string,
+        string_to_check,
+    )
+
+
+def fill_slugs(slugs: Sequence[str], main_string: str, string_to_check: str) -> str:
+    """
+    Same as `fill_string`, but for strings that are already
+    slugified and have no dashes.
+
+    ### Arguments
+    - slugs: slugified strings to check
+    - main_string: string to add strings to
+    - string_to_check: string to check if strings are present in
+
+    ### Returns
+    - string with strings from `slugs` list
+    """
+
     final_str = main_string
     test_str = final_str.replace("-", "")
     simple_test_str = string_to_check.replace("-", "")
-    for string in strings:
-        slug_str = slugify(string).replace("-", "")
-
+    for slug_str in slugs:
         if slug_str in simple_test_str and slug_str not in test_str:
             final_str += f"-{slug_str}"
             test_str += slug_str
@@ -179,53 +326,60 @@ def based_sort(strings: List[str], based_on: List[str]) -> Tuple[List[str], List
     return strings, based_on
 
 
-def check_common_word(song: Song, result: Result) -> bool:
+def check_common_word(
+    song: Song, result: Result, context: Optional[MatchContext] = None
+) -> bool:
     """
     Check if a word is present in a sentence
 
     ### Arguments
     - song: song to match
     - result: result to match
+    - context: match context of the song
 
     ### Returns
     - True if word is present in sentence, False otherwise
     """
 
-    sentence_words = slugify(song.name).split("-")
+    context = get_context(song, context)
     to_check = slugify(result.name).replace("-", "")
 
-    for word in sentence_words:
+    for word in context.name_words:
         if word != "" and word in to_check:
             return True
 
     return False
 
 
-def check_forbidden_words(song: Song, result: Result) -> Tuple[bool, List[str]]:
+def check_forbidden_words(
+    song: Song, result: Result, context: Optional[MatchContext] = None
+) -> Tuple[bool, List[str]]:
     """
     Check if a forbidden word is present in the result name
 
     ### Arguments
     - song: song to match
     - result: result to match
+    - context: match context of the song
 
     ### Returns
     - True if forbidden word is present in result name, False otherwise
     """
 
-    song_name = slugify(song.name).replace("-", "")
+    context = get_context(song, context)
     to_check = slugify(result.name).replace("-", "")
 
-    words = []
-    for word in FORBIDDEN_WORDS:
-        if word in to_check and word not in song_name:
-            words.append(word)
+    # Words that are part of the song name are already filtered out
+    words = [word for word in context.forbidden_words if word in to_check]
 
     return len(words) > 0, words
 
 
 def create_match_strings(
-    song: Song, result: Result, search_query: Optional[str] = None
+    song: Song,
+    result: Result,
+    search_query: Optional[str] = None,
+    context: Optional[MatchContext] = None,
 ) -> Tuple[str, str]:
     """
     Create strings based on song and result to match
@@ -234,24 +388,21 @@ def create_match_strings(
     ### Arguments
     - song: song to match
     - result: result to match
+    - search_query: search query used to find the results
+    - context: match context of the song
 
     ### Returns
     - tuple of strings to match
     """
 
-    slug_song_name = slugify(song.name)
-    slug_song_title = slugify(
-        create_song_title(song.name, song.artists)
-        if not search_query
-        else create_search_query(song, search_query, False, None, True)
-    )
+    context = get_context(song, context, search_query)
 
     test_str1 = slugify(result.name)
-    test_str2 = slug_song_name if result.verified else slug_song_title
+    test_str2 = context.slug_name if result.verified else context.slug_title
 
     # Fill strings with missing artists
-    test_str1 = fill_string(song.artists, test_str1, test_str2)
-    test_str2 = fill_string(song.artists, test_str2, test_str1)
+    test_str1 = fill_slugs(context.slug_artists_joined, test_str1, test_str2)
+    test_str2 = fill_slugs(context.slug_artists_joined, test_str2, test_str1)
 
     # Sort both strings and then join them
     test_list1, test_list2 = based_sort(test_str1.split("-"), test_str2.split("-"))
@@ -288,13 +439,16 @@ def get_best_matches(
     ]
 
 
-def calc_main_artist_match(song: Song, result: Result) -> float:
+def calc_main_artist_match(
+    song: Song, result: Result, context: Optional[MatchContext] = None
+) -> float:
     """
     Check if main artist is present in list of artists
 
     ### Arguments
-    - main_artist: main artist to check
-    - artists: list of artists to check
+    - song: song to match
+    - result: result to match
+    - context: match context of the song
 
     ### Returns
     - True if main artist is present in list of artists, False otherwise
@@ -306,27 +460,27 @@ def calc_main_artist_match(song: Song, result: Result) -> float:
     if not result.artists:
         return main_artist_match
 
-    song_artists, result_artists = list(map(slugify, song.artists)), list(
+    context = get_context(song, context)
+
+    # based_sort sorts the lists in place, so the song artists are copied
+    song_artists, result_artists = list(context.slug_artists), list(
         map(slugify, result.artists)
     )
     sorted_song_artists, sorted_result_artists = based_sort(
         song_artists, result_artists
     )
 
-    debug(song.song_id, result.result_id, f"Song artists: {sorted_song_artists}")
-    debug(song.song_id, result.result_id, f"Result artists: {sorted_result_artists}")
+    debug(song.song_id, result.result_id, "Song artists: %s", sorted_song_artists)
+    debug(song.song_id, result.result_id, "Result artists: %s", sorted_result_artists)
 
-    slug_song_main_artist = slugify(song.artists[0])
+    slug_song_main_artist = context.slug_artists[0]
     slug_result_main_artist = sorted_result_artists[0]
 
     # Result has only one artist, but song has multiple artists
     # we can assume that other artists are in the main artist name
     if len(song.artists) > 1 and len(result.artists) == 1:
-        for artist in map(slugify, song.artists[1:]):
-            artist = sort_string(slugify(artist).split("-"), "-")
-
-            res_main_artist = sort_string(slug_result_main_artist.split("-"), "-")
-
+        res_main_artist = sort_string(slug_result_main_artist.split("-"), "-")
+        for artist in context.sorted_artists[1:]:
             if artist in res_main_artist:
                 main_artist_match += 100 / len(song.artists)
 
@@ -336,7 +490,7 @@ def calc_main_artist_match(song: Song, result: Result) -> float:
     main_artist_match = ratio(slug_song_main_artist, slug_result_main_artist)
 
     debug(
-        song.song_id, result.result_id, f"First main artist match: {main_artist_match}"
+        song.song_id, result.result_id, "First main artist match: %s", main_artist_match
     )
 
     # Use second artist from the sorted list to
@@ -349,7 +503,10 @@ def calc_main_artist_match(song: Song, result: Result) -> float:
             debug(
                 song.song_id,
                 result.result_id,
-                f"Matched {song_artist} with {result_artist}: {new_artist_match}",
+                "Matched %s with %s: %s",
+                song_artist,
+                result_artist,
+                new_artist_match,
             )
 
             main_artist_match = max(main_artist_match, new_artist_match)
@@ -357,13 +514,16 @@ def calc_main_artist_match(song: Song, result: Result) -> float:
     return main_artist_match
 
 
-def calc_artists_match(song: Song, result: Result) -> float:
+def calc_artists_match(
+    song: Song, result: Result, context: Optional[MatchContext] = None
+) -> float:
     """
     Check if all artists are present in list of artists
 
     ### Arguments
     - song: song to match
     - result: result to match
+    - context: match context of the song
 
     ### Returns
     - artists match percentage
@@ -375,8 +535,9 @@ def calc_artists_match(song: Song, result: Result) -> float:
     if len(song.artists) == 1 or not result.artists:
         return artist_match_number
 
+    context = get_context(song, context)
     artist1_list, artist2_list = based_sort(
-        list(map(slugify, song.artists)), list(map(slugify, result.artists))
+        list(context.slug_artists), list(map(slugify, result.artists))
     )
 
     # Remove main artist from the lists
@@ -392,7 +553,9 @@ def calc_artists_match(song: Song, result: Result) -> float:
     return artist_match_number
 
 
-def artists_match_fixup1(song: Song, result: Result, score: float) -> float:
+def artists_match_fixup1(
+    song: Song, result: Result, score: float, context: Optional[MatchContext] = None
+) -> float:
     """
     Multiple fixes to the artists score for
     not verified results to improve the accuracy
@@ -401,6 +564,7 @@ def artists_match_fixup1(song: Song, result: Result, score: float) -> float:
     - song: song to match
     - result: result to match
     - score: current score
+    - context: match context of the song
 
     ### Returns
     - new score
@@ -410,10 +574,12 @@ def artists_match_fixup1(song: Song, result: Result, score: float) -> float:
     if result.verified or score > 50:
         return score
 
+    context = get_context(song, context)
+
     # If we didn't find any artist match,
     # we fallback to channel name match
     channel_name_match = ratio(
-        slugify(song.artist),
+        context.slug_artist,
         slugify(", ".join(result.artists)) if result.artists else "",
     )
 
@@ -425,9 +591,7 @@ def artists_match_fixup1(song: Song, result: Result, score: float) -> float:
     if score <= 70:
         artist_title_match = 0.0
         result_name = slugify(result.name).replace("-", "")
-        for artist in song.artists:
-            slug_artist = slugify(artist).replace("-", "")
-
+        for slug_artist in context.slug_artists_joined:
             if slug_artist in result_name:
                 artist_title_match += 1.0
 
@@ -442,21 +606,13 @@ def artists_match_fixup1(song: Song, result: Result, score: float) -> float:
         # Song artists: ['charlie-moncler', 'fukaj', 'mata', 'pedro']
         # Result artists: ['fukaj-mata-charlie-moncler-und-pedro']
 
-        # For artist_list1
-        artist_list1 = []
-        for artist in song.artists:
-            artist_list1.extend(slugify(artist).split("-"))
-
         # For artist_list2
         artist_list2 = []
         if result.artists:
             for artist in result.artists:
                 artist_list2.extend(slugify(artist).split("-"))
 
-        artist_tuple1 = tuple(artist_list1)
-        artist_tuple2 = tuple(artist_list2)
-
-        artist_title_match = ratio(artist_tuple1, artist_tuple2)
+        artist_title_match = ratio(context.artist_words, tuple(artist_list2))
 
         score = max(score, artist_title_match)
 
@@ -464,7 +620,11 @@ def artists_match_fixup1(song: Song, result: Result, score: float) -> float:
 
 
 def artists_match_fixup2(
-    song: Song, result: Result, score: float, search_query: Optional[str] = None
+    song: Song,
+    result: Result,
+    score: float,
+    search_query: Optional[str] = None,
+    context: Optional[MatchContext] = None,
 ) -> float:
     """
     Multiple fixes to the artists score for
@@ -474,6 +634,8 @@ def artists_match_fixup2(
     - song: song to match
     - result: result to match
     - score: current score
+    - search_query: search query used to find the results
+    - context: match context of the song
 
     ### Returns
     - new score
@@ -485,21 +647,21 @@ def artists_match_fixup2(
         # or if the result is not verified
         return score
 
+    context = get_context(song, context, search_query)
+
     # Slugify some variables
-    slug_song_name = slugify(song.name)
     slug_result_name = slugify(result.name)
 
     # # Check if the main artist is simlar
     has_main_artist = (score / (2 if len(song.artists) > 1 else 1)) > 50
 
-    _, match_str2 = create_match_strings(song, result, search_query)
+    _, match_str2 = create_match_strings(song, result, search_query, context)
 
     # Check if other song artists are in the result name
     # if they are, we increase the artist match
     # (main artist is already checked, so we skip it)
-    artists_to_check = song.artists[int(has_main_artist) :]
+    artists_to_check = context.slug_artists_joined[int(has_main_artist) :]
     for artist in artists_to_check:
-        artist = slugify(artist).replace("-", "")
         if artist in match_str2.replace("-", ""):
             score += 5
 
@@ -508,7 +670,7 @@ def artists_match_fixup2(
     # with the result's artists
     if score <= 70:
         # Artists from song/result name without the song/result name words
-        artist_list1 = create_clean_string(song.artists, slug_song_name, True)
+        artist_list1 = context.clean_artists
         artist_list2 = create_clean_string(
             list(result.artists) if result.artists else [result.author],
             slug_result_name,
@@ -522,7 +684,9 @@ def artists_match_fixup2(
     return score
 
 
-def artists_match_fixup3(song: Song, result: Result, score: float) -> float:
+def artists_match_fixup3(
+    song: Song, result: Result, score: float, context: Optional[MatchContext] = None
+) -> float:
     """
     Calculate match percentage based result's name
     and song's title if the result has exactly one artist
@@ -532,6 +696,7 @@ def artists_match_fixup3(song: Song, result: Result, score: float) -> float:
     - song: song to match
     - result: result to match
     - score: current score
+    - context: match context of the song
 
     ### Returns
     - new score
@@ -549,10 +714,8 @@ def artists_match_fixup3(song: Song, result: Result, score: float) -> float:
         # or if the song has only one artist
         return score
 
-    artists_score_fixup = ratio(
-        slugify(result.name),
-        slugify(create_song_title(song.name, [song.artist])),
-    )
+    context = get_context(song, context)
+    artists_score_fixup = ratio(slugify(result.name), context.slug_main_title)
 
     if artists_score_fixup >= 80:
         score = (score + artists_score_fixup) / 2
@@ -564,7 +727,10 @@ def artists_match_fixup3(song: Song, result: Result, score: float) -> float:
 
 
 def calc_name_match(
-    song: Song, result: Result, search_query: Optional[str] = None
+    song: Song,
+    result: Result,
+    search_query: Optional[str] = None,
+    context: Optional[MatchContext] = None,
 ) -> float:
     """
     Calculate name match percentage
@@ -572,15 +738,15 @@ def calc_name_match(
     ### Arguments
     - song: song to match
     - result: result to match
+    - search_query: search query used to find the results
+    - context: match context of the song
 
     ### Returns
     - name match percentage
     """
 
-    # Create match strings that will be used
-    # to calculate name match value
-    match_str1, match_str2 = create_match_strings(song, result, search_query)
-    result_name, song_name = slugify(result.name), slugify(song.name)
+    context = get_context(song, context, search_query)
+    result_name, song_name = slugify(result.name), context.slug_name
 
     res_list, song_list = based_sort(result_name.split("-"), song_name.split("-"))
     result_name, song_name = "-".join(res_list), "-".join(song_list)
@@ -588,26 +754,38 @@ def calc_name_match(
     # Calculate initial name match
     name_match = ratio(result_name, song_name)
 
-    debug(song.song_id, result.result_id, f"MATCH STRINGS: {match_str1} - {match_str2}")
     debug(
         song.song_id,
         result.result_id,
-        f"SLUG MATCH STRINGS: {song_name} - {result_name}",
+        "SLUG MATCH STRINGS: %s - %s",
+        song_name,
+        result_name,
     )
-    debug(song.song_id, result.result_id, f"First name match: {name_match}")
+    debug(song.song_id, result.result_id, "First name match: %s", name_match)
 
     # If name match is lower than 60%,
     # we try to match using the test strings
     if name_match <= 75:
+        # Create match strings that will be used
+        # to calculate name match value
+        match_str1, match_str2 = create_match_strings(
+            song, result, search_query, context
+        )
+        debug(
+            song.song_id,
+            result.result_id,
+            "MATCH STRINGS: %s - %s",
+            match_str1,
+            match_str2,
+        )
+
         second_name_match = ratio(
             match_str1,
             match_str2,
         )
 
         debug(
-            song.song_id,
-            result.result_id,
-            f"Second name match: {second_name_match}",
+            song.song_id, result.result_id, "Second name match: %s", second_name_match
         )
 
         name_match = max(name_match, second_name_match)
@@ -632,13 +810,16 @@ def calc_time_match(song: Song, result: Result) -> float:
     return score * 100
 
 
-def calc_album_match(song: Song, result: Result) -> float:
+def calc_album_match(
+    song: Song, result: Result, context: Optional[MatchContext] = None
+) -> float:
     """
     Calculate album match percentage
 
     ### Arguments
     - song: song to match
     - result: result to match
+    - context: match context of the song
 
     ### Returns
     - album match percentage
@@ -647,7 +828,79 @@ def calc_album_match(song: Song, result: Result) -> float:
     if not result.album:
         return 0.0
 
-    return ratio(slugify(song.album_name), slugify(result.album))
+    context = get_context(song, context)
+
+    return ratio(context.slug_album, slugify(result.album))
+
+
+def calc_album_matches(
+    song: Song, results: List[Result], context: Optional[MatchContext] = None
+) -> List[float]:
+    """
+    Calculate album match percentage for all results at once
+
+    ### Arguments
+    - song: song to match
+    - results: results to match
+    - context: match context of the song
+
+    ### Returns
+    - list of album match percentages, in the same order as the results
+    """
+
+    album_matches = [0.0] * len(results)
+
+    # Results without album always have 0.0 album match
+    result_albums = {
+        index: slugify(result.album)
+        for index, result in enumerate(results)
+        if result.album
+    }
+
+    if not result_albums:
+        return album_matches
+
+    context = get_context(song, context)
+    for _, score, index in process.extract(
+        context.slug_album,
+        result_albums,
+        scorer=fuzz.ratio,
+        limit=None,
+    ):
+        album_matches[index] = score
+
+    return album_matches
+
+
+def filter_candidates(
+    results: List[Result],
+    song: Song,
+    search_query: Optional[str] = None,
+) -> List[Result]:
+    """
+    Cheap first pass over the results, using the same checks
+    that `order_results` rejects results with first.
+
+    ### Arguments
+    - results: The results to filter.
+    - song: The song to filter for.
+    - search_query: The search query.
+
+    ### Returns
+    - The results that can still be matched.
+
+    ### Notes
+    - Results with an unknown duration (0) are only checked by their name.
+    """
+
+    context = MatchContext.from_song(song, search_query)
+
+    return [
+        result
+        for result in results
+        if check_common_word(song, result, context)
+        and (not result.duration or calc_time_match(song, result) >= 25)
+    ]
 
 
 def order_results(
@@ -670,113 +923,140 @@ def order_results(
     # Assign an overall avg match value to each result
     links_with_match_value = {}
 
-    # Iterate over all results
-    for result in results:
+    # Song side of the match strings is only normalized once
+    context = MatchContext.from_song(song, search_query)
+
+    # Song independent scores are calculated for all results at once
+    time_matches = [calc_time_match(song, result) for result in results]
+    album_matches = calc_album_matches(song, results, context)
+
+    log_match = logger.isEnabledFor(MATCH)
+
+    # Iterate over all results, the cheap checks that can reject
+    # a result are done first so the expensive ones are skipped for it
+    for result, time_match, album_match in zip(results, time_matches, album_matches):
+        if log_match:
+            debug(
+                song.song_id,
+                result.result_id,
+                "Calculating match value for %s - %s",
+                result.url,
+                result.json,
+            )
+
+        # skip results that have no common words in their name
+        if not check_common_word(song, result, context):
+            debug(
+                song.song_id, result.result_id, "Skipping result due to no common words"
+            )
+
+            continue
+
+        debug(song.song_id, result.result_id, "Final album match: %s", album_match)
+        debug(song.song_id, result.result_id, "Final time match: %s", time_match)
+
+        # Skip results with time match lower than 25%
+        if time_match < 25:
+            debug(
+                song.song_id,
+                result.result_id,
+                "Skipping result due to time match lower than 25%%",
+            )
+            continue
+
+        # Calculate name match
+        name_match = calc_name_match(song, result, search_query, context)
+        debug(song.song_id, result.result_id, "Initial name match: %s", name_match)
+
+        # Check if result contains forbidden words
+        contains_fwords, found_fwords = check_forbidden_words(song, result, context)
+        if contains_fwords:
+            for _ in found_fwords:
+                name_match -= 15
+
         debug(
             song.song_id,
             result.result_id,
-            f"Calculating match value for {result.url} - {result.json}",
+            "Contains forbidden words: %s, %s",
+            contains_fwords,
+            found_fwords,
         )
+        debug(song.song_id, result.result_id, "Final name match: %s", name_match)
 
-        # skip results that have no common words in their name
-        if not check_common_word(song, result):
+        # Ignore results with name match lower than 60%
+        if name_match <= 60:
             debug(
-                song.song_id, result.result_id, "Skipping result due to no common words"
+                song.song_id,
+                result.result_id,
+                "Skipping result due to name match lower than 60%%",
             )
-
             continue
 
         # Calculate match value for main artist
-        artists_match = calc_main_artist_match(song, result)
-        debug(song.song_id, result.result_id, f"Main artist match: {artists_match}")
+        artists_match = calc_main_artist_match(song, result, context)
+        debug(song.song_id, result.result_id, "Main artist match: %s", artists_match)
 
         # Calculate match value for all artists
-        other_artists_match = calc_artists_match(song, result)
+        other_artists_match = calc_artists_match(song, result, context)
         debug(
             song.song_id,
             result.result_id,
-            f"Other artists match: {other_artists_match}",
+            "Other artists match: %s",
+            other_artists_match,
         )
 
         artists_match += other_artists_match
 
         # Calculate initial artist match value
-        debug(song.song_id, result.result_id, f"Initial artists match: {artists_match}")
+        debug(
+            song.song_id, result.result_id, "Initial artists match: %s", artists_match
+        )
         artists_match = artists_match / (2 if len(song.artists) > 1 else 1)
-        debug(song.song_id, result.result_id, f"First artists match: {artists_match}")
+        debug(song.song_id, result.result_id, "First artists match: %s", artists_match)
 
         # First attempt to fix artist match
-        artists_match = artists_match_fixup1(song, result, artists_match)
+        artists_match = artists_match_fixup1(song, result, artists_match, context)
         debug(
             song.song_id,
             result.result_id,
-            f"Artists match after fixup1: {artists_match}",
+            "Artists match after fixup1: %s",
+            artists_match,
         )
 
         # Second attempt to fix artist match
-        artists_match = artists_match_fixup2(song, result, artists_match)
-        debug(
-            song.song_id,
-            result.result_id,
-            f"Artists match after fixup2: {artists_match}",
+        artists_match = artists_match_fixup2(
+            song, result, artists_match, search_query, context
         )
-
-        # Third attempt to fix artist match
-        artists_match = artists_match_fixup3(song, result, artists_match)
         debug(
             song.song_id,
             result.result_id,
-            f"Artists match after fixup3: {artists_match}",
+            "Artists match after fixup2: %s",
+            artists_match,
         )
 
-        debug(song.song_id, result.result_id, f"Final artists match: {artists_match}")
-
-        # Calculate name match
-        name_match = calc_name_match(song, result, search_query)
-        debug(song.song_id, result.result_id, f"Initial name match: {name_match}")
-
-        # Check if result contains forbidden words
-        contains_fwords, found_fwords = check_forbidden_words(song, result)
-        if contains_fwords:
-            for _ in found_fwords:
-                name_match -= 15
-
+        # Third attempt to fix artist match
+        artists_match = artists_match_fixup3(song, result, artists_match, context)
         debug(
             song.song_id,
             result.result_id,
-            f"Contains forbidden words: {contains_fwords}, {found_fwords}",
+            "Artists match after fixup3: %s",
+            artists_match,
         )
-        debug(song.song_id, result.result_id, f"Final name match: {name_match}")
-
-        # Calculate album match
-        album_match = calc_album_match(song, result)
-        debug(song.song_id, result.result_id, f"Final album match: {album_match}")
 
-        # Calculate time match
-        time_match = calc_time_match(song, result)
-        debug(song.song_id, result.result_id, f"Final time match: {time_match}")
-
-        # Ignore results with name match lower than 60%
-        if name_match <= 60:
-            debug(
-                song.song_id,
-                result.result_id,
-                "Skipping result due to name match lower than 60%",
-            )
-            continue
+        debug(song.song_id, result.result_id, "Final artists match: %s", artists_match)
 
         # Ignore results with artists match lower than 70%
         if artists_match < 70 and result.source != "slider.kz":
             debug(
                 song.song_id,
                 result.result_id,
-                "Skipping result due to artists match lower than 70%",
+                "Skipping result due to artists match lower than 70%%",
             )
             continue
 
         # Calculate total match
         average_match = (artists_match + name_match) / 2
-        debug(song.song_id, result.result_id, f"Average match: {average_match}")
+        debug(song.song_id, result.result_id, "Average match: %s", average_match)
 
         if (
             result.verified
@@ -790,17 +1070,9 @@ def order_results(
             debug(
                 song.song_id,
                 result.result_id,
-                f"Average match /w album match: {average_match}",
-            )
-
-        # Skip results with time match lower than 25%
-        if time_match < 25:
-            debug(
-                song.song_id,
-                result.result_id,
-                "Skipping result due to time match lower than 25%",
+                "Average match /w album match: %s",
+                average_match,
             )
-            continue
 
         # If the time match is lower than 50%
         # and the average match is lower than 75%
@@ -809,7 +1081,7 @@ def order_results(
             debug(
                 song.song_id,
                 result.result_id,
-                "Skipping result due to time match < 50% and average match < 75%",
+                "Skipping result due to time match < 50%% and average match < 75%%",
             )
             continue
 
@@ -826,7 +1098,8 @@ def order_results(
             debug(
                 song.song_id,
                 result.result_id,
-                f"Average match /w time match: {average_match}",
+                "Average match /w time match: %s",
+                average_match,
             )
 
             if (result.explicit is not None and song.explicit is not None) and (
@@ -841,7 +1114,7 @@ def order_results(
                 average_match -= 5
 
         average_match = min(average_match, 100)
-        debug(song.song_id, result.result_id, f"Final average match: {average_match}")
+        debug(song.song_id, result.result_id, "Final average match: %s", average_match)
 
         # the results along with the avg Match
         links_with_match_value[result] = average_match
@@ -16,7 +16,6 @@
 from pathlib import Path
 from typing import Any, Dict, Optional
 
-import requests
 from mutagen._file import File
 from mutagen.flac import Picture
 from mutagen.id3 import ID3
@@ -43,7 +42,7 @@
 from mutagen.wave import WAVE
 
 from spotdl.types.song import Song
-from spotdl.utils.config import GlobalConfig
+from spotdl.utils.cover_cache import get_cover
 from spotdl.utils.formatter import to_ms
 from spotdl.utils.lrc import remomve_lrc
 
@@ -288,13 +287,8 @@ def embed_cover(audio_file, song: Song, encoding: str):
         return audio_file
 
     # Try to download the cover art
-    try:
-        cover_data = requests.get(
-            song.cover_url,
-            timeout=10,
-            proxies=GlobalConfig.get_parameter("proxies"),
-        ).content
-    except Exception:
+    cover_data = get_cover(song.cover_url)
+    if cover_data is None:
         return audio_file
 
     # Create the image object for the file type
@@ -616,15 +610,13 @@ def embed_wav_file(output_file: Path, song: Song):
         )
 
     if song.cover_url:
-        try:
-            cover_data = requests.get(song.cover_url, timeout=10).content
+        cover_data = get_cover(song.cover_url)
+        if cover_data is not None:
             audio.tags.add(  # type: ignore
                 APIC(
                     encoding=3, mime="image/jpeg", type=3, desc="Cover", data=cover_data
                 )
             )
-        except Exception:
-            pass
 
     if song.lyrics:
         # Check if the lyrics are in lrc format
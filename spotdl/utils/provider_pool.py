@@ -0,0 +1,152 @@
+"""
+Module that holds the pool of download-side audio providers.
+Creating an audio provider builds a new yt-dlp instance, which parses the options,
+initializes the extractors and loads the cookie file, so the providers are reused
+between songs instead of being created for every download.
+
+```python
+pool = ProviderPool(lambda: AudioProvider(output_format="mp3"), max_size=4)
+with pool.lease(progress_hook) as audio_provider:
+    audio_provider.get_download_metadata(url, download=True)
+```
+"""
+
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from spotdl.providers.audio.base import AudioProvider
+
+__all__ = ["ProviderPool"]
+
+logger = logging.getLogger(__name__)
+
+
+class ProviderPool:
+    """
+    Pool of preconfigured audio providers, leased by one download at a time.
+    """
+
+    def __init__(
+        self, factory: Callable[[], AudioProvider], max_size: Optional[int] = None
+    ) -> None:
+        """
+        Initialize the pool, the providers are created when they are first needed.
+
+        ### Arguments
+        - factory: Function that creates a new audio provider.
+        - max_size: Maximum number of idle providers that are kept,
+        None to keep all of them.
+        """
+
+        self.factory = factory
+        self.max_size = max_size
+
+        self._idle: List[AudioProvider] = []
+        self._hooks: Dict[int, Callable[[Dict[str, Any]], None]] = {}
+        self._lock = threading.Lock()
+        self._created = 0
+        self._leases = 0
+
+    def _create(self) -> AudioProvider:
+        """
+        Create a new provider and attach the progress hook dispatcher to it.
+
+        ### Returns
+        - The new provider.
+        """
+
+        provider = self.factory()
+
+        # yt-dlp can't remove progress hooks, so a single hook is attached
+        # to every provider, which forwards the progress to the current lease
+        provider_id = id(provider)
+
+        def dispatch(progress: Dict[str, Any]) -> None:
+            hook = self._hooks.get(provider_id)
+            if hook is not None:
+                hook(progress)
+
+        provider.audio_handler.add_progress_hook(dispatch)
+
+        with self._lock:
+            self._created += 1
+
+        logger.debug("Created audio provider %d", self._created)
+
+        return provider
+
+    def acquire(
+        self, progress_hook: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> AudioProvider:
+        """
+        Take a provider out of the pool, a new one is created if none are idle.
+
+        ### Arguments
+        - progress_hook: yt-dlp progress hook for this lease.
+
+        ### Returns
+        - The leased provider.
+        """
+
+        with self._lock:
+            self._leases += 1
+            provider = self._idle.pop() if self._idle else None
+
+        if provider is None:
+            provider = self._create()
+
+        if progress_hook is not None:
+            self._hooks[id(provider)] = progress_hook
+
+        return provider
+
+    def release(self, provider: AudioProvider) -> None:
+        """
+        Return the provider to the pool and detach its progress hook.
+
+        ### Arguments
+        - provider: The provider to return.
+        """
+
+        self._hooks.pop(id(provider), None)
+
+        with self._lock:
+            if self.max_size is None or len(self._idle) < self.max_size:
+                self._idle.append(provider)
+
+    @contextmanager
+    def lease(
+        self, progress_hook: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> Iterator[AudioProvider]:
+        """
+        Lease a provider for the duration of the context.
+
+        ### Arguments
+        - progress_hook: yt-dlp progress hook for this lease.
+
+        ### Returns
+        - The leased provider.
+        """
+
+        provider = self.acquire(progress_hook)
+        try:
+            yield provider
+        finally:
+            self.release(provider)
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get the statistics of the pool.
+
+        ### Returns
+        - Dictionary with the number of created and idle providers and leases.
+        """
+
+        with self._lock:
+            return {
+                "created": self._created,
+                "idle": len(self._idle),
+                "leases": self._leases,
+            }
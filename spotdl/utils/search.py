@@ -10,9 +10,8 @@
 import logging
 import re
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
-import requests
 from ytmusicapi import YTMusic
 
 from spotdl.types.album import Album
@@ -20,6 +19,8 @@
 from spotdl.types.playlist import Playlist
 from spotdl.types.saved import Saved
 from spotdl.types.song import Song, SongList
+from spotdl.utils.http import SharedSession, get_session
+from spotdl.utils.library import LibraryIndex
 from spotdl.utils.metadata import get_file_metadata
 from spotdl.utils.spotify import SpotifyClient, SpotifyError
 
@@ -29,6 +30,8 @@
     "parse_query",
     "get_simple_songs",
     "reinit_song",
+    "reinit_songs",
+    "reinit_songs_by_index",
     "get_song_from_file_metadata",
     "gather_known_songs",
     "create_ytm_album",
@@ -51,7 +54,7 @@ def get_ytm_client() -> YTMusic:
 
     global client  # pylint: disable=global-statement
     if client is None:
-        client = YTMusic()
+        client = YTMusic(requests_session=SharedSession())
 
     return client
 
@@ -103,17 +106,7 @@ def parse_query(
         playlist_retain_track_cover=playlist_retain_track_cover,
     )
 
-    results = []
-    with concurrent.futures.ThreadPoolExecutor(max_workers=threads) as executor:
-        future_to_song = {executor.submit(reinit_song, song): song for song in songs}
-        for future in concurrent.futures.as_completed(future_to_song):
-            song = future_to_song[future]
-            try:
-                results.append(future.result())
-            except Exception as exc:
-                logger.error("%s generated an exception: %s", song.display_name, exc)
-
-    return results
+    return reinit_songs(songs, threads)
 
 
 def get_simple_songs(
@@ -250,7 +243,7 @@ def get_simple_songs(
         elif "open.spotify.com" in request and "track" in request:
             songs.append(Song.from_url(url=request))
         elif "https://spotify.link/" in request:
-            resp = requests.head(request, allow_redirects=True, timeout=10)
+            resp = get_session().head(request, allow_redirects=True, timeout=10)
             full_url = resp.url
             full_lists = get_simple_songs(
                 [full_url],
@@ -372,7 +365,7 @@ def songs_from_albums(albums: List[str]):
 
         songs.extend([Song.from_missing_data(**song.json) for song in album.songs])
 
-    return songs
+    return reinit_songs(songs)
 
 
 def get_all_user_playlists(user_url: str = "") -> List[Playlist]:
@@ -548,16 +541,109 @@ def reinit_song(song: Song) -> Song:
 
     data = song.json
     if data.get("url"):
-        new_data = Song.from_url(data["url"]).json
+        new_song = Song.from_url(data["url"])
     elif data.get("song_id"):
-        new_data = Song.from_url(
-            "https://open.spotify.com/track/" + data["song_id"]
-        ).json
+        new_song = Song.from_url("https://open.spotify.com/track/" + data["song_id"])
     elif data.get("name") and data.get("artist"):
-        new_data = Song.from_search_term(f"{data['artist']} - {data['name']}").json
+        new_song = Song.from_search_term(f"{data['artist']} - {data['name']}")
     else:
         raise QueryError("Song object is missing required data to be reinitialized")
 
+    return merge_songs(song, new_song)
+
+
+def reinit_songs(songs: List[Song], threads: int = 1) -> List[Song]:
+    """
+    Update song objects with new data from Spotify.
+    Songs with a spotify url or id are fetched in batches,
+    the rest are searched for one by one.
+
+    ### Arguments
+    - songs: List of song objects
+    - threads: Number of threads to use for the songs that have to be searched for
+
+    ### Returns
+    - List of updated song objects, songs that couldn't be updated are skipped
+    """
+
+    new_songs = reinit_songs_by_index(songs, threads)
+
+    return [new_songs[index] for index in sorted(new_songs)]
+
+
+def reinit_songs_by_index(songs: List[Song], threads: int = 1) -> Dict[int, Song]:
+    """
+    Update song objects with new data from Spotify, see `reinit_songs`.
+
+    ### Arguments
+    - songs: List of song objects
+    - threads: Number of threads to use for the songs that have to be searched for
+
+    ### Returns
+    - Dictionary mapping the index of the song in `songs` to the updated song,
+    songs that couldn't be updated are skipped
+    """
+
+    song_urls: Dict[int, str] = {}
+    for index, song in enumerate(songs):
+        if song.url and "open.spotify.com" in song.url and "track" in song.url:
+            song_urls[index] = song.url
+        elif not song.url and song.song_id:
+            song_urls[index] = "https://open.spotify.com/track/" + song.song_id
+
+    new_songs: Dict[int, Song] = {}
+    batch_songs: List[Optional[Song]] = []
+    if song_urls:
+        try:
+            batch_songs = Song.list_from_urls(list(song_urls.values()))
+        except Exception as exc:
+            # Fall back to fetching the songs one by one
+            logger.debug("Failed to fetch songs in batches: %s", exc)
+            song_urls = {}
+
+        for index, new_song in zip(song_urls.keys(), batch_songs):
+            if new_song is None:
+                logger.error(
+                    "%s generated an exception: %s",
+                    songs[index].display_name,
+                    f"Track no longer exists: {song_urls[index]}",
+                )
+                continue
+
+            new_songs[index] = merge_songs(songs[index], new_song)
+
+    remaining = [index for index in range(len(songs)) if index not in song_urls]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=threads) as executor:
+        future_to_index = {
+            executor.submit(reinit_song, songs[index]): index for index in remaining
+        }
+        for future in concurrent.futures.as_completed(future_to_index):
+            index = future_to_index[future]
+            try:
+                new_songs[index] = future.result()
+            except Exception as exc:
+                logger.error(
+                    "%s generated an exception: %s", songs[index].display_name, exc
+                )
+
+    return new_songs
+
+
+def merge_songs(song: Song, new_song: Song) -> Song:
+    """
+    Fill in the missing data of a song object
+    with the data from another song object
+
+    ### Arguments
+    - song: Song object to update
+    - new_song: Song object with the new data
+
+    ### Returns
+    - Updated song object
+    """
+
+    data = song.json
+    new_data = new_song.json
     for key in Song.__dataclass_fields__:  # type: ignore # pylint: disable=E1101
         val = data.get(key)
         new_val = new_data.get(key)
@@ -589,13 +675,17 @@ def get_song_from_file_metadata(file: Path, id3_separator: str = "/") -> Optiona
     return Song.from_missing_data(**file_metadata)
 
 
-def gather_known_songs(output: str, output_format: str) -> Dict[str, List[Path]]:
+def gather_known_songs(
+    output: str, output_format: str, library_index: Optional[LibraryIndex] = None
+) -> Dict[str, List[Path]]:
     """
     Gather all known songs from the output directory
 
     ### Arguments
     - output: Output path template
     - output_format: Output format
+    - library_index: Index of the already scanned files,
+    only new and changed files are read if set
 
     ### Returns
     - Dictionary containing all known songs and their paths
@@ -604,30 +694,52 @@ def gather_known_songs(output: str, output_format: str) -> Dict[str, List[Path]]
     # Get the base directory from the path template
     # Path("/Music/test/{artist}/{artists} - {title}.{output-ext}") -> "/Music/test"
     base_dir = output.split("{", 1)[0]
+
+    if library_index is not None:
+        return library_index.scan(Path(base_dir), output_format, resolve_song_file)
+
     paths = Path(base_dir).glob(f"**/*.{output_format}")
 
     known_songs: Dict[str, List[Path]] = {}
     for path in paths:
-        # Try to get the song from the metadata
-        song = get_song_from_file_metadata(path)
-
-        # If the songs doesn't have metadata, try to get it from the filename
-        if song is None or song.url is None:
-            search_results = get_search_results(path.stem)
-            if len(search_results) == 0:
-                continue
-
-            song = search_results[0]
+        url, _ = resolve_song_file(path)
+        if url is None:
+            continue
 
-        known_paths = known_songs.get(song.url)
+        known_paths = known_songs.get(url)
         if known_paths is None:
-            known_songs[song.url] = [path]
+            known_songs[url] = [path]
         else:
-            known_songs[song.url].append(path)
+            known_songs[url].append(path)
 
     return known_songs
 
 
+def resolve_song_file(path: Path) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Get the spotify url and isrc of a song file
+
+    ### Arguments
+    - path: Path to the file
+
+    ### Returns
+    - Tuple with the url and isrc, None if the song couldn't be found
+    """
+
+    # Try to get the song from the metadata
+    song = get_song_from_file_metadata(path)
+
+    # If the songs doesn't have metadata, try to get it from the filename
+    if song is None or song.url is None:
+        search_results = get_search_results(path.stem)
+        if len(search_results) == 0:
+            return None, None
+
+        song = search_results[0]
+
+    return song.url, song.isrc
+
+
 def create_ytm_album(url: str, fetch_songs: bool = True) -> Album:
     """
     Creates a list of Song objects from an album query.
@@ -0,0 +1,112 @@
+"""
+Module that holds the persistent slug cache.
+It keeps the slugified artist and song names between runs,
+slugifying japanese names with pykakasi is slow.
+
+```python
+cache = SlugCache("slug_cache.db")
+warm_slug_cache(cache.load())
+...
+new_slugs = get_new_slugs()
+cache.save(new_slugs)
+clear_new_slugs(new_slugs)
+```
+"""
+
+import logging
+import time
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+from spotdl.utils.store import SQLiteStore
+
+__all__ = ["DEFAULT_LOAD_LIMIT", "SlugCache"]
+
+logger = logging.getLogger(__name__)
+
+# Number of slugs that are loaded at startup, the whole
+# cache would take longer to load than it saves
+DEFAULT_LOAD_LIMIT = 20000
+
+
+class SlugCache(SQLiteStore):
+    """
+    Sqlite backed cache of slugified strings.
+    """
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS slugs (
+        string TEXT PRIMARY KEY,
+        slug TEXT NOT NULL,
+        timestamp REAL NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS slugs_timestamp ON slugs (timestamp);
+    """
+
+    def __init__(self, path: Union[str, Path], max_entries: int = 100000) -> None:
+        """
+        Open the slug cache.
+
+        ### Arguments
+        - path: The path to the cache file.
+        - max_entries: Maximum number of slugs to keep, the oldest ones are removed.
+        """
+
+        super().__init__(path)
+
+        self.max_entries = max_entries
+
+    def load(self, limit: Optional[int] = DEFAULT_LOAD_LIMIT) -> Dict[str, str]:
+        """
+        Load the most recently used slugs.
+
+        ### Arguments
+        - limit: Maximum number of slugs to load, None to load all of them.
+
+        ### Returns
+        - Dictionary of strings and their slugs.
+        """
+
+        return dict(
+            self.execute(
+                "SELECT string, slug FROM slugs ORDER BY timestamp DESC LIMIT ?",
+                (-1 if limit is None else limit,),
+            )
+        )
+
+    def save(self, slugs: Dict[str, str]) -> None:
+        """
+        Store new slugs and remove the oldest ones if the cache is full.
+
+        ### Arguments
+        - slugs: Dictionary of strings and their slugs.
+        """
+
+        if not slugs:
+            return None
+
+        timestamp = time.time()
+        self.executemany(
+            "INSERT OR REPLACE INTO slugs (string, slug, timestamp) VALUES (?, ?, ?)",
+            [(string, slug, timestamp) for string, slug in slugs.items()],
+        )
+
+        self.execute(
+            "DELETE FROM slugs WHERE string NOT IN "
+            "(SELECT string FROM slugs ORDER BY timestamp DESC LIMIT ?)",
+            (self.max_entries,),
+        )
+
+        logger.debug("Saved %d slugs to the slug cache", len(slugs))
+
+        return None
+
+    def __len__(self) -> int:
+        """
+        Get the number of entries in the cache.
+
+        ### Returns
+        - The number of entries.
+        """
+
+        return self.execute("SELECT COUNT(*) FROM slugs")[0][0]
@@ -8,25 +8,39 @@
 ```
 """
 
+import hashlib
 import json
 import logging
-from typing import Dict, Optional
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Union
 
 import requests
 from spotipy import Spotify
 from spotipy.cache_handler import CacheFileHandler, MemoryCacheHandler
 from spotipy.oauth2 import SpotifyClientCredentials, SpotifyOAuth
 
-from spotdl.utils.config import get_cache_path, get_spotify_cache_path
+from spotdl.utils.config import (
+    get_cache_path,
+    get_spotify_cache_db_path,
+    get_spotify_cache_path,
+)
+from spotdl.utils.store import SQLiteStore
 
 __all__ = [
     "SpotifyError",
     "SpotifyClient",
+    "SpotifyCache",
     "save_spotify_cache",
 ]
 
 logger = logging.getLogger(__name__)
 
+# Number of responses kept in memory, the cache file has no entry limit
+MEMORY_CACHE_ENTRIES = 10000
+
 
 class SpotifyError(Exception):
     """
@@ -69,6 +83,8 @@ def init(  # pylint: disable=bad-mcs-method-argument
         use_cache_file: bool = False,
         auth_token: Optional[str] = None,
         cache_path: Optional[str] = None,
+        spotify_cache_ttl: Optional[int] = 90,
+        spotify_cache_size: Optional[int] = 512,
     ) -> "Singleton":
         """
         Initializes the SpotifyClient.
@@ -81,6 +97,11 @@ def init(  # pylint: disable=bad-mcs-method-argument
         - cache_path: The path to the cache file.
         - no_cache: Whether or not to use the cache.
         - open_browser: Whether or not to open the browser.
+        - use_cache_file: Whether or not to use the cache file.
+        - spotify_cache_ttl: Number of days after which the responses
+        in the cache file expire, None or 0 to never expire.
+        - spotify_cache_size: Maximum size of the cache file in megabytes,
+        None or 0 for no limit.
 
         ### Returns
         - The instance of the SpotifyClient.
@@ -121,6 +142,8 @@ def init(  # pylint: disable=bad-mcs-method-argument
         self.no_cache = no_cache
         self.max_retries = max_retries
         self.use_cache_file = use_cache_file
+        self.spotify_cache_ttl = spotify_cache_ttl
+        self.spotify_cache_size = spotify_cache_size
 
         # Create instance
         self._instance = super().__call__(
@@ -141,7 +164,8 @@ class SpotifyClient(Spotify, metaclass=Singleton):
     """
 
     _initialized = False
-    cache: Dict[str, Optional[Dict]] = {}
+    cache: "OrderedDict[str, Optional[Dict]]" = OrderedDict()
+    cache_lock = threading.Lock()
 
     def __init__(self, *args, **kwargs):
         """
@@ -155,15 +179,16 @@ def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._initialized = True
 
-        use_cache_file: bool = self.use_cache_file  # type: ignore # pylint: disable=E1101
-        cache_file_loc = get_spotify_cache_path()
-
-        if use_cache_file and cache_file_loc.exists():
-            with open(cache_file_loc, "r", encoding="utf-8") as cache_file:
-                self.cache = json.load(cache_file)
-        elif use_cache_file:
-            with open(cache_file_loc, "w", encoding="utf-8") as cache_file:
-                json.dump(self.cache, cache_file)
+        # Responses are read from the cache file lazily
+        # and written to it as soon as they arrive
+        self.cache_file: Optional[SpotifyCache] = None
+        if self.use_cache_file:  # type: ignore # pylint: disable=E1101
+            cache_size = self.spotify_cache_size  # type: ignore # pylint: disable=E1101
+            self.cache_file = SpotifyCache(
+                get_spotify_cache_db_path(),
+                ttl=self.spotify_cache_ttl,  # type: ignore # pylint: disable=E1101
+                max_size=cache_size * 1024 * 1024 if cache_size else None,
+            )
 
     def _get(self, url, args=None, payload=None, **kwargs):
         """
@@ -178,14 +203,10 @@ def _get(self, url, args=None, payload=None, **kwargs):
 
         cache_key = None
         if use_cache:
-            key_obj = dict(kwargs)
-            key_obj["url"] = url
-            key_obj["data"] = json.dumps(payload)
-            cache_key = json.dumps(key_obj)
-            if cache_key is None:
-                cache_key = url
-            if self.cache.get(cache_key) is not None:
-                return self.cache[cache_key]
+            cache_key = get_cache_key(url, payload, **kwargs)
+            cached_response = self.get_cached(cache_key)
+            if cached_response is not None:
+                return cached_response
 
         # Wrap in a try-except and retry up to `retries` times.
         response = None
@@ -199,29 +220,332 @@ def _get(self, url, args=None, payload=None, **kwargs):
                     raise exc
 
         if use_cache and cache_key is not None:
+            self.set_cached(cache_key, response)
+
+        return response
+
+    def get_cached(self, cache_key: str) -> Optional[Dict]:
+        """
+        Get a response from the memory cache or the cache file.
+
+        ### Arguments
+        - cache_key: The cache key of the request.
+
+        ### Returns
+        - The response or None if it's not cached.
+        """
+
+        with self.cache_lock:
+            cached_response = self.cache.get(cache_key)
+            if cached_response is not None:
+                self.cache.move_to_end(cache_key)
+                return cached_response
+
+        if self.cache_file is not None and is_cacheable(cache_key):
+            cached_response = self.cache_file.get(cache_key)
+            if cached_response is not None:
+                self.remember(cache_key, cached_response)
+                return cached_response
+
+        return None
+
+    def set_cached(self, cache_key: str, response: Optional[Dict]) -> None:
+        """
+        Store a response in the memory cache and the cache file.
+
+        ### Arguments
+        - cache_key: The cache key of the request.
+        - response: The response.
+        """
+
+        self.remember(cache_key, response)
+
+        if (
+            self.cache_file is not None
+            and response is not None
+            and is_cacheable(cache_key)
+        ):
+            self.cache_file.set(cache_key, response)
+
+    def remember(self, cache_key: str, response: Optional[Dict]) -> None:
+        """
+        Store a response in the memory cache,
+        evicting the least recently used responses.
+
+        ### Arguments
+        - cache_key: The cache key of the request.
+        - response: The response.
+        """
+
+        with self.cache_lock:
             self.cache[cache_key] = response
+            self.cache.move_to_end(cache_key)
+            while len(self.cache) > MEMORY_CACHE_ENTRIES:
+                self.cache.popitem(last=False)
+
+    def get_cached_track(self, track_id: str, market=None) -> Optional[Dict]:
+        """
+        Get a track from the cache, without requesting it.
+
+        ### Arguments
+        - track_id: The spotify id of the track.
+        - market: The market of the track.
+
+        ### Returns
+        - The raw track or None if it's not cached.
+        """
+
+        if self.no_cache:  # type: ignore # pylint: disable=E1101
+            return None
+
+        return self.get_cached(get_cache_key(f"tracks/{track_id}", market=market))
+
+    def tracks(self, tracks, market=None):
+        """
+        Overrides the tracks method of the SpotifyClient.
+        Every track is also cached on its own, so it's found
+        no matter which batch or single track request asks for it.
+        """
+
+        response = super().tracks(tracks, market=market)
+
+        if self.no_cache or response is None:  # type: ignore # pylint: disable=E1101
+            return response
+
+        # Spotify returns the tracks in the same order as the ids,
+        # with null for ids that are not found
+        for track, raw_track in zip(tracks, response["tracks"]):
+            if raw_track is not None:
+                track_id = self._get_id("track", track)
+                self.set_cached(
+                    get_cache_key(f"tracks/{track_id}", market=market), raw_track
+                )
 
         return response
 
 
+def get_cache_key(url: str, payload=None, **kwargs) -> str:
+    """
+    Get the cache key of a request.
+
+    ### Arguments
+    - url: The url of the request.
+    - payload: The payload of the request.
+    - kwargs: The query parameters of the request.
+
+    ### Returns
+    - The cache key.
+    """
+
+    key_obj = dict(kwargs)
+    key_obj["url"] = url
+    key_obj["data"] = json.dumps(payload)
+
+    return json.dumps(key_obj)
+
+
+def is_cacheable(cache_key: str) -> bool:
+    """
+    Check if the response for the cache key should be stored in the cache file.
+
+    ### Arguments
+    - cache_key: The cache key of the request.
+
+    ### Returns
+    - True if the response should be stored.
+
+    ### Notes
+    - Only tracks are cached, since they are unlikely to change.
+    - Batch requests are not stored, their tracks are stored one by one.
+    """
+
+    return "tracks/" in cache_key and "tracks/?ids=" not in cache_key
+
+
+class SpotifyCache(SQLiteStore):
+    """
+    Sqlite backed cache of the Spotify responses.
+    Keys are hashed, values are stored as json.
+    """
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS responses (
+        key TEXT PRIMARY KEY,
+        value TEXT NOT NULL,
+        timestamp REAL NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS responses_timestamp ON responses (timestamp);
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        ttl: Optional[int] = 90,
+        max_size: Optional[int] = 512 * 1024 * 1024,
+    ) -> None:
+        """
+        Open the cache, import the old json cache file and evict old entries.
+
+        ### Arguments
+        - path: The path to the cache file.
+        - ttl: Number of days after which the responses expire, None to never expire.
+        - max_size: Maximum size of the stored responses in bytes, None for no limit.
+        """
+
+        super().__init__(path)
+
+        self.ttl = ttl * 86400 if ttl else None
+        self.max_size = max_size
+
+        self.import_json(get_spotify_cache_path())
+        self.evict()
+
+    @staticmethod
+    def hash_key(key: str) -> str:
+        """
+        Hash the cache key.
+
+        ### Arguments
+        - key: The cache key.
+
+        ### Returns
+        - The hashed key.
+        """
+
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        Get a response from the cache.
+
+        ### Arguments
+        - key: The cache key.
+
+        ### Returns
+        - The response or None if it's not in the cache.
+        """
+
+        rows = self.execute(
+            "SELECT value FROM responses WHERE key = ? AND timestamp >= ?",
+            (
+                self.hash_key(key),
+                time.time() - self.ttl if self.ttl else 0,
+            ),
+        )
+
+        if not rows:
+            return None
+
+        return json.loads(rows[0][0])
+
+    def set(self, key: str, value: Dict) -> None:
+        """
+        Store a response in the cache.
+
+        ### Arguments
+        - key: The cache key.
+        - value: The response.
+        """
+
+        self.update({key: value})
+
+    def update(self, responses: Dict[str, Optional[Dict]]) -> None:
+        """
+        Store multiple responses in the cache.
+
+        ### Arguments
+        - responses: Dictionary with the cache keys and responses.
+        """
+
+        timestamp = time.time()
+        self.executemany(
+            "INSERT OR REPLACE INTO responses (key, value, timestamp) VALUES (?, ?, ?)",
+            [
+                (self.hash_key(key), json.dumps(value), timestamp)
+                for key, value in responses.items()
+                if value is not None
+            ],
+        )
+
+    def evict(self) -> None:
+        """
+        Remove the expired responses and the oldest responses
+        if the cache is bigger than the maximum size.
+        """
+
+        if self.ttl:
+            self.execute(
+                "DELETE FROM responses WHERE timestamp < ?", (time.time() - self.ttl,)
+            )
+
+        if not self.max_size:
+            return None
+
+        size = self.execute("SELECT COALESCE(SUM(LENGTH(value)), 0) FROM responses")
+        if size[0][0] <= self.max_size:
+            return None
+
+        # Remove the oldest responses until the cache fits in the limit
+        excess = size[0][0] - self.max_size
+        removed = 0
+        keys = []
+        for key, length in self.execute(
+            "SELECT key, LENGTH(value) FROM responses ORDER BY timestamp"
+        ):
+            if removed >= excess:
+                break
+
+            keys.append((key,))
+            removed += length
+
+        self.executemany("DELETE FROM responses WHERE key = ?", keys)
+        logger.debug("Evicted %d responses from the spotify cache", len(keys))
+
+        return None
+
+    def import_json(self, json_path: Path) -> None:
+        """
+        Import the responses from the old json cache file.
+        The json file is renamed afterwards, so it's only imported once.
+
+        ### Arguments
+        - json_path: The path to the json cache file.
+        """
+
+        if not json_path.is_file():
+            return None
+
+        try:
+            with open(json_path, "r", encoding="utf-8") as cache_file:
+                responses = json.load(cache_file)
+
+            self.update(responses)
+            json_path.replace(json_path.with_name(json_path.name + ".old"))
+
+            logger.info("Imported %d responses from %s", len(responses), json_path)
+        except (OSError, ValueError) as exc:
+            logger.debug("Could not import spotify cache %s: %s", json_path, exc)
+
+        return None
+
+
 def save_spotify_cache(cache: Dict[str, Optional[Dict]]):
     """
     Saves the Spotify cache to a file.
 
     ### Arguments
     - cache: The cache to save.
+
+    ### Notes
+    - SpotifyClient writes the responses to the cache file as they arrive,
+    so this is only needed for caches that were filled in another way.
     """
 
-    cache_file_loc = get_spotify_cache_path()
+    cache_file_loc = get_spotify_cache_db_path()
 
     logger.debug("Saving Spotify cache to %s", cache_file_loc)
 
     # Only cache tracks
-    cache = {
-        key: value
-        for key, value in cache.items()
-        if value is not None and "tracks/" in key
-    }
-
-    with open(cache_file_loc, "w", encoding="utf-8") as cache_file:
-        json.dump(cache, cache_file)
+    cache_file = SpotifyCache(cache_file_loc)
+    cache_file.update({key: value for key, value in cache.items() if is_cacheable(key)})
+    cache_file.close()
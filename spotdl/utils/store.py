@@ -0,0 +1,106 @@
+"""
+Module that holds the base class for the sqlite backed stores
+(match cache, spotify cache, library index etc.)
+"""
+
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, List, Sequence, Union
+
+__all__ = ["StoreError", "SQLiteStore"]
+
+logger = logging.getLogger(__name__)
+
+
+class StoreError(Exception):
+    """
+    Base class for all exceptions related to the sqlite stores.
+    """
+
+
+class SQLiteStore:
+    """
+    Thread safe wrapper around a single sqlite connection.
+    Subclasses set `SCHEMA` to create their tables.
+    """
+
+    SCHEMA: str = ""
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        """
+        Open (and create if needed) the sqlite database.
+
+        ### Arguments
+        - path: The path to the database file.
+
+        ### Errors
+        - StoreError: If the database could not be opened.
+        """
+
+        self.path = Path(path)
+        self.lock = threading.RLock()
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+
+            # Connection is shared between the download threads,
+            # access to it is serialized with the lock
+            self.connection = sqlite3.connect(
+                str(self.path), timeout=30, check_same_thread=False
+            )
+
+            # WAL allows readers from other processes while we are writing
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute("PRAGMA synchronous=NORMAL")
+            self.connection.execute("PRAGMA busy_timeout=30000")
+
+            if self.SCHEMA:
+                self.connection.executescript(self.SCHEMA)
+
+            self.connection.commit()
+        except sqlite3.Error as exception:
+            raise StoreError(f"Could not open database {self.path}") from exception
+
+        logger.debug("Opened %s at %s", self.__class__.__name__, self.path)
+
+    def execute(self, query: str, parameters: Sequence[Any] = ()) -> List[Any]:
+        """
+        Execute a query and commit it.
+
+        ### Arguments
+        - query: The sql query to execute.
+        - parameters: The parameters for the query.
+
+        ### Returns
+        - list of the rows returned by the query.
+        """
+
+        with self.lock:
+            cursor = self.connection.execute(query, parameters)
+            rows = cursor.fetchall()
+            self.connection.commit()
+
+        return rows
+
+    def executemany(self, query: str, parameters: Sequence[Sequence[Any]]) -> None:
+        """
+        Execute a query for every set of parameters in a single transaction.
+
+        ### Arguments
+        - query: The sql query to execute.
+        - parameters: The list of parameters for the query.
+        """
+
+        with self.lock:
+            self.connection.executemany(query, parameters)
+            self.connection.commit()
+
+    def close(self) -> None:
+        """
+        Close the database connection.
+        """
+
+        with self.lock:
+            self.connection.close()
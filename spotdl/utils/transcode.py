@@ -0,0 +1,234 @@
+"""
+Module that holds the transcode service.
+All conversions go through a fixed size pool of ffmpeg workers,
+so the number of ffmpeg processes doesn't depend on the number of download threads.
+
+```python
+service = TranscodeService("ffmpeg", workers=4)
+success, error = service.convert(input_file=Path("song.webm"), output_file=Path("song.mp3"))
+logger.info(service.get_stats())
+```
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+from spotdl.utils.ffmpeg import FFmpegError, convert, get_cached_ffmpeg_version
+
+__all__ = ["TranscodeJob", "TranscodeService"]
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TranscodeJob:
+    """
+    A single conversion and its timing.
+    """
+
+    input_file: Union[Path, Tuple[str, str]]
+    output_file: Path
+    queued_at: float = field(default_factory=time.perf_counter)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    success: Optional[bool] = None
+
+    @property
+    def wait_time(self) -> float:
+        """
+        Get the time the job spent in the queue.
+
+        ### Returns
+        - The time in seconds.
+        """
+
+        return (self.started_at or time.perf_counter()) - self.queued_at
+
+    @property
+    def run_time(self) -> float:
+        """
+        Get the time ffmpeg took to convert the file.
+
+        ### Returns
+        - The time in seconds, 0 if the job hasn't started yet.
+        """
+
+        if self.started_at is None:
+            return 0.0
+
+        return (self.finished_at or time.perf_counter()) - self.started_at
+
+
+class TranscodeService:
+    """
+    Runs the ffmpeg conversions on a fixed size worker pool.
+    """
+
+    def __init__(self, ffmpeg: str = "ffmpeg", workers: int = 1) -> None:
+        """
+        Initialize the service and check the ffmpeg version.
+
+        ### Arguments
+        - ffmpeg: ffmpeg executable to use.
+        - workers: number of conversions that run at the same time.
+        """
+
+        self.ffmpeg = ffmpeg
+        self.workers = workers
+        self.executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="spotdl-ffmpeg"
+        )
+
+        # The version is only checked once, it's reused for the error reports
+        try:
+            self.version: Tuple[Optional[float], Optional[int]] = (
+                get_cached_ffmpeg_version(ffmpeg)
+            )
+        except FFmpegError as exception:
+            logger.debug("Could not get the ffmpeg version: %s", exception)
+            self.version = (None, None)
+
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._running = 0
+        self._finished = 0
+        self._failed = 0
+        self._wait_time = 0.0
+        self._run_time = 0.0
+
+        logger.debug(
+            "Transcode service: %d workers, ffmpeg version %s", workers, self.version[0]
+        )
+
+    def submit(
+        self,
+        input_file: Union[Path, Tuple[str, str]],
+        output_file: Path,
+        **kwargs,
+    ) -> "Future[Tuple[bool, Optional[Dict[str, Any]]]]":
+        """
+        Queue a conversion.
+
+        ### Arguments
+        - input_file: Path to input file or tuple of (url, file_format).
+        - output_file: Path to output file.
+        - kwargs: Keyword arguments passed to `convert`.
+
+        ### Returns
+        - Future with the conversion status and error dictionary.
+        """
+
+        job = TranscodeJob(input_file, output_file)
+        with self._lock:
+            self._queued += 1
+
+        return self.executor.submit(self._run, job, kwargs)
+
+    def convert(
+        self,
+        input_file: Union[Path, Tuple[str, str]],
+        output_file: Path,
+        **kwargs,
+    ) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """
+        Convert the file and wait for the conversion to finish.
+
+        ### Arguments
+        - input_file: Path to input file or tuple of (url, file_format).
+        - output_file: Path to output file.
+        - kwargs: Keyword arguments passed to `convert`.
+
+        ### Returns
+        - Tuple of conversion status and error dictionary.
+        """
+
+        return self.submit(input_file, output_file, **kwargs).result()
+
+    def _run(
+        self, job: TranscodeJob, kwargs: Dict[str, Any]
+    ) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """
+        Run the conversion on a worker.
+
+        ### Arguments
+        - job: The job to run.
+        - kwargs: Keyword arguments passed to `convert`.
+
+        ### Returns
+        - Tuple of conversion status and error dictionary.
+        """
+
+        job.started_at = time.perf_counter()
+        with self._lock:
+            self._queued -= 1
+            self._running += 1
+
+        success = False
+        try:
+            success, result = convert(
+                input_file=job.input_file,
+                output_file=job.output_file,
+                ffmpeg=self.ffmpeg,
+                **kwargs,
+            )
+        finally:
+            job.finished_at = time.perf_counter()
+            job.success = success
+            with self._lock:
+                self._running -= 1
+                self._finished += 1
+                self._failed += 0 if success else 1
+                self._wait_time += job.wait_time
+                self._run_time += job.run_time
+
+            logger.debug(
+                "Converted %s in %.2fs, waited %.2fs",
+                job.output_file.name,
+                job.run_time,
+                job.wait_time,
+            )
+
+        return success, result
+
+    @property
+    def queue_depth(self) -> int:
+        """
+        Get the number of conversions that are waiting for a worker.
+
+        ### Returns
+        - The number of queued conversions.
+        """
+
+        return self._queued
+
+    def get_stats(self) -> Dict[str, Union[int, float]]:
+        """
+        Get the statistics of the service.
+
+        ### Returns
+        - Dictionary with the number of queued, running, finished and failed
+        conversions and the average wait and run times in seconds.
+        """
+
+        with self._lock:
+            finished = self._finished or 1
+            return {
+                "queued": self._queued,
+                "running": self._running,
+                "finished": self._finished,
+                "failed": self._failed,
+                "average_wait_time": self._wait_time / finished,
+                "average_run_time": self._run_time / finished,
+            }
+
+    def shutdown(self) -> None:
+        """
+        Stop the workers, running conversions are finished first.
+        """
+
+        self.executor.shutdown(wait=True)
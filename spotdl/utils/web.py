@@ -266,7 +266,12 @@ async def websocket_endpoint(websocket: WebSocket, client_id: str):
         while True:
             await websocket.receive_json()
     except WebSocketDisconnect:
-        app_state.clients.pop(client_id, None)
+        client = app_state.clients.pop(client_id, None)
+        if client is not None:
+            # Closing waits for the running conversions, don't block the loop
+            await asyncio.get_running_loop().run_in_executor(
+                None, client.downloader.close
+            )
 
         if (
             len(app_state.clients) == 0
@@ -350,6 +355,9 @@ async def shutdown_event():
     Called when the server is shutting down.
     """
 
+    for client in list(app_state.clients.values()):
+        client.downloader.close()
+
     if (
         not app_state.web_settings["keep_sessions"]
         and not app_state.web_settings["web_use_output_dir"]
@@ -507,11 +515,13 @@ def update_settings(
     new_settings = DownloaderOptions(**settings_cpy)  # type: ignore
 
     # Re-initialize downloader
+    old_downloader = client.downloader
     client.downloader_settings = new_settings
     client.downloader = Downloader(
         new_settings,
         loop=state.loop,
     )
+    old_downloader.close()
 
     return new_settings
 
@@ -53,6 +53,8 @@ def new_initialize(
     headless=True,
     max_retries=3,
     use_cache_file=False,
+    spotify_cache_ttl=90,
+    spotify_cache_size=512,
 ):
     """This function allows calling `initialize()` multiple times"""
     try:
@@ -68,6 +70,8 @@ def new_initialize(
             headless=headless,
             max_retries=max_retries,
             use_cache_file=use_cache_file,
+            spotify_cache_ttl=spotify_cache_ttl,
+            spotify_cache_size=spotify_cache_size,
         )
 
 
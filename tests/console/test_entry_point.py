@@ -1,5 +1,6 @@
 import json
 import re
+import subprocess
 import sys
 
 import pytest
@@ -52,6 +53,57 @@ def test_show_version(capsys, monkeypatch, argument):
     assert re.match(r"\d{1,2}\.\d{1,2}\.\d{1,3}", out) is not None
 
 
+def test_startup_imports():
+    """
+    Importing the entry point shouldn't import the heavy dependencies,
+    they are only imported when they are used
+    """
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import spotdl"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    # import time: self [us] | cumulative | imported package
+    imports = {}
+    for line in result.stderr.splitlines():
+        parts = line.split("|")
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue
+
+        imports[parts[2].strip()] = int(parts[1])
+
+    assert "spotdl" in imports
+
+    for module in [
+        "yt_dlp",
+        "ytmusicapi",
+        "fastapi",
+        "uvicorn",
+        "pykakasi",
+        "syncedlyrics",
+        "mutagen",
+        "soundcloud",
+        "spotdl.download.downloader",
+        "spotdl.providers.audio.base",
+    ]:
+        assert module not in imports, f"{module} is imported on startup"
+
+
+def test_lazy_downloader_export():
+    """
+    The downloader is still importable from the package
+    """
+
+    # pylint: disable=import-outside-toplevel
+    from spotdl import Downloader
+    from spotdl.download.downloader import Downloader as DownloaderClass
+
+    assert Downloader is DownloaderClass
+
+
 def test_download_song(capsys, monkeypatch, tmpdir):
     """
     This test checks if the song is downloaded correctly
@@ -0,0 +1,287 @@
+import asyncio
+import os
+import sqlite3
+import threading
+
+import pytest
+
+from spotdl.download.downloader import Downloader
+from spotdl.download.pipeline import find_lyrics, match_albums
+from spotdl.providers.lyrics.base import LyricsProvider
+from spotdl.types.result import Result
+from spotdl.types.song import Song
+
+
+class StubProvider(LyricsProvider):
+    """
+    Lyrics provider that answers after a delay, without network access.
+    """
+
+    def __init__(self, name, lyrics=None, delay=0.0, error=None, timeout=1.0):
+        super().__init__()
+        self.stub_name = name
+        self.lyrics = lyrics
+        self.delay = delay
+        self.error = error
+        self.TIMEOUT = timeout  # pylint: disable=invalid-name
+        self.cancelled = False
+
+    @property
+    def name(self):
+        return self.stub_name
+
+    async def get_results_async(self, name, artists, **kwargs):
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+
+        if self.error is not None:
+            raise self.error
+
+        return {f"{', '.join(artists)} - {name}": "https://example.com/lyrics"}
+
+    async def extract_lyrics_async(self, url, **kwargs):
+        return self.lyrics
+
+
+def make_song():
+    return Song.from_missing_data(
+        name="Test Song",
+        artists=["Test Artist"],
+        artist="Test Artist",
+        url="https://open.spotify.com/track/lyrics",
+    )
+
+
+@pytest.fixture()
+def downloader(tmpdir, monkeypatch):
+    monkeypatch.chdir(tmpdir)
+    downloader = Downloader(
+        {
+            "ffmpeg": "/bin/true",
+            "simple_tui": True,
+            "lyrics_providers": [],
+            "archive": str(tmpdir / "archive.txt"),
+            "match_cache": str(tmpdir / "matches.db"),
+            "lyrics_cache": str(tmpdir / "lyrics.db"),
+            "slug_cache": str(tmpdir / "slugs.db"),
+        },
+        loop=asyncio.new_event_loop(),
+    )
+
+    yield downloader
+
+    downloader.close()
+    downloader.loop.close()
+
+
+def test_downloader_close(downloader):
+    downloader.close()
+
+    # Workers don't accept new jobs
+    with pytest.raises(RuntimeError):
+        downloader.lyrics_executor.submit(print)
+
+    with pytest.raises(RuntimeError):
+        downloader.transcode_service.executor.submit(print)
+
+    # Databases are closed
+    for store in [
+        downloader.match_cache,
+        downloader.lyrics_cache,
+        downloader.slug_cache,
+    ]:
+        with pytest.raises(sqlite3.ProgrammingError):
+            store.execute("SELECT 1")
+
+    # Closing again does nothing
+    downloader.close()
+
+
+def test_find_lyrics_priority(downloader):
+    downloader.lyrics_providers = [
+        StubProvider("Slow", lyrics="slow lyrics", delay=0.1),
+        StubProvider("Fast", lyrics="fast lyrics"),
+    ]
+
+    lyrics, provider = downloader.loop.run_until_complete(
+        find_lyrics(downloader, make_song())
+    )
+
+    # The first provider in the list wins, even if it answers last
+    assert (lyrics, provider) == ("slow lyrics", "Slow")
+
+
+def test_find_lyrics_cancels_slower_providers(downloader):
+    slow = StubProvider("Slow", lyrics="slow lyrics", delay=10)
+    downloader.lyrics_providers = [StubProvider("Fast", lyrics="lyrics"), slow]
+
+    lyrics, provider = downloader.loop.run_until_complete(
+        asyncio.wait_for(find_lyrics(downloader, make_song()), 1)
+    )
+
+    # Let the cancellation reach the provider
+    downloader.loop.run_until_complete(asyncio.sleep(0))
+
+    assert (lyrics, provider) == ("lyrics", "Fast")
+    assert slow.cancelled is True
+
+
+def test_find_lyrics_timeout(downloader):
+    downloader.lyrics_providers = [
+        StubProvider("Stuck", lyrics="late lyrics", delay=10, timeout=0.05),
+        StubProvider("Other", lyrics="lyrics"),
+    ]
+
+    lyrics, provider = downloader.loop.run_until_complete(
+        asyncio.wait_for(find_lyrics(downloader, make_song()), 1)
+    )
+
+    assert (lyrics, provider) == ("lyrics", "Other")
+
+
+@pytest.mark.parametrize(
+    "error, delay, timeout",
+    [(ValueError("connection reset"), 0.0, 1.0), (None, 10, 0.05)],
+)
+def test_search_lyrics_failure_not_cached(downloader, error, delay, timeout):
+    downloader.lyrics_providers = [
+        StubProvider("Broken", error=error, delay=delay, timeout=timeout),
+        StubProvider("Empty"),
+    ]
+
+    song = make_song()
+
+    assert downloader.loop.run_until_complete(find_lyrics(downloader, song)) == (
+        None,
+        "",
+    )
+
+    assert downloader.search_lyrics(song) is None
+    assert len(downloader.lyrics_cache) == 0
+
+
+def test_search_lyrics_no_lyrics_cached(downloader):
+    downloader.lyrics_providers = [StubProvider("First"), StubProvider("Second")]
+
+    song = make_song()
+
+    assert downloader.search_lyrics(song) is None
+
+    cached = downloader.lyrics_cache.get(song, ["First", "Second"])
+    assert cached is not None
+    assert cached.lyrics is None
+
+
+class AlbumProvider:
+    """
+    Audio provider that matches albums once it's released.
+    """
+
+    name = "YouTube Music"
+
+    def __init__(self):
+        self.released = threading.Event()
+        self.albums = []
+
+    def match_album(self, songs):
+        self.albums.append([song.url for song in songs])
+        self.released.wait(5)
+
+        # The last song of the album couldn't be aligned
+        return {
+            song.url: (
+                Result(
+                    source="ytmusic",
+                    url=f"https://music.youtube.com/watch?v={song.song_id}",
+                    verified=True,
+                    name=song.name,
+                    duration=100,
+                    author="Test Artist",
+                    result_id=song.song_id,
+                ),
+                90.0,
+            )
+            for song in songs[:-1]
+        }
+
+    async def find_match_async(self, song, only_verified=False):
+        return None
+
+
+class StubAudioProvider:
+    name = "YouTube"
+
+    async def find_match_async(self, song, only_verified=False):
+        return None
+
+
+def make_album_songs(count):
+    return [
+        Song.from_missing_data(
+            name=f"Song {index}",
+            artists=["Test Artist"],
+            artist="Test Artist",
+            album_id="album",
+            album_name="Test Album",
+            song_id=str(index),
+            url=f"https://open.spotify.com/track/{index}",
+        )
+        for index in range(count)
+    ]
+
+
+def test_match_albums_in_background(downloader):
+    provider = AlbumProvider()
+    downloader.audio_providers = [provider]
+
+    songs = make_album_songs(4)
+
+    # Cached songs aren't matched again
+    downloader.match_cache.set(songs[0], "https://cached", 95.0, provider.name, True)
+
+    # The albums are matched without blocking
+    match_albums(downloader, songs)
+    assert set(downloader.album_matches) == {song.url for song in songs[1:]}
+
+    provider.released.set()
+
+    assert downloader.search(songs[0]) == "https://cached"
+    assert downloader.search(songs[1]) == "https://music.youtube.com/watch?v=1"
+    assert provider.albums == [[song.url for song in songs[1:]]]
+
+    # Songs that weren't aligned are searched on their own
+    with pytest.raises(LookupError):
+        downloader.search(songs[3])
+
+
+def test_match_albums_first_provider_only(downloader):
+    provider = AlbumProvider()
+    downloader.audio_providers = [StubAudioProvider(), provider]
+
+    match_albums(downloader, make_album_songs(3))
+
+    assert not downloader.album_matches
+
+
+@pytest.mark.parametrize(
+    "settings, workers",
+    [
+        ({"threads": 3}, 3),
+        ({"threads": 3, "transcode_threads": 5}, 5),
+        ({"threads": 3, "pipeline": True}, os.cpu_count() or 1),
+    ],
+)
+def test_transcode_workers(tmpdir, monkeypatch, settings, workers):
+    monkeypatch.chdir(tmpdir)
+    downloader = Downloader(
+        {"ffmpeg": "/bin/true", "simple_tui": True, "lyrics_providers": [], **settings},
+        loop=asyncio.new_event_loop(),
+    )
+
+    assert downloader.transcode_service.workers == workers
+
+    downloader.close()
+    downloader.loop.close()
@@ -0,0 +1,175 @@
+import asyncio
+import threading
+from pathlib import Path
+
+import pytest
+
+from spotdl.download import stages
+from spotdl.download.downloader import Downloader
+from spotdl.download.pipeline import PIPELINE_STAGES, DownloadPipeline, race_providers
+from spotdl.types.result import Result
+from spotdl.types.song import Song
+
+
+def make_song(index):
+    return Song.from_missing_data(
+        name=f"Song {index}",
+        artists=["Test Artist"],
+        artist="Test Artist",
+        url=f"https://open.spotify.com/track/{index}",
+    )
+
+
+def make_result(name, verified=True):
+    return Result(
+        source=name,
+        url=f"https://example.com/{name}",
+        verified=verified,
+        name=name,
+        duration=100,
+        author="Test Artist",
+        result_id=name,
+    )
+
+
+@pytest.fixture()
+def downloader(tmpdir, monkeypatch):
+    monkeypatch.chdir(tmpdir)
+    downloader = Downloader(
+        {
+            "ffmpeg": "/bin/true",
+            "simple_tui": True,
+            "threads": 2,
+            "lyrics_providers": [],
+        },
+        loop=asyncio.new_event_loop(),
+    )
+
+    yield downloader
+
+    downloader.close()
+    downloader.loop.close()
+
+
+@pytest.fixture()
+def fake_stages(monkeypatch):
+    """
+    Replace the stages with fakes that record the order they are run in.
+    """
+
+    calls = []
+    lock = threading.Lock()
+
+    def make_stage(stage):
+        def run(downloader, job):
+            with lock:
+                calls.append((job.index, stage))
+
+            if stage == "fetch" and job.index == 1:
+                raise ValueError("fetch failed")
+
+            if stage == "finalize":
+                job.finish(Path(f"{job.index}.mp3"))
+
+        return run
+
+    async def search(downloader, job):
+        # Later songs finish their search first
+        await asyncio.sleep(0.01 * (3 - job.index))
+        make_stage("search")(downloader, job)
+
+    for stage in PIPELINE_STAGES:
+        monkeypatch.setitem(stages.STAGE_FUNCTIONS, stage, make_stage(stage))
+
+    monkeypatch.setitem(stages.ASYNC_STAGE_FUNCTIONS, "search", search)
+
+    return calls
+
+
+def test_pipeline_runs_every_stage(downloader, fake_stages):
+    songs = [make_song(index) for index in range(4)]
+
+    results = downloader.loop.run_until_complete(
+        DownloadPipeline(downloader).run(songs)
+    )
+
+    # Results keep the order of the songs
+    assert [song for song, _ in results] == songs
+    assert [path for _, path in results] == [
+        Path("0.mp3"),
+        None,
+        Path("2.mp3"),
+        Path("3.mp3"),
+    ]
+
+    # Every job goes through the stages in order,
+    # the failed job skips the stages after the failing one
+    for index in range(4):
+        job_stages = [stage for job_index, stage in fake_stages if job_index == index]
+        expected = PIPELINE_STAGES if index != 1 else PIPELINE_STAGES[:3]
+        assert job_stages == expected
+
+    assert downloader.errors == [f"{songs[1].url} - ValueError: fetch failed"]
+
+
+def test_sequential_download_runs_every_stage(downloader, fake_stages):
+    song = make_song(0)
+
+    assert downloader.search_and_download(song) == (song, Path("0.mp3"))
+    assert [stage for _, stage in fake_stages] == PIPELINE_STAGES
+
+
+def test_race_providers(downloader, monkeypatch):
+    def make_provider(name, delay, match=None, error=None):
+        async def find_match_async(song, only_verified=False):
+            await asyncio.sleep(delay)
+            if error is not None:
+                raise error
+
+            return match
+
+        provider = type("Provider", (), {})()
+        provider.name = name
+        provider.find_match_async = find_match_async
+
+        return provider
+
+    slow = make_provider("slow", 10, (make_result("slow"), 100))
+    fast = make_provider("fast", 0.01, (make_result("fast"), 95))
+    failing = make_provider("failing", 0, error=ValueError("search failed"))
+    unverified = make_provider("unverified", 0, (make_result("unverified", False), 99))
+
+    song = make_song(0)
+
+    # The first verified match wins, the slower searches are cancelled
+    monkeypatch.setattr(downloader, "audio_providers", [slow, failing, fast])
+    result, score, provider = downloader.loop.run_until_complete(
+        asyncio.wait_for(race_providers(downloader, song), 1)
+    )
+    assert (result.name, score, provider) == ("fast", 95, fast)
+
+    # Without a verified match the best score wins
+    weak = make_provider("weak", 0, (make_result("weak", False), 70))
+    monkeypatch.setattr(downloader, "audio_providers", [weak, unverified, failing])
+    result, score, provider = downloader.loop.run_until_complete(
+        race_providers(downloader, song)
+    )
+    assert (result.name, score, provider) == ("unverified", 99, unverified)
+
+    # Errors are raised if no provider found the song
+    monkeypatch.setattr(downloader, "audio_providers", [failing])
+    with pytest.raises(ValueError):
+        downloader.loop.run_until_complete(race_providers(downloader, song))
+
+
+def test_pool_download_searches_on_loop(downloader, fake_stages, monkeypatch):
+    def search(downloader, job):
+        raise AssertionError("the search doesn't run on the event loop")
+
+    monkeypatch.setitem(stages.STAGE_FUNCTIONS, "search", search)
+
+    song = make_song(0)
+    result = downloader.loop.run_until_complete(downloader.pool_download(song))
+
+    assert result == (song, Path("0.mp3"))
+    assert [stage for _, stage in fake_stages] == PIPELINE_STAGES
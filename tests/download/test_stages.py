@@ -0,0 +1,160 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from spotdl.download import stages
+from spotdl.download.downloader import Downloader
+from spotdl.download.job import DownloadJob
+from spotdl.types.song import Song
+from spotdl.utils.journal import JobJournal
+
+
+@pytest.fixture()
+def downloader(tmpdir, monkeypatch):
+    monkeypatch.chdir(tmpdir)
+    downloader = Downloader(
+        {
+            "ffmpeg": "/bin/true",
+            "simple_tui": True,
+            "lyrics_providers": [],
+            "sponsor_block": True,
+        },
+        loop=asyncio.new_event_loop(),
+    )
+
+    yield downloader
+
+    downloader.close()
+    downloader.loop.close()
+
+
+def make_job(tmpdir):
+    song = Song.from_missing_data(
+        name="Test Song",
+        artists=["Test Artist"],
+        artist="Test Artist",
+        url="https://open.spotify.com/track/test",
+    )
+
+    return DownloadJob(song=song, output_file=Path(tmpdir) / "test.mp3")
+
+
+def test_tag_song_leases_provider(downloader, tmpdir, monkeypatch):
+    leased = []
+
+    def fake_remove_sponsor_segments(job, audio_downloader):
+        # The provider is not handed out to other jobs while it's used
+        assert audio_downloader not in downloader.provider_pool._idle
+        leased.append(audio_downloader)
+
+    monkeypatch.setattr(stages, "remove_sponsor_segments", fake_remove_sponsor_segments)
+    monkeypatch.setattr(stages, "embed_metadata", lambda *args, **kwargs: None)
+
+    job = make_job(tmpdir)
+    stages.tag_song(downloader, job)
+
+    assert len(leased) == 1
+    assert downloader.provider_pool._idle == leased
+    assert not hasattr(job, "audio_downloader")
+
+
+@pytest.mark.parametrize(
+    "metadata_only, removed",
+    [(False, True), (True, False)],
+    ids=["partial", "metadata"],
+)
+def test_resume_removes_partial_output(tmpdir, monkeypatch, metadata_only, removed):
+    monkeypatch.chdir(tmpdir)
+
+    song = Song.from_missing_data(
+        name="Test Song",
+        artists=["Test Artist"],
+        artist="Test Artist",
+        url="https://open.spotify.com/track/test",
+        genres=[],
+        disc_count=1,
+        tracks_count=1,
+        track_number=1,
+        album_id="album",
+        album_artist="Test Artist",
+    )
+
+    # The interrupted run was converting the song
+    journal = JobJournal(tmpdir.join("journal.jsonl"))
+    journal.record(
+        song, "fetch", download_url="https://x/a", metadata_only=metadata_only
+    )
+    journal.close()
+
+    downloader = Downloader(
+        {
+            "ffmpeg": "/bin/true",
+            "simple_tui": True,
+            "lyrics_providers": [],
+            "resume": str(tmpdir.join("journal.jsonl")),
+            "overwrite": "skip" if not metadata_only else "metadata",
+        },
+        loop=asyncio.new_event_loop(),
+    )
+
+    output_file = Path(tmpdir) / "Test Artist - Test Song.mp3"
+    output_file.write_bytes(b"partial")
+
+    job = stages.create_job(downloader, song)
+    stages.resolve_song(downloader, job)
+
+    assert output_file.exists() is not removed
+    assert job.finished is False
+    assert job.download_url == "https://x/a"
+
+    downloader.close()
+    downloader.loop.close()
+
+
+def test_failed_stream_is_downloaded(downloader, tmpdir, monkeypatch):
+    class FakeTracker:
+        ffmpeg_progress_hook = None
+        yt_dlp_progress_hook = None
+
+        def notify_conversion_complete(self):
+            pass
+
+    class FakeProvider:
+        INFO_SOURCE = "yt-dlp"
+
+        def get_download_metadata(self, url, download=False):
+            assert download is True
+            Path(tmpdir, "video.webm").write_bytes(b"audio")
+            return {"id": "video", "ext": "webm", "url": "https://fresh"}
+
+    inputs = []
+
+    def fake_convert(input_file, output_file, **kwargs):
+        inputs.append(input_file)
+
+        # The media url expired
+        if isinstance(input_file, tuple):
+            output_file.write_bytes(b"partial")
+            return False, {"error": "403 Forbidden"}
+
+        output_file.write_bytes(b"converted")
+        return True, None
+
+    monkeypatch.setattr(stages, "get_temp_path", lambda: Path(tmpdir))
+    monkeypatch.setattr(downloader.transcode_service, "convert", fake_convert)
+    monkeypatch.setattr(downloader.provider_pool, "_create", FakeProvider)
+
+    job = make_job(tmpdir)
+    job.tracker = FakeTracker()
+    job.download_url = "https://youtube.com/watch?v=video"
+    job.stream_url = "https://expired"
+    job.download_info = {"id": "video", "ext": "webm", "url": "https://expired"}
+
+    stages.transcode_song(downloader, job)
+
+    # The stream is tried once, then the downloaded file is converted
+    assert inputs == [("https://expired", "webm"), Path(tmpdir, "video.webm")]
+    assert job.stream_url is None
+    assert job.output_file.read_bytes() == b"converted"
+    assert not Path(tmpdir, "video.webm").exists()
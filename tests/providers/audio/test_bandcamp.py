@@ -0,0 +1,71 @@
+import spotdl.providers.audio.bandcamp
+from spotdl.providers.audio.bandcamp import BandCamp
+from spotdl.types.song import Song
+
+
+class FakeTrack:
+    def __init__(self, artist_id, track_id):
+        self.track_url = f"https://artist{artist_id}.bandcamp.com/track/{track_id}"
+        self.track_title = "Nobody Else"
+        self.track_duration_seconds = 162.0
+        self.artist_title = "Abstrakt"
+        self.album_title = "Nobody Else"
+
+
+def test_bandcamp_lazy_details(monkeypatch):
+    fetched = []
+
+    def fake_track(artist_id, track_id):
+        fetched.append(track_id)
+        return FakeTrack(artist_id, track_id)
+
+    monkeypatch.setattr(
+        spotdl.providers.audio.bandcamp,
+        "search",
+        lambda _: [
+            {
+                "type": "t",
+                "id": 1,
+                "band_id": 10,
+                "name": "Nobody Else",
+                "item_url_root": "https://artist10.bandcamp.com",
+                "item_url_path": "/track/1",
+            },
+            {
+                "type": "t",
+                "id": 2,
+                "band_id": 20,
+                "name": "Something Different",
+                "item_url_path": "https://artist20.bandcamp.com/track/2",
+            },
+        ],
+    )
+    monkeypatch.setattr(spotdl.providers.audio.bandcamp, "BandCampTrack", fake_track)
+
+    song = Song.from_missing_data(
+        name="Nobody Else", artists=["Abstrakt"], artist="Abstrakt", duration=162
+    )
+
+    provider = BandCamp()
+    results = provider.get_results("Abstrakt - Nobody Else")
+
+    # The search payload is enough to build the results
+    assert [result.result_id for result in results] == ["10:1", "20:2"]
+    assert fetched == []
+
+    # Results that are never enriched still have absolute urls
+    assert [result.url for result in results] == [
+        "https://artist10.bandcamp.com/track/1",
+        "https://artist20.bandcamp.com/track/2",
+    ]
+
+    # Details are only fetched for the results that can be matched
+    candidates = provider.enrich_results(results, song)
+    assert [result.url for result in candidates] == [
+        "https://artist10.bandcamp.com/track/1"
+    ]
+    assert candidates[0].duration == 162.0
+    assert fetched == [1]
+
+    provider.enrich_results(results, song)
+    assert fetched == [1]
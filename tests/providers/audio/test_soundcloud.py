@@ -0,0 +1,80 @@
+import spotdl.providers.audio.soundcloud
+from spotdl.providers.audio.soundcloud import SoundCloud
+from spotdl.types.result import Result
+from spotdl.types.song import Song
+
+
+class FakeAlbum:
+    def __init__(self, title):
+        self.title = title
+
+
+class FakeClient:
+    def __init__(self):
+        self.album_requests = []
+
+    def get_track_albums(self, track_id):
+        self.album_requests.append(track_id)
+        if track_id == 3:
+            raise ConnectionError("soundcloud is down")
+
+        if track_id == 1:
+            yield FakeAlbum("Nobody Else")
+
+
+def make_result(track_id, name):
+    return Result(
+        source="soundcloud",
+        url=f"https://soundcloud.com/abstrakt/{track_id}",
+        verified=False,
+        name=name,
+        duration=162,
+        author="Abstrakt",
+        result_id=str(track_id),
+        artists=("Abstrakt",),
+    )
+
+
+def test_soundcloud_get_album(monkeypatch):
+    monkeypatch.setattr(
+        spotdl.providers.audio.soundcloud, "SoundCloudClient", FakeClient
+    )
+
+    provider = SoundCloud()
+
+    assert provider.get_album("1") == "Nobody Else"
+    assert provider.get_album("2") is None
+
+    # Found albums and tracks without albums are cached
+    assert provider.get_album("1") == "Nobody Else"
+    assert provider.get_album("2") is None
+    assert provider.client.album_requests == [1, 2]
+
+    # Failed lookups are not cached
+    assert provider.get_album("3") is None
+    assert provider.get_album("3") is None
+    assert provider.client.album_requests == [1, 2, 3, 3]
+
+
+def test_soundcloud_enrich_results(monkeypatch):
+    monkeypatch.setattr(
+        spotdl.providers.audio.soundcloud, "SoundCloudClient", FakeClient
+    )
+
+    song = Song.from_missing_data(
+        name="Nobody Else",
+        artists=["Abstrakt"],
+        artist="Abstrakt",
+        album_name="Nobody Else",
+        duration=162,
+    )
+
+    provider = SoundCloud()
+    candidates = provider.enrich_results(
+        [make_result(1, "Nobody Else"), make_result(2, "Something Different")], song
+    )
+
+    # Albums are only fetched for the results that can be matched
+    assert [result.result_id for result in candidates] == ["1"]
+    assert candidates[0].album == "Nobody Else"
+    assert provider.client.album_requests == [1]
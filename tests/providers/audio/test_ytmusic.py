@@ -1,6 +1,7 @@
 import pytest
 
 from spotdl.providers.audio import YouTubeMusic
+from spotdl.types.result import Result
 from spotdl.types.song import Song
 
 
@@ -49,3 +50,106 @@ def test_ytm_get_results():
     results = provider.get_results("Lost Identities Moments")
 
     assert len(results) > 3
+
+
+def test_ytm_adaptive_search(monkeypatch):
+    provider = YouTubeMusic(adaptive_search=True)
+    searches = []
+
+    def fake_get_results(search_term, **kwargs):
+        searches.append(kwargs)
+        return [
+            Result(
+                source="YouTubeMusic",
+                url="https://music.youtube.com/watch?v=test",
+                verified=True,
+                name="Nobody Else",
+                duration=162,
+                author="Abstrakt",
+                result_id="test",
+                artists=("Abstrakt",),
+                search_query=search_term,
+            )
+        ]
+
+    monkeypatch.setattr(provider, "get_results", fake_get_results)
+
+    song = Song.from_missing_data(
+        name="Nobody Else", artists=["Abstrakt"], artist="Abstrakt", duration=162
+    )
+
+    assert provider.search(song) == "https://music.youtube.com/watch?v=test"
+
+    # The first small page already contains a confident match
+    assert searches == [YouTubeMusic.ADAPTIVE_RESULTS_OPTS[0]]
+    assert provider.search_depths == {1: 1}
+
+
+def test_ytm_match_album(monkeypatch):
+    provider = YouTubeMusic()
+
+    class FakeClient:
+        def search(self, query, **kwargs):
+            assert kwargs["filter"] == "albums"
+            return [
+                {
+                    "title": "Other Album",
+                    "browseId": "MPREb_other",
+                    "artists": [{"name": "Abstrakt"}],
+                },
+                {
+                    "title": "Nobody Else",
+                    "browseId": "MPREb_album",
+                    "artists": [{"name": "Abstrakt"}],
+                },
+            ]
+
+        def get_album(self, browse_id):
+            assert browse_id == "MPREb_album"
+            return {
+                "title": "Nobody Else",
+                "artists": [{"name": "Abstrakt"}],
+                "tracks": [
+                    {
+                        "videoId": "first",
+                        "title": "Nobody Else",
+                        "artists": [{"name": "Abstrakt"}],
+                        "duration_seconds": 162,
+                        "trackNumber": 1,
+                    },
+                    {
+                        "videoId": "second",
+                        "title": "Somewhere",
+                        "artists": None,
+                        "duration_seconds": 200,
+                        "trackNumber": 2,
+                    },
+                ],
+            }
+
+    monkeypatch.setattr(provider, "client", FakeClient())
+
+    def make_song(name, track_number, duration):
+        return Song.from_missing_data(
+            name=name,
+            artists=["Abstrakt"],
+            artist="Abstrakt",
+            album_name="Nobody Else",
+            album_artist="Abstrakt",
+            track_number=track_number,
+            duration=duration,
+            url=f"https://open.spotify.com/track/{track_number}",
+        )
+
+    songs = [
+        make_song("Nobody Else", 1, 162),
+        make_song("Somewhere", 2, 201),
+        make_song("Not On YouTube Music", 3, 180),
+    ]
+
+    matches = provider.match_album(songs)
+
+    assert {url: result.url for url, (result, _) in matches.items()} == {
+        songs[0].url: "https://music.youtube.com/watch?v=first",
+        songs[1].url: "https://music.youtube.com/watch?v=second",
+    }
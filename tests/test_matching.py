@@ -2,7 +2,9 @@
 
 from spotdl.providers.audio.base import AudioProviderError
 from spotdl.providers.audio.ytmusic import YouTubeMusic
+from spotdl.types.result import Result
 from spotdl.types.song import Song
+from spotdl.utils.matching import order_results
 from spotdl.utils.spotify import SpotifyClient
 from tests.conftest import new_initialize
 
@@ -429,3 +431,167 @@ def test_ytmusic_matching(monkeypatch, query, expected, capsys):
 
     except AudioProviderError:
         pytest.skip("YouTube Music search failed")
+
+
+# name, artists, album, duration, explicit
+SCORE_SONGS = [
+    ("Piano Man", ["Billy Joel"], "Piano Man", 339, False),
+    ("Down", ["Jay Sean", "Lil Wayne"], "All or Nothing", 212, False),
+    ("One Dance", ["Drake", "Wizkid", "Kyla"], "Views", 173, False),
+    (
+        "STAY (with Justin Bieber)",
+        ["The Kid LAROI", "Justin Bieber"],
+        "F*CK LOVE 3",
+        141,
+        True,
+    ),
+    ("Piszę to na matmie", ["Mata"], "Młody Matczak", 187, True),
+    (
+        "death bed (coffee for your head)",
+        ["Powfu", "beabadoobee"],
+        "death bed",
+        173,
+        False,
+    ),
+]
+
+# name, artists, verified, album, duration offset, explicit, source, isrc search
+SCORE_RESULTS = [
+    ("{name}", ("{a0}",), True, "{album}", 0, None, "youtube-music", False),
+    ("{name}", ("{a0}",), True, "{album}", 0, None, "youtube-music", True),
+    ("{name}", ("{a0}",), True, "Greatest Hits", 2, True, "youtube-music", False),
+    ("{name}", ("{all}",), True, None, 1, False, "youtube-music", False),
+    ("{a0} - {name} (Official Video)", ("{a0} VEVO",), False, None, 25, None, "youtube", False),
+    ("{a0} - {name} (Live)", ("{a0}",), False, None, 40, None, "youtube", False),
+    ("{name} (Slowed + Reverb)", ("Lofi Channel",), False, None, 60, None, "youtube", False),
+    ("{name} remix", ("{a0}", "DJ Someone"), True, "{album}", 5, None, "youtube-music", False),
+    ("{all} - {name}", ("{a1}",), False, None, 3, None, "youtube", False),
+    ("{name}", ("Other Artist",), True, "Other Album", 0, None, "youtube-music", False),
+    ("Completely different", ("{a0}",), True, "{album}", 0, None, "youtube-music", False),
+    ("{name} {a0}", None, False, None, 8, None, "slider.kz", False),
+    ("{name}", ("{a1}", "{a0}"), True, "{album}", 15, None, "youtube-music", False),
+    ("{name} - {a0} lyrics", ("Lyrics Channel",), False, None, 1, None, "youtube", False),
+]  # fmt: skip
+
+
+def make_score_cases():
+    cases = []
+    for index, (name, artists, album, duration, explicit) in enumerate(SCORE_SONGS):
+        song = Song.from_missing_data(
+            name=name,
+            artists=artists,
+            artist=artists[0],
+            album_name=album,
+            duration=duration,
+            explicit=explicit,
+            song_id=f"song{index}",
+        )
+
+        values = {
+            "name": name,
+            "a0": artists[0],
+            "a1": artists[-1],
+            "all": ", ".join(artists),
+            "album": album,
+        }
+
+        results = [
+            Result(
+                source=source,
+                url=f"https://example.com/{index}/{result_index}",
+                verified=verified,
+                name=result_name.format(**values),
+                duration=duration + offset,
+                author=(result_artists[0] if result_artists else "{a0}").format(
+                    **values
+                ),
+                result_id=f"{index}-{result_index}",
+                isrc_search=isrc_search,
+                artists=(
+                    tuple(artist.format(**values) for artist in result_artists)
+                    if result_artists
+                    else None
+                ),
+                explicit=result_explicit,
+                album=result_album.format(**values) if result_album else None,
+            )
+            for result_index, (
+                result_name,
+                result_artists,
+                verified,
+                result_album,
+                offset,
+                result_explicit,
+                source,
+                isrc_search,
+            ) in enumerate(SCORE_RESULTS)
+        ]
+
+        cases.append((song, results))
+
+    return cases
+
+
+@pytest.mark.parametrize(
+    "search_query, expected",
+    [
+        (
+            None,
+            {
+                "0-0": 100.0,
+                "0-1": 100.0,
+                "0-2": 65.48199219935364,
+                "0-3": 100.0,
+                "0-8": 100.0,
+                "0-11": 72.46644820586107,
+                "0-13": 92.5531914893617,
+                "1-3": 98.38709677419355,
+                "1-8": 100.0,
+                "2-8": 100.0,
+                "3-0": 100.0,
+                "3-1": 100.0,
+                "3-2": 70.10320432056577,
+                "3-8": 100.0,
+                "3-11": 66.63311487252774,
+                "3-13": 91.05263157894737,
+                "4-0": 100.0,
+                "4-1": 100.0,
+                "4-2": 69.78269150005295,
+                "4-3": 100.0,
+                "4-8": 93.90243902439025,
+                "4-11": 69.41766771805621,
+                "4-13": 93.39622641509433,
+                "5-3": 89.39393939393939,
+                "5-8": 88.46153846153845,
+            },
+        ),
+        (
+            "{title} {album}",
+            {
+                "0-0": 100.0,
+                "0-1": 100.0,
+                "0-2": 65.48199219935364,
+                "0-3": 100.0,
+                "0-8": 88.77551020408163,
+                "0-11": 66.85420330790188,
+                "0-13": 87.20615661608369,
+                "1-3": 98.38709677419355,
+                "2-8": 95.0,
+            },
+        ),
+    ],
+)
+def test_order_results_scores(search_query, expected):
+    """
+    Snapshot of the match scores, scoring changes must not change them.
+    """
+
+    scores = {}
+    for song, results in make_score_cases():
+        if search_query and song.song_id not in ("song0", "song1", "song2"):
+            continue
+
+        for result, score in order_results(results, song, search_query).items():
+            scores[result.result_id] = score
+
+    assert scores == expected
@@ -257,3 +257,63 @@ def test_song_from_dict():
     )
     assert song.explicit == False
     assert song.popularity == 0
+
+
+def test_song_list_from_urls_batches(monkeypatch):
+    """
+    Tracks are requested in batches of 50, without duplicates
+    and without the tracks that are already cached.
+    """
+
+    class FakeClient:
+        def __init__(self):
+            self.track_batches = []
+            self.artist_batches = []
+
+        def _get_id(self, _, url):
+            return url.split("/")[-1]
+
+        def get_cached_track(self, track_id):
+            if track_id.startswith("cached"):
+                return make_track(track_id)
+
+            return None
+
+        def tracks(self, ids):
+            self.track_batches.append(ids)
+            return {"tracks": [make_track(track_id) for track_id in ids]}
+
+        def artists(self, ids):
+            self.artist_batches.append(ids)
+            return {"artists": [{"id": artist_id} for artist_id in ids]}
+
+        def albums(self, ids):
+            return {"albums": [{"id": album_id} for album_id in ids]}
+
+    def make_track(track_id):
+        return {
+            "id": track_id,
+            "name": track_id,
+            "duration_ms": 1000,
+            "artists": [{"id": "artist"}],
+            "album": {"id": "album"},
+        }
+
+    client = FakeClient()
+    monkeypatch.setattr("spotdl.types.song.SpotifyClient", lambda: client)
+    monkeypatch.setattr(
+        Song,
+        "from_raw_data",
+        classmethod(lambda cls, track, artist, album: track["id"]),
+    )
+
+    track_ids = [f"cached{index}" for index in range(10)]
+    track_ids += [f"track{index}" for index in range(110)]
+    urls = [f"https://open.spotify.com/track/{track_id}" for track_id in track_ids]
+
+    songs = Song.list_from_urls(urls + urls[:60])
+
+    assert songs == track_ids + track_ids[:60]
+    assert [len(batch) for batch in client.track_batches] == [50, 50, 10]
+    assert sorted(sum(client.track_batches, [])) == sorted(track_ids[10:])
+    assert client.artist_batches == [["artist"]]
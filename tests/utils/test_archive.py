@@ -1,6 +1,8 @@
+import os
+
 import pytest
 
-from spotdl.utils.archive import Archive
+from spotdl.utils.archive import Archive, ArchiveFile
 
 
 def test_load_archive(tmpdir, monkeypatch):
@@ -13,3 +15,104 @@ def test_load_archive(tmpdir, monkeypatch):
     assert len(archive2) == len(archive1)
     diff = archive2 ^ archive1
     assert len(diff) == 0
+
+
+def test_archive_file(tmpdir):
+    path = tmpdir.join("archive.txt")
+    track_url = "https://open.spotify.com/track/2Ikdgh3J5vCRmnCL3Xcrtv"
+
+    # Songs are looked up by id, the file keeps the urls
+    path.write(f"{track_url}\nhttps://music.youtube.com/watch?v=abc\n")
+
+    archive = ArchiveFile(path)
+    assert len(archive) == 2
+    assert track_url in archive
+    assert "https://open.spotify.com/intl-de/track/2Ikdgh3J5vCRmnCL3Xcrtv" in archive
+    assert path.read() == f"{track_url}\nhttps://music.youtube.com/watch?v=abc\n"
+
+    # New urls are appended right away
+    other_url = "https://open.spotify.com/track/4cOdK2wGLETKBW3PvgPWqT"
+    assert archive.add(other_url) is True
+    assert archive.add(other_url) is False
+    assert path.read().endswith(f"{other_url}\n")
+
+    # Archives shared by multiple processes see each other's entries
+    other_archive = ArchiveFile(path, compact_threshold=0)
+    assert other_url in other_archive
+
+    other_archive.add_many(["a", "b"])
+    archive.add("c")
+    archive.refresh()
+    assert "a" in archive and "b" in archive
+    assert len(archive) == 6
+
+    # Duplicate lines are removed by the compaction
+    with open(path, "a", encoding="utf-8") as archive_file:
+        archive_file.write("a\nb\nc\n" * 2)
+
+    archive.close()
+    other_archive.close()
+
+    archive = ArchiveFile(path, compact_threshold=0)
+    assert len(path.read().splitlines()) == 6
+    archive.close()
+
+
+def test_archive_file_compaction_closes_file(tmpdir, monkeypatch):
+    path = tmpdir.join("archive.txt")
+    path.write("a\n" * 3)
+
+    open_fds = set()
+    real_open, real_close, real_replace = os.open, os.close, os.replace
+
+    def fake_open(*args):
+        fd = real_open(*args)
+        open_fds.add(fd)
+        return fd
+
+    def fake_close(fd):
+        open_fds.discard(fd)
+        real_close(fd)
+
+    def fake_replace(src, dst):
+        # Open files can't be replaced on Windows
+        assert not open_fds
+        real_replace(src, dst)
+
+    monkeypatch.setattr(os, "open", fake_open)
+    monkeypatch.setattr(os, "close", fake_close)
+    monkeypatch.setattr(os, "replace", fake_replace)
+
+    archive = ArchiveFile(path, compact_threshold=0)
+    assert path.read() == "a\n"
+
+    # The file is reopened after the compaction
+    archive.add("b")
+    assert path.read() == "a\nb\n"
+
+    archive.close()
+    assert not open_fds
+
+
+def test_memory_archive_file():
+    archive = ArchiveFile()
+
+    assert archive.add("a") is True
+    assert archive.add_many(["a", "b"]) == 1
+    assert "b" in archive and len(archive) == 2
+
+    archive.refresh()
+    archive.close()
+
+
+def test_archive_file_compaction_keeps_urls(tmpdir):
+    path = tmpdir.join("archive.txt")
+    track_url = "https://open.spotify.com/track/2Ikdgh3J5vCRmnCL3Xcrtv"
+
+    # Archives written as ids are rewritten as urls, older versions read urls only
+    path.write("2Ikdgh3J5vCRmnCL3Xcrtv\n" * 2 + f"{track_url}?si=abc\n")
+
+    archive = ArchiveFile(path, compact_threshold=0)
+    assert path.read() == f"{track_url}\n"
+    assert Archive(path.read().splitlines()) == {track_url}
+    archive.close()
@@ -0,0 +1,90 @@
+import threading
+import time
+
+from spotdl.utils.cover_cache import CoverCache
+
+
+class FakeResponse:
+    ok = True
+    content = b"x" * 100
+
+
+def test_cover_cache(tmpdir, monkeypatch):
+    downloads = []
+
+    def fake_get(url, timeout=None):
+        downloads.append(url)
+        time.sleep(0.05)
+        return FakeResponse()
+
+    monkeypatch.setattr(
+        "spotdl.utils.cover_cache.get_session",
+        lambda: type("Session", (), {"get": staticmethod(fake_get)}),
+    )
+
+    cache = CoverCache(tmpdir, max_size=250, memory_entries=1)
+
+    # Concurrent requests for the same cover are downloaded once
+    threads = [threading.Thread(target=cache.get, args=("a",)) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert downloads == ["a"]
+    assert cache.get("a") == FakeResponse.content
+
+    # Covers evicted from memory are read from disk
+    cache.get("b")
+    assert cache.get("a") == FakeResponse.content
+    assert downloads == ["a", "b"]
+
+    # Least recently used covers are evicted from disk
+    cache.get("c")
+    assert len(tmpdir.listdir()) == 2
+    assert cache.read(cache.get_key("b")) is None
+
+
+def test_cover_cache_failed_download(tmpdir, monkeypatch):
+    monkeypatch.setattr(CoverCache, "download", lambda self, url: None)
+
+    cache = CoverCache(tmpdir)
+
+    assert cache.get("a") is None
+    assert cache.key_locks == {}
+
+
+def test_cover_cache_waiting_threads(tmpdir, monkeypatch):
+    release = threading.Event()
+    shared_lock = []
+
+    def fake_download(self, url):
+        # The first download fails, so the waiting thread downloads again
+        if not release.is_set():
+            release.wait()
+            return None
+
+        # The waiting thread still uses the lock that new threads get
+        shared_lock.append(self.get_key(url) in self.key_locks)
+        return FakeResponse.content
+
+    monkeypatch.setattr(CoverCache, "download", fake_download)
+
+    cache = CoverCache(tmpdir, max_size=0)
+    key = cache.get_key("a")
+
+    first = threading.Thread(target=cache.get, args=("a",))
+    second = threading.Thread(target=cache.get, args=("a",))
+    first.start()
+    while key not in cache.key_locks:
+        pass
+    second.start()
+    while cache.key_users.get(key) != 2:
+        pass
+
+    release.set()
+    first.join()
+    second.join()
+
+    assert shared_lock == [True]
+    assert cache.key_locks == {} and cache.key_users == {}
@@ -2,6 +2,7 @@
 import pathlib
 import platform
 import shutil
+import subprocess
 from pathlib import Path
 
 import pytest
@@ -143,3 +144,106 @@ def test_convert(tmpdir, monkeypatch):
         output_format="m4a",
         bitrate="320K",
     ) == (True, None)
+
+
+def test_convert_stream_arguments(tmpdir, monkeypatch):
+    """
+    Test that urls are streamed into ffmpeg with the http headers,
+    and that the progress is reported.
+    """
+
+    commands = []
+    progress = []
+
+    class RecordingProcess:
+        returncode = 0
+        stdout = [b"out_time_us=1000000\n", b"progress=end\n"]
+
+        def __init__(self, command, **_):
+            commands.append(command)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *_):
+            return False
+
+        def wait(self):
+            return 0
+
+    monkeypatch.setattr(subprocess, "Popen", RecordingProcess)
+
+    assert convert(
+        input_file=("https://example.com/audio", "webm"),
+        output_file=Path(tmpdir, "test.mp3"),
+        headers={"User-Agent": "spotdl"},
+        progress_handler=progress.append,
+        duration=4,
+    ) == (True, None)
+
+    # Progress is parsed from the -progress output
+    assert progress == [0, 25, 100]
+
+    command = commands[0]
+    input_index = command.index("-i")
+    assert command[input_index + 1] == "https://example.com/audio"
+    assert command.index("-reconnect") < input_index
+    assert command[command.index("-headers") + 1] == "User-Agent: spotdl\r\n"
+
+
+def test_get_transcode_mode():
+    """
+    Test that the audio is only re-encoded when the codec doesn't fit the output.
+    """
+
+    assert get_transcode_mode("webm", "opus", "opus") == "copy"
+    assert get_transcode_mode("webm", "opus") == "copy"
+    assert get_transcode_mode("m4a", "m4a", "mp4a.40.2") == "move"
+    assert get_transcode_mode("mp4", "m4a", "mp4a.40.2") == "copy"
+    assert get_transcode_mode("webm", "mp3", "opus") == "transcode"
+    assert get_transcode_mode("webm", "m4a", "opus") == "transcode"
+
+    # An explicit bitrate or custom arguments always re-encode
+    assert get_transcode_mode("webm", "opus", "opus", bitrate="128k") == "transcode"
+    assert get_transcode_mode("m4a", "m4a", bitrate="128k") == "transcode"
+    loudnorm = "-af loudnorm"
+    assert get_transcode_mode("webm", "opus", ffmpeg_args=loudnorm) == "transcode"
+    assert get_transcode_mode("m4a", "m4a", ffmpeg_args=loudnorm) == "transcode"
+
+
+def test_convert_copy_arguments(tmpdir, monkeypatch):
+    """
+    Test that the audio stream is only copied when nothing has to be encoded.
+    """
+
+    commands = []
+
+    class RecordingProcess:
+        returncode = 0
+        stdout = []
+
+        def __init__(self, command, **_):
+            commands.append(command)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *_):
+            return False
+
+        def wait(self):
+            return 0
+
+    monkeypatch.setattr(subprocess, "Popen", RecordingProcess)
+
+    input_file = Path(tmpdir, "test.m4a")
+    input_file.write_bytes(b"")
+
+    convert(input_file, Path(tmpdir, "copy.m4a"), output_format="m4a")
+    convert(input_file, Path(tmpdir, "bitrate.m4a"), "m4a", bitrate="128k")
+
+    assert commands[0][commands[0].index("-c:a") + 1] == "copy"
+
+    # The bitrate used to be ignored for m4a inputs
+    assert "copy" not in commands[1]
+    assert commands[1][commands[1].index("-b:a") + 1] == "128k"
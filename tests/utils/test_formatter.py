@@ -1,11 +1,20 @@
 from pathlib import Path
 
 from spotdl.types.song import Song, SongList
+from spotdl.utils import formatter
 from spotdl.utils.formatter import (
+    clear_new_slugs,
+    configure_caches,
     create_file_name,
     create_song_title,
+    get_cache_stats,
+    get_new_slugs,
     parse_duration,
+    ratio,
+    record_slugs,
     sanitize_string,
+    slugify,
+    warm_slug_cache,
 )
 
 
@@ -166,3 +175,41 @@ def test_parse_duration():
     assert parse_duration("views") == float(0.0)
     assert parse_duration([1, 2, 3]) == float(0.0)  # type: ignore
     assert parse_duration({"json": "data"}) == float(0.0)  # type: ignore
+
+
+def test_normalization_caches(monkeypatch):
+    """
+    Test the slugify and ratio caches
+    """
+
+    monkeypatch.setattr(formatter, "SLUG_WARM_CACHE", {})
+    monkeypatch.setattr(formatter, "SLUG_NEW_ENTRIES", {})
+    monkeypatch.setattr(formatter, "_RECORD_SLUGS", False)
+
+    configure_caches(slugify_size=2, ratio_size=2)
+
+    assert slugify("Test Song") == "test-song"
+    assert slugify("Test Song") == "test-song"
+    assert ratio("abc", "abd") == ratio("abc", "abd")
+
+    stats = get_cache_stats()
+    assert stats["slugify"].hits == 1
+    assert stats["slugify"].maxsize == 2
+    assert stats["ratio"].hits == 1
+
+    # Warm slugs are used instead of slugifying the string again,
+    # only the recorded song slugs are saved
+    warm_slug_cache({"Warm Song": "warm-slug"})
+    assert slugify("Warm Song") == "warm-slug"
+    assert slugify("New Song") == "new-song"
+    assert get_new_slugs() == {}
+
+    record_slugs({"Song Name": "song-name"})
+    new_slugs = get_new_slugs()
+    assert new_slugs == {"Song Name": "song-name"}
+
+    # Saved slugs are cleared
+    clear_new_slugs(new_slugs)
+    assert get_new_slugs() == {}
+
+    configure_caches()
@@ -0,0 +1,81 @@
+import asyncio
+import threading
+
+from spotdl.utils.config import GlobalConfig
+from spotdl.utils.http import (
+    SharedSession,
+    get_http_executor,
+    get_session,
+    reset_session,
+    run_blocking,
+    run_sync,
+)
+
+
+def test_shared_session(monkeypatch):
+    monkeypatch.setattr(GlobalConfig, "parameters", {})
+    reset_session()
+
+    session = get_session()
+    assert get_session() is session
+    executor = get_http_executor()
+
+    GlobalConfig.set_parameter("proxies", {"https": "http://127.0.0.1:8080"})
+    GlobalConfig.set_parameter("http_pool_size", 16)
+    reset_session()
+
+    new_session = get_session()
+    assert new_session is not session
+    assert new_session.proxies["https"] == "http://127.0.0.1:8080"
+    assert new_session.get_adapter("https://example.com")._pool_maxsize == 16
+
+    # The executor is sized like the new connection pool
+    assert get_http_executor() is not executor
+    assert get_http_executor()._max_workers == 16
+
+    monkeypatch.undo()
+    reset_session()
+
+
+def test_shared_session_after_reset(monkeypatch):
+    sessions = []
+
+    def request(self, method, url, *args, **kwargs):
+        sessions.append(self)
+        return method, url
+
+    monkeypatch.setattr("requests.Session.request", request)
+    reset_session()
+
+    shared = SharedSession()
+    assert shared.get("https://example.com") == ("GET", "https://example.com")
+
+    # The kept session sends its requests through the new shared session
+    reset_session()
+    shared.get("https://example.com")
+
+    assert sessions[0] is not sessions[1]
+    assert sessions[1] is get_session()
+
+    reset_session()
+
+
+def test_run_blocking():
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+
+    async def search():
+        return await asyncio.gather(
+            run_blocking(threading.current_thread), run_blocking(max, 1, 2)
+        )
+
+    thread, result = run_sync(search())
+
+    assert thread.name.startswith("spotdl-http")
+    assert result == 2
+
+    # The current event loop is left alone
+    assert asyncio.get_event_loop() is loop
+
+    asyncio.set_event_loop(None)
+    loop.close()
@@ -0,0 +1,171 @@
+import threading
+
+import pytest
+
+from spotdl.providers.audio.base import AudioProvider, run_parallel
+from spotdl.types.result import Result
+from spotdl.utils.info_cache import InfoCache, get_info_cache, reset_info_cache
+
+
+def test_info_cache(monkeypatch):
+    cache = InfoCache(max_entries=2, ttl=60)
+    extracted = []
+
+    def fetch(url):
+        extracted.append(url)
+        return {"id": url, "formats": []}
+
+    info = cache.get_or_fetch("a", fetch)
+    info["formats"].append("selected")
+
+    # Callers get their own copy of the info
+    assert cache.get_or_fetch("a", fetch) == {"id": "a", "formats": []}
+    assert extracted == ["a"]
+
+    # Least recently used entries are evicted
+    cache.get_or_fetch("b", fetch)
+    cache.get_or_fetch("c", fetch)
+    assert cache.get("a") is None
+    assert cache.get_stats() == {"hits": 1, "misses": 3, "entries": 2}
+
+    # Expired entries are extracted again
+    monkeypatch.setattr(cache, "ttl", -1)
+    cache.get_or_fetch("c", fetch)
+    assert extracted == ["a", "b", "c", "c"]
+
+
+def test_info_cache_sources():
+    cache = InfoCache()
+
+    cache.set("a", {"source": "yt-dlp"})
+    cache.set("a", {"source": "piped"}, source="piped")
+
+    # Info dicts of different sources don't replace each other
+    assert cache.get("a") == {"source": "yt-dlp"}
+    assert cache.get("a", "piped") == {"source": "piped"}
+    assert cache.get("b", "piped") is None
+
+    cache.remove("a", "piped")
+    assert cache.get("a", "piped") is None
+    assert cache.get("a") == {"source": "yt-dlp"}
+
+
+def test_info_cache_waiting_threads():
+    cache = InfoCache()
+    release = threading.Event()
+    shared_lock = []
+
+    def fetch(url):
+        # The first extraction fails, so the waiting thread extracts again
+        if not release.is_set():
+            release.wait()
+            return None
+
+        # The waiting thread still uses the lock that new threads get
+        shared_lock.append(("yt-dlp", url) in cache.key_locks)
+        return {"id": url}
+
+    first = threading.Thread(target=cache.get_or_fetch, args=("a", fetch))
+    second = threading.Thread(target=cache.get_or_fetch, args=("a", fetch))
+    first.start()
+    while ("yt-dlp", "a") not in cache.key_locks:
+        pass
+    second.start()
+    while cache.key_users.get(("yt-dlp", "a")) != 2:
+        pass
+
+    release.set()
+    first.join()
+    second.join()
+
+    assert shared_lock == [True]
+    assert cache.key_locks == {} and cache.key_users == {}
+
+
+def test_download_reuses_views_info():
+    reset_info_cache()
+
+    class FakeHandler:
+        def __init__(self):
+            self.extracted = []
+
+        def extract_info(self, url, download=False, process=True):
+            assert process is False
+            self.extracted.append(url)
+            return {"id": url, "view_count": 10}
+
+        def process_ie_result(self, info, download=False):
+            return {**info, "downloaded": download}
+
+    handler = FakeHandler()
+    provider = AudioProvider()
+    provider.audio_handler = handler
+    provider.create_handler = lambda: handler
+
+    assert provider.get_views("https://youtube.com/watch?v=a") == 10
+    assert provider.get_download_metadata(
+        "https://youtube.com/watch?v=a", download=True
+    ) == {"id": "https://youtube.com/watch?v=a", "view_count": 10, "downloaded": True}
+    assert provider.audio_handler.extracted == ["https://youtube.com/watch?v=a"]
+    assert get_info_cache().get_stats()["hits"] == 1
+
+    reset_info_cache()
+
+
+def test_views_use_leased_handlers():
+    reset_info_cache()
+
+    created = []
+    barrier = threading.Barrier(2, timeout=5)
+
+    class FakeHandler:
+        def __init__(self):
+            created.append(self)
+            self.active = False
+
+        def extract_info(self, url, download=False, process=True):
+            # Two lookups run at the same time, each with its own handle
+            assert not self.active
+            self.active = True
+            if url != "ccc":
+                barrier.wait()
+            self.active = False
+            return {"id": url, "view_count": len(url)}
+
+    provider = AudioProvider()
+    provider.create_handler = FakeHandler
+
+    assert run_parallel(provider.get_views, ["a", "bb"]) == [1, 2]
+    assert len(created) == 2
+    assert provider.audio_handler not in created
+
+    # Idle handles are reused
+    provider.get_views("ccc")
+    assert len(created) == 2
+
+    reset_info_cache()
+
+
+@pytest.mark.parametrize("views", [0, 100], ids=["no-views", "tied-views"])
+def test_best_result_with_tied_views(views):
+    provider = AudioProvider()
+    provider.get_views = lambda url: views
+
+    results = {
+        Result(
+            source="youtube",
+            url=f"https://youtube.com/watch?v={index}",
+            verified=False,
+            name=f"Result {index}",
+            duration=100,
+            author="Test Artist",
+            result_id=str(index),
+            views=views,
+        ): score
+        for index, score in enumerate([70.0, 75.0, 72.0])
+    }
+
+    # Views don't change the order, the best scored result is returned
+    result, score = provider.get_best_result(results)
+    assert result.url == "https://youtube.com/watch?v=1"
+    assert score == 75.0
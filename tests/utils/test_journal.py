@@ -0,0 +1,66 @@
+from spotdl.types.song import Song
+from spotdl.utils.journal import JobJournal
+
+
+def make_song(url):
+    return Song.from_missing_data(
+        name="Test Song", artists=["Test Artist"], artist="Test Artist", url=url
+    )
+
+
+def test_journal_resume(tmpdir):
+    path = tmpdir.join("journal.jsonl")
+    output_file = tmpdir.join("song.mp3")
+    output_file.write("")
+
+    finished, partial, failed = make_song("a"), make_song("b"), make_song("c")
+
+    journal = JobJournal(path)
+    journal.record(finished, "resolve")
+    journal.record(finished, "finalize", True, "https://x/a", output_file)
+    journal.record(partial, "search", download_url="https://x/b")
+    journal.record(failed, "fetch", True, "https://x/c", error="DownloaderError")
+    journal.close()
+
+    # A killed run might leave a partial line behind
+    with open(path, "a", encoding="utf-8") as journal_file:
+        journal_file.write('{"key": "d", "sta')
+
+    journal = JobJournal(path, resume=True)
+    assert len(journal) == 3
+
+    assert journal.get(finished).done is True
+    assert journal.get(finished).output_path == output_file
+    assert journal.get(partial).done is False
+    assert journal.get(partial).download_url == "https://x/b"
+    assert journal.get(failed).done is False
+    assert journal.get(make_song("d")) is None
+
+    # Songs have to be downloaded again if their file was removed
+    output_file.remove()
+    assert journal.get(finished).done is False
+    journal.close()
+
+    # Without resume the previous run is discarded
+    JobJournal(path).close()
+
+    journal = JobJournal(path, resume=True)
+    assert len(journal) == 0
+    journal.close()
+
+
+def test_journal_flush(tmpdir):
+    path = tmpdir.join("journal.jsonl")
+    song = make_song("a")
+
+    journal = JobJournal(path)
+    journal.record(song, "fetch", metadata_only=True)
+    journal.flush()
+
+    resumed = JobJournal(path, resume=True)
+    assert resumed.get(song).metadata_only is True
+    resumed.close()
+
+    # Closing twice is fine
+    journal.close()
+    journal.close()
@@ -0,0 +1,45 @@
+import os
+from pathlib import Path
+
+from spotdl.utils.library import LibraryIndex
+
+
+def test_library_index(tmpdir):
+    music = Path(tmpdir) / "music"
+    music.mkdir()
+    (music / "a.mp3").write_bytes(b"a")
+    (music / "b.mp3").write_bytes(b"b")
+
+    resolved = []
+
+    def resolve(path):
+        resolved.append(path.name)
+        return f"https://open.spotify.com/track/{path.stem}", None
+
+    index = LibraryIndex(Path(tmpdir) / "library.db")
+    known_songs = index.scan(music, "mp3", resolve)
+    assert sorted(resolved) == ["a.mp3", "b.mp3"]
+    assert known_songs["https://open.spotify.com/track/a"] == [music / "a.mp3"]
+
+    # Only changed and new files are resolved again
+    resolved.clear()
+    (music / "a.mp3").write_bytes(b"aa")
+    os.utime(music / "a.mp3", (0, 0))
+    (music / "b.mp3").unlink()
+    (music / "c.mp3").write_bytes(b"c")
+
+    known_songs = index.scan(music, "mp3", resolve)
+    assert sorted(resolved) == ["a.mp3", "c.mp3"]
+    assert sorted(known_songs) == [
+        "https://open.spotify.com/track/a",
+        "https://open.spotify.com/track/c",
+    ]
+
+    # Files written by the downloader are not resolved again
+    resolved.clear()
+    (music / "d.mp3").write_bytes(b"d")
+    index.add(music / "d.mp3", "https://open.spotify.com/track/d")
+
+    known_songs = index.scan(music, "mp3", resolve)
+    assert resolved == []
+    assert len(known_songs) == 3
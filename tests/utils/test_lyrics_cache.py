@@ -0,0 +1,53 @@
+import time
+
+from spotdl.types.song import Song
+from spotdl.utils.lyrics_cache import LyricsCache
+
+
+def make_song(song_id="id", name="Test Song"):
+    return Song.from_missing_data(
+        name=name, artists=["Test Artist"], artist="Test Artist", song_id=song_id
+    )
+
+
+def test_lyrics_cache(tmpdir):
+    cache = LyricsCache(tmpdir.join("cache.db"))
+    song = make_song()
+
+    assert cache.get(song) is None
+
+    cache.set(song, "[00:01.00] synced lyrics", "Synced")
+
+    cached = cache.get(song)
+    assert cached is not None
+    assert cached.lyrics == "[00:01.00] synced lyrics"
+    assert cached.provider == "Synced"
+    assert cached.synced is True
+
+    # Lyrics are also found by the normalized name and artists
+    assert cache.get(make_song(None, "test song")).lyrics == cached.lyrics
+
+    # Lyrics from providers that are not used are ignored
+    assert cache.get(song, ["Genius"]) is None
+
+    # Lrc files are stored separately
+    assert cache.get(song, kind="lrc") is None
+
+
+def test_lyrics_cache_negative(tmpdir, monkeypatch):
+    cache = LyricsCache(tmpdir.join("cache.db"), ttl=30, negative_ttl=1)
+    song = make_song()
+    cache.set(song, None, "Genius,MusixMatch")
+
+    cached = cache.get(song, ["Genius", "MusixMatch"])
+    assert cached is not None
+    assert cached.lyrics is None
+
+    # Songs without lyrics have to be searched for with new providers
+    assert cache.get(song, ["Genius", "AzLyrics"]) is None
+
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 2 * 86400)
+
+    assert cache.get(song) is None
+    assert len(LyricsCache(tmpdir.join("cache.db"), negative_ttl=1)) == 0
@@ -0,0 +1,67 @@
+import time
+
+from spotdl.types.song import Song
+from spotdl.utils.match_cache import MatchCache
+
+
+def make_song(song_id="id", isrc="ISRC"):
+    return Song.from_dict(
+        {
+            "name": "test",
+            "artists": ["test"],
+            "artist": "test",
+            "genres": [],
+            "disc_number": 1,
+            "disc_count": 1,
+            "album_name": "test",
+            "album_artist": "test",
+            "duration": 1,
+            "year": 2020,
+            "date": "2020-01-01",
+            "track_number": 1,
+            "tracks_count": 1,
+            "song_id": song_id,
+            "explicit": False,
+            "publisher": "test",
+            "url": f"https://open.spotify.com/track/{song_id}",
+            "isrc": isrc,
+            "cover_url": None,
+            "copyright_text": None,
+        }
+    )
+
+
+def test_match_cache(tmpdir):
+    cache = MatchCache(tmpdir.join("cache.db"))
+    song = make_song()
+
+    assert cache.get(song) is None
+
+    cache.set(song, "https://example.com/a", 90.0, "YouTubeMusic", True)
+
+    match = cache.get(song)
+    assert match is not None
+    assert match.url == "https://example.com/a"
+    assert match.score == 90.0
+    assert match.verified is True
+
+    # Matches are also found by isrc
+    assert cache.get(make_song("other", "ISRC")).url == "https://example.com/a"
+
+    # Matches from providers that are not used are ignored
+    assert cache.get(song, ["SoundCloud"]) is None
+
+    cache.close()
+    assert MatchCache(tmpdir.join("cache.db")).get(song) is not None
+
+
+def test_match_cache_ttl(tmpdir, monkeypatch):
+    cache = MatchCache(tmpdir.join("cache.db"), ttl=1)
+    song = make_song()
+    cache.set(song, "https://example.com/a", 90.0, "YouTubeMusic")
+
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 2 * 86400)
+
+    assert cache.get(song) is None
+    assert len(MatchCache(tmpdir.join("cache.db"), ttl=1)) == 0
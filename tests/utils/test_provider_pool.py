@@ -0,0 +1,41 @@
+from spotdl.utils.provider_pool import ProviderPool
+
+
+class FakeHandler:
+    def __init__(self):
+        self.hooks = []
+
+    def add_progress_hook(self, hook):
+        self.hooks.append(hook)
+
+    def report(self, progress):
+        for hook in self.hooks:
+            hook(progress)
+
+
+class FakeProvider:
+    def __init__(self):
+        self.audio_handler = FakeHandler()
+
+
+def test_provider_pool():
+    pool = ProviderPool(FakeProvider, max_size=2)
+    first_progress, second_progress = [], []
+
+    with pool.lease(first_progress.append) as first:
+        with pool.lease(second_progress.append) as second:
+            assert first is not second
+            first.audio_handler.report({"status": "downloading"})
+            second.audio_handler.report({"status": "finished"})
+
+    assert first_progress == [{"status": "downloading"}]
+    assert second_progress == [{"status": "finished"}]
+
+    # Providers are reused and the previous hook is detached
+    with pool.lease() as provider:
+        assert provider in (first, second)
+        assert len(provider.audio_handler.hooks) == 1
+        provider.audio_handler.report({"status": "downloading"})
+
+    assert len(first_progress) == 1 and len(second_progress) == 1
+    assert pool.get_stats() == {"created": 2, "idle": 2, "leases": 3}
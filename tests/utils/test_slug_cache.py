@@ -0,0 +1,19 @@
+from spotdl.utils.slug_cache import SlugCache
+
+
+def test_slug_cache(tmpdir):
+    cache = SlugCache(tmpdir.join("cache.db"), max_entries=2)
+
+    assert cache.load() == {}
+
+    cache.save({"Song": "song", "Artist": "artist"})
+    cache.save({"解憶": "kai-oku"})
+
+    assert len(cache) == 2
+    assert cache.load()["解憶"] == "kai-oku"
+
+    # Only the most recent slugs are loaded
+    assert list(cache.load(limit=1)) == ["解憶"]
+
+    cache.close()
+    assert "解憶" in SlugCache(tmpdir.join("cache.db")).load()
@@ -1,6 +1,14 @@
+from collections import OrderedDict
+from pathlib import Path
+
 import pytest
 
-from spotdl.utils.spotify import SpotifyClient, SpotifyError
+from spotdl.utils.spotify import (
+    SpotifyCache,
+    SpotifyClient,
+    SpotifyError,
+    get_cache_key,
+)
 
 
 def test_init(patch_dependencies):
@@ -37,3 +45,87 @@ def test_multiple_init():
             user_auth=False,
             no_cache=True,
         )
+
+
+def test_spotify_cache(tmpdir, monkeypatch):
+    """
+    Test the sqlite backed spotify cache and the import of the old json cache.
+    """
+
+    json_cache = tmpdir.join(".spotify_cache")
+    json_cache.write('{"tracks/a": {"id": "a"}, "tracks/b": null}')
+    monkeypatch.setattr(
+        "spotdl.utils.spotify.get_spotify_cache_path", lambda: Path(json_cache)
+    )
+
+    cache = SpotifyCache(tmpdir.join("cache.db"), max_size=None)
+    assert cache.get("tracks/a") == {"id": "a"}
+    assert cache.get("tracks/b") is None
+    assert not json_cache.exists()
+
+    cache.set("tracks/c", {"id": "c" * 100})
+
+    # Oldest responses are evicted first
+    cache.max_size = 120
+    cache.evict()
+
+    assert cache.get("tracks/a") is None
+    assert cache.get("tracks/c") == {"id": "c" * 100}
+
+
+def test_spotify_client_caches_batched_tracks(tmpdir):
+    """
+    Tracks from batch requests are cached one by one.
+    """
+
+    # Bypass the singleton, the client isn't authenticated
+    client = object.__new__(SpotifyClient)
+    client.no_cache = False
+    client.max_retries = 1
+    client.cache = OrderedDict()
+    client.cache_file = SpotifyCache(tmpdir.join("cache.db"), max_size=None)
+    client.prefix = "https://api.spotify.com/v1/"
+
+    requests = []
+
+    def internal_call(method, url, payload, params):
+        requests.append(url)
+        return {"tracks": [{"id": "a"}, None]}
+
+    client._internal_call = internal_call
+
+    assert client.tracks(["a", "b"]) == {"tracks": [{"id": "a"}, None]}
+    assert requests == ["tracks/?ids=a,b"]
+
+    # The batch isn't stored in the cache file, the track is
+    client.cache = OrderedDict()
+    assert client.get_cached(get_cache_key("tracks/?ids=a,b", market=None)) is None
+    assert client.get_cached_track("a") == {"id": "a"}
+    assert client.get_cached_track("b") is None
+
+    # The single track request uses the cached track
+    assert client.track("a") == {"id": "a"}
+    assert requests == ["tracks/?ids=a,b"]
+
+    client.cache_file.close()
+
+
+def test_spotify_client_memory_cache(monkeypatch):
+    """
+    The memory cache keeps only the most recently used responses.
+    """
+
+    monkeypatch.setattr("spotdl.utils.spotify.MEMORY_CACHE_ENTRIES", 2)
+
+    # Bypass the singleton, the client isn't authenticated
+    client = object.__new__(SpotifyClient)
+    client.cache = OrderedDict()
+    client.cache_file = None
+
+    client.set_cached("tracks/a", {"id": "a"})
+    client.set_cached("tracks/b", {"id": "b"})
+    assert client.get_cached("tracks/a") == {"id": "a"}
+
+    client.set_cached("tracks/c", {"id": "c"})
+    assert list(client.cache) == ["tracks/a", "tracks/c"]
+    assert client.get_cached("tracks/b") is None
@@ -0,0 +1,41 @@
+import threading
+from pathlib import Path
+
+import spotdl.utils.transcode
+from spotdl.utils.transcode import TranscodeService
+
+
+def test_transcode_service(monkeypatch):
+    release = threading.Event()
+
+    def fake_convert(input_file, output_file, ffmpeg, **kwargs):
+        release.wait(5)
+        return input_file.suffix == ".webm", None
+
+    monkeypatch.setattr(spotdl.utils.transcode, "convert", fake_convert)
+    monkeypatch.setattr(
+        spotdl.utils.transcode, "get_cached_ffmpeg_version", lambda *_: (4.4, 2022)
+    )
+
+    service = TranscodeService("ffmpeg", workers=1)
+    assert service.version == (4.4, 2022)
+
+    futures = [
+        service.submit(Path("a.webm"), Path("a.mp3")),
+        service.submit(Path("b.m4a"), Path("b.mp3")),
+        service.submit(Path("c.webm"), Path("c.mp3")),
+    ]
+
+    # Only one conversion runs at a time, the rest wait in the queue
+    assert service.queue_depth >= 2
+
+    release.set()
+    assert [future.result()[0] for future in futures] == [True, False, True]
+
+    stats = service.get_stats()
+    assert stats["queued"] == 0
+    assert stats["finished"] == 3
+    assert stats["failed"] == 1
+    assert stats["average_run_time"] >= 0
+
+    service.shutdown()